@@ -3,6 +3,7 @@
 
 import os
 from notion_cli import NotionClient
+from notion_cli.utils import page_title
 
 # Initialize client
 client = NotionClient()
@@ -12,16 +13,7 @@ print("🔍 Searching for pages...")
 results = client.search("meeting notes", filter_type="page", page_size=5)
 
 for page in results:
-    # Extract title
-    title = "Untitled"
-    for prop in page.get("properties", {}).values():
-        if prop.get("type") == "title":
-            title_arr = prop.get("title", [])
-            if title_arr:
-                title = title_arr[0].get("plain_text", "Untitled")
-            break
-    
-    print(f"📄 {title}")
+    print(f"📄 {page_title(page)}")
     print(f"   ID: {page['id']}")
     print(f"   URL: {page['url']}")
     print()
@@ -4,7 +4,16 @@ __version__ = "0.1.0"
 __author__ = "Nathan D'Souza"
 __email__ = "nathan@example.com"
 
-from .client import NotionClient
-from .config import Config
+__all__ = ["NotionClient", "Config", "__version__"]
 
-__all__ = ["NotionClient", "Config", "__version__"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the client (httpx, notion-client) and config (yaml) only when
+    # they are used, so `notion-cli --help` does not pay for them.
+    if name == "NotionClient":
+        from .client import NotionClient
+        return NotionClient
+    if name == "Config":
+        from .config import Config
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,126 @@
 """Main CLI interface for Notion CLI."""
 
 import click
+import importlib
+import importlib.util
+import os
 import sys
-from typing import Optional, List, Dict, Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from .client import NotionClient
 from .config import Config
-from .utils import print_output, handle_error
-from .commands import page, database, block, search, config as config_cmd
-from .interactive import interactive_mode
+from .jsonio import dumps, loads
+from .utils import cache_dir, handle_error, page_title, get_client, get_console
 from . import __version__
 
-console = Console()
+# Subcommands imported on first use, as "module:attribute"
+LAZY_SUBCOMMANDS = {
+    "page": "notion_cli.commands.page:page",
+    "database": "notion_cli.commands.database:database",
+    "block": "notion_cli.commands.block:block",
+    "search": "notion_cli.commands.search:search_cmd",
+    "config": "notion_cli.commands.config:config",
+    "interactive-mode": "notion_cli.interactive:interactive_mode",
+}
 
 
-@click.group(invoke_without_command=True)
+class LazyGroup(click.Group):
+    """Click group that only imports a subcommand's module when it is invoked."""
+    
+    def __init__(self, *args: Any, lazy_subcommands: Optional[Dict[str, str]] = None,
+                 **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+    
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+    
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List subcommands like click does, without importing the lazy ones.
+        
+        Their help text comes from :meth:`lazy_help` instead.
+        """
+        lazy_help = self.lazy_help(ctx)
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in lazy_help:
+                help_text = lazy_help[name]
+            else:
+                command = self.get_command(ctx, name)
+                if command is None or command.hidden:
+                    continue
+                help_text = [command.short_help, command.help]
+            if help_text is not None:
+                rows.append((name, help_text))
+        
+        if rows:
+            limit = formatter.width - 6 - max(len(name) for name, _ in rows)
+            with formatter.section("Commands"):
+                formatter.write_dl([
+                    (name, _short_help(short_help, long_help, limit))
+                    for name, (short_help, long_help) in rows
+                ])
+    
+    def lazy_help(self, ctx: click.Context) -> Dict[str, Optional[List[Optional[str]]]]:
+        """``[short_help, help]`` of each lazy subcommand, or None if hidden.
+        
+        Read from a cache file, which is rebuilt by importing the command
+        modules whenever the CLI version or any of those modules change.
+        """
+        modules = sorted({path.split(":")[0] for path in self.lazy_subcommands.values()})
+        fingerprint: List[Any] = [__version__, self.lazy_subcommands]
+        for module_name in modules:
+            spec = importlib.util.find_spec(module_name)
+            origin = spec.origin if spec else None
+            fingerprint.append(os.stat(origin).st_mtime_ns if origin else None)
+        
+        path = cache_dir() / "commands.json"
+        try:
+            cached = loads(path.read_bytes())
+            if cached["fingerprint"] == fingerprint:
+                return cached["commands"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        commands: Dict[str, Optional[List[Optional[str]]]] = {}
+        for name in self.lazy_subcommands:
+            command = self.get_command(ctx, name)
+            if command is None or command.hidden:
+                commands[name] = None
+            else:
+                commands[name] = [command.short_help, command.help]
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(dumps({"fingerprint": fingerprint, "commands": commands}))
+        except OSError:
+            # Help still works, it is just not cached
+            pass
+        return commands
+
+
+def _short_help(short_help: Optional[str], long_help: Optional[str], limit: int) -> str:
+    """A command's one-line help, built by click from its cached help text."""
+    return click.Command(None, short_help=short_help, help=long_help).get_short_help_str(limit)
+
+
+@lru_cache(maxsize=4)
+def _get_config(config_path: Optional[Path]) -> Config:
+    """Load the config for a path once per process.
+    
+    Interactive mode re-enters :func:`cli` for every command, so this
+    avoids re-reading and re-parsing the config file each time.
+    """
+    return Config(config_path)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, invoke_without_command=True)
 @click.option("--version", "-v", is_flag=True, help="Show version")
 @click.option("--config", "-c", type=click.Path(), help="Path to config file")
 @click.option("--debug", is_flag=True, help="Enable debug mode")
@@ -54,27 +157,14 @@ def cli(ctx: click.Context, version: bool, config: Optional[str], debug: bool):
     ctx.obj["debug"] = debug
     
     # Initialize config
-    config_path = None
-    if config:
-        from pathlib import Path
-        config_path = Path(config)
-    
-    ctx.obj["config"] = Config(config_path)
+    config_path = Path(config) if config else None
+    ctx.obj["config"] = _get_config(config_path)
     
     # If no command is provided, show help
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
 
 
-# Add command groups
-cli.add_command(page.page)
-cli.add_command(database.database)
-cli.add_command(block.block)
-cli.add_command(search.search_cmd)
-cli.add_command(config_cmd.config)
-cli.add_command(interactive_mode)
-
-
 @cli.command()
 @click.option("--filter", "-f", "filters", multiple=True, help="Filter: property=value")
 @click.option("--set", "-s", "updates", multiple=True, help="Update: property=value")
@@ -83,7 +173,6 @@ cli.add_command(interactive_mode)
 @click.pass_context
 def bulk(ctx: click.Context, filters: List[str], updates: List[str], output: Optional[str], dry_run: bool):
     """Perform bulk operations on pages."""
-    config = ctx.obj["config"]
     debug = ctx.obj.get("debug", False)
     
     if not updates:
@@ -92,7 +181,7 @@ def bulk(ctx: click.Context, filters: List[str], updates: List[str], output: Opt
     
     try:
         # Initialize client
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Parse filters
         filter_dict = {}
@@ -115,62 +204,61 @@ def bulk(ctx: click.Context, filters: List[str], updates: List[str], output: Opt
         # Search for pages matching filters
         # This is a simplified implementation - in reality, you'd need to
         # construct proper Notion filters
-        pages = client.search(filter_type="page")
-        
-        # Filter pages (simplified)
-        matching_pages = []
-        for page in pages:
-            # Check if page matches all filters
-            matches = True
-            for key, expected_value in filter_dict.items():
-                # This is simplified - real implementation would need to
-                # properly check property values
-                props = page.get("properties", {})
-                if key not in props:
-                    matches = False
-                    break
-            
-            if matches:
-                matching_pages.append(page)
+        # This is simplified - real implementation would need to
+        # properly check property values, not just their presence
+        required = frozenset(filter_dict)
         
         if dry_run:
-            click.echo(f"Would update {len(matching_pages)} pages:")
-            for page in matching_pages[:5]:  # Show first 5
-                title = "Untitled"
-                for prop in page.get("properties", {}).values():
-                    if prop.get("type") == "title":
-                        title_arr = prop.get("title", [])
-                        if title_arr:
-                            title = title_arr[0].get("plain_text", "Untitled")
-                        break
-                click.echo(f"  - {title} ({page['id']})")
+            matching_pages = [
+                page for page in client.isearch(filter_type="page")
+                if required.issubset(page.get("properties", ()))
+            ]
+            
+            # Build the whole report first and write it with a single echo
+            lines = [f"Would update {len(matching_pages)} pages:"]
+            lines.extend(
+                f"  - {page_title(page)} ({page['id']})"
+                for page in matching_pages[:5]  # Show first 5
+            )
             
             if len(matching_pages) > 5:
-                click.echo(f"  ... and {len(matching_pages) - 5} more")
+                lines.append(f"  ... and {len(matching_pages) - 5} more")
             
-            click.echo(f"\nUpdates to apply: {update_dict}")
+            lines.append(f"\nUpdates to apply: {update_dict}")
+            click.echo("\n".join(lines))
         else:
-            # Perform updates
+            # Construct property updates once; the payload is the same for
+            # every page and is never mutated, so it is shared
+            # This is simplified - real implementation would need to
+            # properly format property values based on their types
+            properties = {}
+            for key, value in update_dict.items():
+                # Simplified - assumes text properties
+                properties[key] = {
+                    "rich_text": [{
+                        "type": "text",
+                        "text": {"content": value}
+                    }]
+                }
+            
+            # Search results are filtered as they stream in, and each match
+            # is updated as soon as it arrives, concurrently with the search
+            matching_ids: List[str] = []
+            
+            async def page_updates() -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+                async for page in client.aisearch(filter_type="page"):
+                    if required.issubset(page.get("properties", ())):
+                        matching_ids.append(page["id"])
+                        yield page["id"], properties
+            
+            results = client.run_async(lambda: client.aupdate_pages(page_updates()))
+            
             updated_count = 0
-            for page in matching_pages:
-                try:
-                    # Construct property updates
-                    # This is simplified - real implementation would need to
-                    # properly format property values based on their types
-                    properties = {}
-                    for key, value in update_dict.items():
-                        # Simplified - assumes text properties
-                        properties[key] = {
-                            "rich_text": [{
-                                "type": "text",
-                                "text": {"content": value}
-                            }]
-                        }
-                    
-                    client.update_page(page["id"], properties=properties)
+            for page_id, result in zip(matching_ids, results):
+                if isinstance(result, Exception):
+                    click.echo(f"Failed to update page {page_id}: {result}")
+                else:
                     updated_count += 1
-                except Exception as e:
-                    click.echo(f"Failed to update page {page['id']}: {e}")
             
             click.echo(f"Successfully updated {updated_count} pages")
         
@@ -183,10 +271,10 @@ def main():
     try:
         cli(obj={})
     except KeyboardInterrupt:
-        console.print("\n[yellow]Interrupted by user[/yellow]")
+        get_console().print("\n[yellow]Interrupted by user[/yellow]")
         sys.exit(1)
     except Exception as e:
-        console.print(f"[red]Unexpected error: {e}[/red]")
+        get_console().print(f"[red]Unexpected error: {e}[/red]")
         sys.exit(1)
 
 
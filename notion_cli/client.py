@@ -1,22 +1,131 @@
 """Core Notion client wrapper with enhanced functionality."""
 
+import asyncio
 import os
-from typing import Dict, List, Optional, Any, Union
-from notion_client import Client
+import re
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable,
+    Iterator, List, Literal, Optional, Tuple, TypeVar, Union, cast
+)
+import httpx
+from notion_client import AsyncClient as _SDKAsyncClient, Client as _SDKClient
 from notion_client.errors import APIResponseError
 import logging
 
+from .jsonio import loads
+from .ratelimit import TokenBucket, is_retryable, retry_delay
+from .schemas import Block, Database, ListResponse, Page, User
+
+if TYPE_CHECKING:
+    from notion_client.client import BaseClient as _ClientBase
+    from .httpcache import ResponseCache
+else:
+    _ClientBase = object
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Connection pool shared by every request made through one NotionClient
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=32)
+
+# Over HTTP/2 concurrent requests are streams on a single connection, so the
+# async pool needs no more than one; HTTP/1.1 needs a connection per request
+ASYNC_POOL_LIMITS = (
+    httpx.Limits(max_keepalive_connections=1, max_connections=1)
+    if HTTP2_AVAILABLE else POOL_LIMITS
+)
+
+# Maximum number of retrieved pages/databases/users kept per NotionClient
+CACHE_SIZE = 1024
+# Seconds a cached object is trusted before it is fetched again, so long
+# interactive sessions pick up schema and page changes made elsewhere
+CACHE_TTL = 60.0
+
+# Dashed UUID, the form Notion uses for page IDs in API responses and URLs
+_UUID_RE = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+# Maximum number of children Notion accepts in one append request
+MAX_APPEND_CHILDREN = 100
+
+# Notion's documented average rate limit is 3 requests per second
+RATE_LIMIT = 3
+RATE_LIMIT_CONCURRENCY = 3
+
+# Attempts made for a mutating request that is rate limited or fails to
+# connect, or that hits a 5xx when it is safe to repeat
+MAX_ATTEMPTS = 5
+
+
+def _list_cursor(body: bytes) -> Dict[str, Any]:
+    """``has_more`` and ``next_cursor`` of a raw list response.
+    
+    Notion puts them after ``results``, so only the tail of the body from
+    the last ``"next_cursor"`` key is decoded. Bodies laid out any other
+    way are decoded in full.
+    """
+    start = body.rfind(b'"next_cursor"')
+    if start != -1:
+        try:
+            tail = loads(b"{" + body[start:])
+        except ValueError:
+            pass
+        else:
+            if isinstance(tail, dict) and "has_more" in tail:
+                return tail
+    return cast(Dict[str, Any], loads(body))
+
+
+class _FastJSONMixin(_ClientBase):
+    """Decode successful responses with :func:`notion_cli.jsonio.loads`.
+    
+    Error responses are left to the SDK so its exceptions are unchanged.
+    """
+    
+    def _parse_response(self, response: httpx.Response) -> Any:
+        if response.is_success:
+            return loads(response.content)
+        return super()._parse_response(response)
+
+
+class Client(_FastJSONMixin, _SDKClient):
+    """notion_client.Client with faster response decoding."""
+
+
+class AsyncClient(_FastJSONMixin, _SDKAsyncClient):
+    """notion_client.AsyncClient with faster response decoding."""
+
 
 class NotionClient:
     """Enhanced Notion client with convenience methods."""
     
-    def __init__(self, auth: Optional[str] = None):
+    def __init__(
+        self,
+        auth: Optional[str] = None,
+        verify: bool = False,
+        rate_limiter: Optional[TokenBucket] = None
+    ):
         """Initialize the Notion client.
         
         Args:
             auth: Notion API key. If not provided, will look for NOTION_API_KEY env var.
+            verify: Probe the API once up front instead of relying on the
+                first real request to surface authentication errors
+            rate_limiter: Token bucket to pace writes with, so several clients
+                can share one request budget. Defaults to a private bucket
+                allowing RATE_LIMIT requests per second.
         """
         self.auth = auth or os.getenv("NOTION_API_KEY")
         if not self.auth:
@@ -24,8 +133,30 @@ class NotionClient:
                 "No API key provided. Set NOTION_API_KEY environment variable or pass auth parameter."
             )
         
-        self.client = Client(auth=self.auth)
-        self._test_connection()
+        # Reuse one keep-alive pool so repeated calls skip the TCP/TLS handshake
+        self._http = httpx.Client(http2=HTTP2_AVAILABLE, limits=POOL_LIMITS)
+        self._finalizer = weakref.finalize(self, self._http.close)
+        # The SDK's own retries are off so _call/_acall are the only retry layer
+        self.client = Client(auth=self.auth, client=self._http, retry=False)
+        self._async_client: Optional[AsyncClient] = None
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._response_cache: Optional["ResponseCache"] = None
+        self._bucket = rate_limiter or TokenBucket(RATE_LIMIT)
+        if verify:
+            self._test_connection()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool and the response cache."""
+        self._finalizer()
+        if self._response_cache is not None:
+            self._response_cache.close()
+            self._response_cache = None
+    
+    def __enter__(self) -> "NotionClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
     
     def _test_connection(self) -> None:
         """Test the API connection."""
@@ -35,6 +166,316 @@ class NotionClient:
         except APIResponseError as e:
             raise ConnectionError(f"Failed to connect to Notion API: {e}")
     
+    def _call(
+        self,
+        endpoint: Callable[..., Any],
+        params: Dict[str, Any],
+        idempotent: bool = True,
+        throttle: bool = True
+    ) -> Dict[str, Any]:
+        """Make a request, retried on 429, failed connections and 5xx.
+        
+        This is the only retry layer: the SDK clients are built with
+        ``retry=False``. With ``throttle``, every attempt first waits for
+        the token bucket.
+        """
+        attempt = 1
+        while True:
+            if throttle:
+                self._bucket.acquire()
+            try:
+                return cast(Dict[str, Any], endpoint(**params))
+            except (APIResponseError, httpx.ConnectError) as e:
+                if not is_retryable(e, idempotent) or attempt == MAX_ATTEMPTS:
+                    raise
+                delay = retry_delay(e, attempt)
+                logger.info(f"Request failed ({e!r}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+            attempt += 1
+    
+    async def _acall(
+        self,
+        endpoint: Callable[..., Any],
+        params: Dict[str, Any],
+        idempotent: bool = True,
+        throttle: bool = True
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_call`."""
+        attempt = 1
+        while True:
+            if throttle:
+                await self._bucket.aacquire()
+            try:
+                return cast(Dict[str, Any], await endpoint(**params))
+            except (APIResponseError, httpx.ConnectError) as e:
+                if not is_retryable(e, idempotent) or attempt == MAX_ATTEMPTS:
+                    raise
+                delay = retry_delay(e, attempt)
+                logger.info(f"Request failed ({e!r}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            attempt += 1
+    
+    def _write(
+        self,
+        endpoint: Callable[..., Any],
+        *,
+        idempotent: bool = True,
+        **params: Any
+    ) -> Dict[str, Any]:
+        """Make a mutating request, throttled and retried on 429/5xx.
+        
+        Requests that create something pass ``idempotent=False`` and are
+        not retried on 5xx, which could otherwise create duplicates.
+        """
+        return self._call(endpoint, params, idempotent)
+    
+    async def _awrite(
+        self,
+        endpoint: Callable[..., Any],
+        *,
+        idempotent: bool = True,
+        **params: Any
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_write`."""
+        return await self._acall(endpoint, params, idempotent)
+    
+    def _read(self, endpoint: Callable[..., Any]) -> Callable[..., Dict[str, Any]]:
+        """Wrap a read-only endpoint to be retried like :meth:`_write`, unthrottled."""
+        def read(**params: Any) -> Dict[str, Any]:
+            return self._call(endpoint, params, throttle=False)
+        
+        return read
+    
+    def _aread(self, endpoint: Callable[..., Any]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        """Async variant of :meth:`_read`."""
+        async def read(**params: Any) -> Dict[str, Any]:
+            return await self._acall(endpoint, params, throttle=False)
+        
+        return read
+    
+    def _cached(
+        self,
+        kind: str,
+        object_id: str,
+        fetch: Callable[[], Any],
+        last_edited_time: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Return a retrieved object from the cache, fetching it on a miss.
+        
+        Args:
+            kind: Object type, used to namespace the cache key
+            object_id: Object ID
+            fetch: Callable performing the actual API request
+            last_edited_time: If given, a cached copy is only reused when its
+                last_edited_time matches (e.g. the value from a search result)
+        """
+        key = (kind, object_id)
+        entry = self._cache.get(key)
+        if entry is not None:
+            fetched_at, cached = entry
+            if time.monotonic() - fetched_at < CACHE_TTL and (
+                last_edited_time is None or cached.get("last_edited_time") == last_edited_time
+            ):
+                self._cache.move_to_end(key)
+                return cached
+        
+        value: Dict[str, Any] = fetch()
+        self._store(kind, object_id, value)
+        return value
+    
+    def _store(self, kind: str, object_id: str, value: Dict[str, Any]) -> None:
+        """Add an object to the cache, evicting the least recently used if full."""
+        key = (kind, object_id)
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    @property
+    def response_cache(self) -> "ResponseCache":
+        """On-disk response cache, opened on first use."""
+        if self._response_cache is None:
+            from .httpcache import ResponseCache
+            self._response_cache = ResponseCache()
+        return self._response_cache
+    
+    def _disk_cached(
+        self,
+        name: str,
+        endpoint: Callable[..., Any],
+        ttl: float
+    ) -> Callable[..., Dict[str, Any]]:
+        """Wrap a read-only endpoint to go through the on-disk cache.
+        
+        Entries are keyed by API key too, since integrations see different
+        content.
+        """
+        def cached_endpoint(**params: Any) -> Dict[str, Any]:
+            key = self.response_cache.key(self.auth, name, params)
+            response = self.response_cache.get(key, ttl)
+            if response is None:
+                response = endpoint(**params)
+                self.response_cache.set(key, response)
+            return response
+        
+        return cached_endpoint
+    
+    def _invalidate(self, kind: str, object_id: str) -> None:
+        """Drop a cached object after it has been modified."""
+        self._cache.pop((kind, object_id), None)
+    
+    @staticmethod
+    def _paginate(
+        endpoint: Callable[..., Any],
+        max_items: Optional[int] = None,
+        prefetch: bool = False,
+        **params: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every result of a paginated endpoint, one API page at a time.
+        
+        With ``max_items``, no more pages than needed are requested and
+        ``page_size`` is reduced to match. With ``prefetch``, the next page
+        is requested in a background thread while the caller consumes the
+        current one, hiding the round trip behind the caller's work.
+        """
+        if max_items is not None:
+            if max_items <= 0:
+                return
+            params["page_size"] = min(params.get("page_size", 100), max_items)
+        
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            remaining = max_items
+            response: ListResponse = endpoint(**params)
+            while True:
+                results = response["results"]
+                if remaining is not None:
+                    results = results[:remaining]
+                    remaining -= len(results)
+                
+                start_cursor = response.get("next_cursor")
+                has_more = remaining != 0 and response.get("has_more", False) and start_cursor
+                if has_more:
+                    params["start_cursor"] = start_cursor
+                    if executor is not None:
+                        next_response = executor.submit(endpoint, **params)
+                
+                yield from results
+                
+                if not has_more:
+                    return
+                response = next_response.result() if executor is not None else endpoint(**params)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    @staticmethod
+    async def _apaginate(
+        endpoint: Callable[..., Any],
+        max_items: Optional[int] = None,
+        **params: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of :meth:`_paginate`."""
+        if max_items is not None:
+            if max_items <= 0:
+                return
+            params["page_size"] = min(params.get("page_size", 100), max_items)
+        
+        remaining = max_items
+        while True:
+            response = await endpoint(**params)
+            results = response["results"]
+            if remaining is not None:
+                results = results[:remaining]
+                remaining -= len(results)
+            for result in results:
+                yield result
+            
+            start_cursor = response.get("next_cursor")
+            if remaining == 0 or not response.get("has_more", False) or not start_cursor:
+                return
+            params["start_cursor"] = start_cursor
+    
+    @property
+    def async_client(self) -> AsyncClient:
+        """Async client sharing this client's credentials, created on first use.
+        
+        Concurrent requests are multiplexed over one connection when HTTP/2
+        support is installed.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncClient(
+                auth=self.auth,
+                client=httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=ASYNC_POOL_LIMITS),
+                retry=False
+            )
+        return self._async_client
+    
+    async def aclose(self) -> None:
+        """Close the async client's connection pool, if one was opened."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    def run_async(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run an async operation to completion from synchronous code.
+        
+        The async connection pool is bound to the event loop created here,
+        so it is closed before returning.
+        
+        Args:
+            operation: Zero-argument callable returning the coroutine to run
+        """
+        async def main() -> T:
+            try:
+                return await operation()
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(main())
+    
+    @staticmethod
+    async def agather(
+        operations: Union[Iterable[Awaitable[T]], AsyncIterable[Awaitable[T]]],
+        concurrency: int = RATE_LIMIT_CONCURRENCY,
+        return_exceptions: bool = False
+    ) -> List[T]:
+        """Await operations concurrently, at most ``concurrency`` at a time.
+        
+        Each operation is started as soon as it is produced and a slot is
+        free, so an async iterable (e.g. over search results) keeps being
+        consumed while earlier operations run. Results are returned in the
+        order the operations were given, as with :func:`asyncio.gather`.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def bounded(operation: Awaitable[T]) -> T:
+            try:
+                return await operation
+            finally:
+                semaphore.release()
+        
+        tasks: "List[asyncio.Future[T]]" = []
+        
+        async def start(operation: Awaitable[T]) -> None:
+            await semaphore.acquire()
+            tasks.append(asyncio.ensure_future(bounded(operation)))
+        
+        try:
+            if isinstance(operations, AsyncIterable):
+                async for operation in operations:
+                    await start(operation)
+            else:
+                for operation in operations:
+                    await start(operation)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        return cast(List[T], results)
+    
     # ===== SEARCH METHODS =====
     
     def search(
@@ -42,8 +483,9 @@ class NotionClient:
         query: str = "",
         filter_type: Optional[str] = None,
         sort: Optional[Dict[str, str]] = None,
-        page_size: int = 100
-    ) -> List[Dict[str, Any]]:
+        page_size: int = 100,
+        max_items: Optional[int] = None
+    ) -> List[Union[Page, Database]]:
         """Search for pages and databases.
         
         Args:
@@ -51,11 +493,26 @@ class NotionClient:
             filter_type: Filter by 'page' or 'database'
             sort: Sort criteria
             page_size: Number of results per page
+            max_items: Stop after this many results
             
         Returns:
             List of search results
         """
-        params = {
+        return list(self.isearch(query, filter_type, sort, page_size, max_items))
+    
+    def isearch(
+        self,
+        query: str = "",
+        filter_type: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        page_size: int = 100,
+        max_items: Optional[int] = None
+    ) -> Iterator[Union[Page, Database]]:
+        """Lazily iterate over search results, fetching pages as needed.
+        
+        Takes the same arguments as :meth:`search`.
+        """
+        params: Dict[str, Any] = {
             "query": query,
             "page_size": page_size
         }
@@ -66,27 +523,56 @@ class NotionClient:
         if sort:
             params["sort"] = sort
         
-        results = []
-        has_more = True
-        start_cursor = None
+        return cast(
+            Iterator[Union[Page, Database]],
+            self._paginate(self._read(self.client.search), max_items, **params)
+        )
+    
+    async def asearch(
+        self,
+        query: str = "",
+        filter_type: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        page_size: int = 100
+    ) -> List[Union[Page, Database]]:
+        """Async variant of :meth:`search`."""
+        return [result async for result in self.aisearch(query, filter_type, sort, page_size)]
+    
+    async def aisearch(
+        self,
+        query: str = "",
+        filter_type: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        page_size: int = 100
+    ) -> AsyncIterator[Union[Page, Database]]:
+        """Async variant of :meth:`isearch`."""
+        params: Dict[str, Any] = {
+            "query": query,
+            "page_size": page_size
+        }
+        
+        if filter_type:
+            params["filter"] = {"property": "object", "value": filter_type}
         
-        while has_more:
-            if start_cursor:
-                params["start_cursor"] = start_cursor
-            
-            response = self.client.search(**params)
-            results.extend(response["results"])
-            
-            has_more = response.get("has_more", False)
-            start_cursor = response.get("next_cursor")
+        if sort:
+            params["sort"] = sort
         
-        return results
+        async for result in self._apaginate(self._aread(self.async_client.search), **params):
+            yield cast(Union[Page, Database], result)
     
     # ===== PAGE METHODS =====
     
-    def get_page(self, page_id: str) -> Dict[str, Any]:
-        """Retrieve a page by ID."""
-        return self.client.pages.retrieve(page_id=page_id)
+    def get_page(self, page_id: str, last_edited_time: Optional[str] = None) -> Page:
+        """Retrieve a page by ID.
+        
+        Results are cached per client; pass ``last_edited_time`` to only
+        reuse a cached copy that is still current.
+        """
+        return cast(Page, self._cached(
+            "page", page_id,
+            lambda: self._read(self.client.pages.retrieve)(page_id=page_id),
+            last_edited_time
+        ))
     
     def create_page(
         self,
@@ -94,8 +580,9 @@ class NotionClient:
         properties: Dict[str, Any],
         children: Optional[List[Dict[str, Any]]] = None,
         icon: Optional[Dict[str, Any]] = None,
-        cover: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        cover: Optional[Dict[str, Any]] = None,
+        parent_type: Optional[Literal["page", "database"]] = None
+    ) -> Page:
         """Create a new page.
         
         Args:
@@ -104,17 +591,66 @@ class NotionClient:
             children: Optional list of block children
             icon: Optional icon
             cover: Optional cover image
+            parent_type: Whether a string parent is a page or a database.
+                If omitted, dashed UUIDs are treated as pages and anything
+                else as a database.
             
         Returns:
             Created page object
         """
+        params = self._page_create_params(parent, properties, children, icon, cover, parent_type)
+        return cast(Page, self._write(self.client.pages.create, idempotent=False, **params))
+    
+    async def acreate_page(
+        self,
+        parent: Union[str, Dict[str, str]],
+        properties: Dict[str, Any],
+        children: Optional[List[Dict[str, Any]]] = None,
+        icon: Optional[Dict[str, Any]] = None,
+        cover: Optional[Dict[str, Any]] = None,
+        parent_type: Optional[Literal["page", "database"]] = None
+    ) -> Page:
+        """Async variant of :meth:`create_page`."""
+        params = self._page_create_params(parent, properties, children, icon, cover, parent_type)
+        page = await self._awrite(self.async_client.pages.create, idempotent=False, **params)
+        return cast(Page, page)
+    
+    async def acreate_pages(
+        self,
+        pages: Iterable[Dict[str, Any]],
+        concurrency: int = RATE_LIMIT_CONCURRENCY
+    ) -> List[Any]:
+        """Create many pages concurrently.
+        
+        Args:
+            pages: Keyword arguments of :meth:`acreate_page` for each page
+            concurrency: Maximum number of requests in flight at once
+        
+        Returns:
+            One entry per page, in order: the created page, or the
+            exception raised while creating it.
+        """
+        return await self.agather(
+            (self.acreate_page(**page) for page in pages),
+            concurrency=concurrency,
+            return_exceptions=True
+        )
+    
+    @staticmethod
+    def _page_create_params(
+        parent: Union[str, Dict[str, str]],
+        properties: Dict[str, Any],
+        children: Optional[List[Dict[str, Any]]],
+        icon: Optional[Dict[str, Any]],
+        cover: Optional[Dict[str, Any]],
+        parent_type: Optional[Literal["page", "database"]]
+    ) -> Dict[str, Any]:
+        """Build the keyword arguments for a page create request."""
         # Handle parent as string ID
         if isinstance(parent, str):
-            # Determine if it's a database or page ID
-            if len(parent) == 32 or "-" not in parent:
-                parent = {"database_id": parent}
-            else:
-                parent = {"page_id": parent}
+            if parent_type is None:
+                parent_type = "page" if _UUID_RE.match(parent) else "database"
+            parent = {f"{parent_type}_id": parent}
         
         params = {
             "parent": parent,
@@ -128,7 +664,7 @@ class NotionClient:
         if cover:
             params["cover"] = cover
         
-        return self.client.pages.create(**params)
+        return params
     
     def update_page(
         self,
@@ -137,8 +673,68 @@ class NotionClient:
         archived: Optional[bool] = None,
         icon: Optional[Dict[str, Any]] = None,
         cover: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> Page:
         """Update a page."""
+        params = self._page_update_params(properties, archived, icon, cover)
+        self._invalidate("page", page_id)
+        return cast(Page, self._write(self.client.pages.update, page_id=page_id, **params))
+    
+    async def aupdate_page(
+        self,
+        page_id: str,
+        properties: Optional[Dict[str, Any]] = None,
+        archived: Optional[bool] = None,
+        icon: Optional[Dict[str, Any]] = None,
+        cover: Optional[Dict[str, Any]] = None
+    ) -> Page:
+        """Async variant of :meth:`update_page`."""
+        params = self._page_update_params(properties, archived, icon, cover)
+        self._invalidate("page", page_id)
+        page = await self._awrite(self.async_client.pages.update, page_id=page_id, **params)
+        return cast(Page, page)
+    
+    async def aupdate_pages(
+        self,
+        updates: Union[
+            Iterable[Tuple[str, Dict[str, Any]]], AsyncIterable[Tuple[str, Dict[str, Any]]]
+        ],
+        concurrency: int = RATE_LIMIT_CONCURRENCY
+    ) -> List[Any]:
+        """Update the properties of many pages concurrently.
+        
+        Requests share the client's token bucket, and rate-limited or failed
+        requests are retried like every other write.
+        
+        Args:
+            updates: (page_id, properties) pairs. With an async iterable,
+                each update starts as soon as its pair arrives.
+            concurrency: Maximum number of requests in flight at once
+        
+        Returns:
+            One entry per update, in order: the updated page, or the
+            exception raised while updating it.
+        """
+        operations: Union[Iterable[Awaitable[Page]], AsyncIterable[Awaitable[Page]]]
+        if isinstance(updates, AsyncIterable):
+            operations = (
+                self.aupdate_page(page_id, properties=properties)
+                async for page_id, properties in updates
+            )
+        else:
+            operations = (
+                self.aupdate_page(page_id, properties=properties)
+                for page_id, properties in updates
+            )
+        return await self.agather(operations, concurrency=concurrency, return_exceptions=True)
+    
+    @staticmethod
+    def _page_update_params(
+        properties: Optional[Dict[str, Any]],
+        archived: Optional[bool],
+        icon: Optional[Dict[str, Any]],
+        cover: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the keyword arguments for a page update request."""
         params = {}
         
         if properties:
@@ -150,29 +746,83 @@ class NotionClient:
         if cover:
             params["cover"] = cover
         
-        return self.client.pages.update(page_id=page_id, **params)
+        return params
     
-    def delete_page(self, page_id: str) -> Dict[str, Any]:
+    def delete_page(self, page_id: str) -> Page:
         """Delete (archive) a page."""
         return self.update_page(page_id, archived=True)
     
+    async def adelete_page(self, page_id: str) -> Page:
+        """Async variant of :meth:`delete_page`."""
+        return await self.aupdate_page(page_id, archived=True)
+    
+    async def adelete_pages(
+        self,
+        page_ids: Iterable[str],
+        concurrency: int = RATE_LIMIT_CONCURRENCY
+    ) -> List[Any]:
+        """Archive many pages concurrently.
+        
+        The API has no multi-page update, so this is one request per page;
+        with HTTP/2 they are multiplexed over a single connection.
+        
+        Args:
+            page_ids: IDs of the pages to archive
+            concurrency: Maximum number of requests in flight at once
+        
+        Returns:
+            One entry per page, in order: the archived page, or the
+            exception raised while archiving it.
+        """
+        return await self.agather(
+            (self.adelete_page(page_id) for page_id in page_ids),
+            concurrency=concurrency,
+            return_exceptions=True
+        )
+    
     # ===== DATABASE METHODS =====
     
-    def list_databases(self) -> List[Dict[str, Any]]:
-        """List all accessible databases."""
-        return self.search(filter_type="database")
+    def list_databases(self) -> List[Database]:
+        """List all accessible databases.
+        
+        Search returns complete database objects, so they are also cached
+        for :meth:`get_database`.
+        """
+        databases = cast(List[Database], self.search(filter_type="database"))
+        for database in databases:
+            self._store("database", database["id"], cast(Dict[str, Any], database))
+        return databases
     
-    def get_database(self, database_id: str) -> Dict[str, Any]:
-        """Retrieve database metadata."""
-        return self.client.databases.retrieve(database_id=database_id)
+    def get_database(
+        self,
+        database_id: str,
+        last_edited_time: Optional[str] = None,
+        cache_ttl: float = 0
+    ) -> Database:
+        """Retrieve database metadata.
+        
+        Cached like :meth:`get_page`. With ``cache_ttl``, the schema is
+        also kept in the on-disk cache (see :meth:`query_database`), so
+        separate invocations can share it.
+        """
+        retrieve = self._read(self.client.databases.retrieve)
+        if cache_ttl:
+            retrieve = self._disk_cached("databases.retrieve", retrieve, cache_ttl)
+        return cast(Database, self._cached(
+            "database", database_id,
+            lambda: retrieve(database_id=database_id),
+            last_edited_time
+        ))
     
     def query_database(
         self,
         database_id: str,
         filter: Optional[Dict[str, Any]] = None,
         sorts: Optional[List[Dict[str, str]]] = None,
-        page_size: int = 100
-    ) -> List[Dict[str, Any]]:
+        page_size: int = 100,
+        cache_ttl: float = 0,
+        max_items: Optional[int] = None
+    ) -> List[Page]:
         """Query a database with optional filters and sorts.
         
         Args:
@@ -180,11 +830,35 @@ class NotionClient:
             filter: Filter criteria
             sorts: Sort criteria
             page_size: Results per page
+            cache_ttl: Reuse responses from the on-disk cache that are at
+                most this many seconds old, and cache fresh ones. Disabled
+                when 0.
+            max_items: Stop after this many results
             
         Returns:
             List of database pages
         """
-        params = {
+        return list(self.iquery_database(
+            database_id, filter, sorts, page_size, cache_ttl, max_items=max_items
+        ))
+    
+    def iquery_database(
+        self,
+        database_id: str,
+        filter: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, str]]] = None,
+        page_size: int = 100,
+        cache_ttl: float = 0,
+        max_items: Optional[int] = None,
+        prefetch: bool = False
+    ) -> Iterator[Page]:
+        """Lazily iterate over a database query, fetching pages as needed.
+        
+        Takes the same arguments as :meth:`query_database`, plus
+        ``prefetch`` to request each next page while the current one is
+        being consumed.
+        """
+        params: Dict[str, Any] = {
             "database_id": database_id,
             "page_size": page_size
         }
@@ -194,21 +868,35 @@ class NotionClient:
         if sorts:
             params["sorts"] = sorts
         
-        results = []
-        has_more = True
-        start_cursor = None
+        endpoint = self._read(self.client.databases.query)
+        if cache_ttl > 0:
+            endpoint = self._disk_cached("databases.query", endpoint, cache_ttl)
+        return cast(Iterator[Page], self._paginate(endpoint, max_items, prefetch, **params))
+    
+    async def aquery_database(
+        self,
+        database_id: str,
+        filter: Optional[Dict[str, Any]] = None,
+        sorts: Optional[List[Dict[str, str]]] = None,
+        page_size: int = 100
+    ) -> List[Page]:
+        """Async variant of :meth:`query_database`."""
+        params: Dict[str, Any] = {
+            "database_id": database_id,
+            "page_size": page_size
+        }
         
-        while has_more:
-            if start_cursor:
-                params["start_cursor"] = start_cursor
-            
-            response = self.client.databases.query(**params)
-            results.extend(response["results"])
-            
-            has_more = response.get("has_more", False)
-            start_cursor = response.get("next_cursor")
+        if filter:
+            params["filter"] = filter
+        if sorts:
+            params["sorts"] = sorts
         
-        return results
+        return [
+            cast(Page, result)
+            async for result in self._apaginate(
+                self._aread(self.async_client.databases.query), **params
+            )
+        ]
     
     def create_database(
         self,
@@ -216,7 +904,7 @@ class NotionClient:
         title: str,
         properties: Dict[str, Any],
         is_inline: bool = False
-    ) -> Dict[str, Any]:
+    ) -> Database:
         """Create a new database.
         
         Args:
@@ -236,12 +924,14 @@ class NotionClient:
             "text": {"content": title}
         }]
         
-        return self.client.databases.create(
+        return cast(Database, self._write(
+            self.client.databases.create,
+            idempotent=False,
             parent=parent,
             title=title_content,
             properties=properties,
             is_inline=is_inline
-        )
+        ))
     
     def update_database(
         self,
@@ -249,9 +939,9 @@ class NotionClient:
         title: Optional[str] = None,
         properties: Optional[Dict[str, Any]] = None,
         archived: Optional[bool] = None
-    ) -> Dict[str, Any]:
+    ) -> Database:
         """Update a database."""
-        params = {}
+        params: Dict[str, Any] = {}
         
         if title:
             params["title"] = [{
@@ -263,105 +953,176 @@ class NotionClient:
         if archived is not None:
             params["archived"] = archived
         
-        return self.client.databases.update(database_id=database_id, **params)
+        self._invalidate("database", database_id)
+        database = self._write(self.client.databases.update, database_id=database_id, **params)
+        return cast(Database, database)
     
     # ===== BLOCK METHODS =====
     
     def get_block_children(
+        self,
+        block_id: str,
+        page_size: int = 100,
+        max_items: Optional[int] = None
+    ) -> List[Block]:
+        """Get children of a block, stopping after ``max_items`` if given."""
+        return list(self.iget_block_children(block_id, page_size, max_items))
+    
+    def iget_block_children(
+        self,
+        block_id: str,
+        page_size: int = 100,
+        max_items: Optional[int] = None
+    ) -> Iterator[Block]:
+        """Lazily iterate over the children of a block."""
+        return cast(Iterator[Block], self._paginate(
+            self._read(self.client.blocks.children.list),
+            max_items,
+            block_id=block_id,
+            page_size=page_size
+        ))
+    
+    def iget_block_children_raw(
         self,
         block_id: str,
         page_size: int = 100
-    ) -> List[Dict[str, Any]]:
-        """Get children of a block."""
-        results = []
-        has_more = True
-        start_cursor = None
-        
-        while has_more:
-            params = {"block_id": block_id, "page_size": page_size}
-            if start_cursor:
-                params["start_cursor"] = start_cursor
-            
-            response = self.client.blocks.children.list(**params)
-            results.extend(response["results"])
-            
-            has_more = response.get("has_more", False)
-            start_cursor = response.get("next_cursor")
+    ) -> Iterator[bytes]:
+        """Yield the undecoded JSON body of each page of a block's children.
+        
+        Bodies are passed through as received; only the pagination cursor
+        is read from them. Requests are retried like every other read.
+        """
+        def fetch(**params: Any) -> Dict[str, Any]:
+            response = self._http.get(f"blocks/{block_id}/children", params=params)
+            if not response.is_success:
+                # Let the SDK raise its usual APIResponseError
+                self.client._parse_response(response)
+            return {"content": response.content}
         
-        return results
+        params: Dict[str, Any] = {"page_size": page_size}
+        while True:
+            content = self._read(fetch)(**params)["content"]
+            yield content
+            
+            cursor = _list_cursor(content)
+            start_cursor = cursor.get("next_cursor")
+            if not cursor.get("has_more", False) or not start_cursor:
+                return
+            params["start_cursor"] = start_cursor
+    
+    async def aget_block_children(
+        self,
+        block_id: str,
+        page_size: int = 100,
+        max_items: Optional[int] = None
+    ) -> List[Block]:
+        """Async variant of :meth:`get_block_children`."""
+        return [
+            cast(Block, result)
+            async for result in self._apaginate(
+                self._aread(self.async_client.blocks.children.list),
+                max_items,
+                block_id=block_id,
+                page_size=page_size
+            )
+        ]
     
     def append_blocks(
         self,
         block_id: str,
         children: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Append blocks to a parent block."""
-        return self.client.blocks.children.append(
-            block_id=block_id,
-            children=children
-        )
+        """Append blocks to a parent block.
+        
+        More than ``MAX_APPEND_CHILDREN`` children are sent in consecutive
+        requests, in order; the results of every request are merged into
+        the returned list.
+        """
+        response: Dict[str, Any] = {}
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(children), MAX_APPEND_CHILDREN):
+            response = self._write(
+                self.client.blocks.children.append,
+                idempotent=False,
+                block_id=block_id,
+                children=children[start:start + MAX_APPEND_CHILDREN]
+            )
+            results.extend(response.get("results", []))
+        return {**response, "results": results}
     
-    def update_block(
+    async def aappend_blocks(
         self,
         block_id: str,
-        **kwargs
+        children: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
+        """Async variant of :meth:`append_blocks`."""
+        response: Dict[str, Any] = {}
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(children), MAX_APPEND_CHILDREN):
+            response = await self._awrite(
+                self.async_client.blocks.children.append,
+                idempotent=False,
+                block_id=block_id,
+                children=children[start:start + MAX_APPEND_CHILDREN]
+            )
+            results.extend(response.get("results", []))
+        return {**response, "results": results}
+    
+    def update_block(
+        self,
+        block_id: str,
+        **kwargs: Any
+    ) -> Block:
         """Update a block."""
-        return self.client.blocks.update(block_id=block_id, **kwargs)
+        return cast(Block, self._write(self.client.blocks.update, block_id=block_id, **kwargs))
+    
+    async def aupdate_block(
+        self,
+        block_id: str,
+        **kwargs: Any
+    ) -> Block:
+        """Async variant of :meth:`update_block`."""
+        block = await self._awrite(self.async_client.blocks.update, block_id=block_id, **kwargs)
+        return cast(Block, block)
     
-    def delete_block(self, block_id: str) -> Dict[str, Any]:
+    def delete_block(self, block_id: str) -> Block:
         """Delete a block."""
-        return self.client.blocks.delete(block_id=block_id)
+        return cast(Block, self._write(self.client.blocks.delete, block_id=block_id))
+    
+    async def adelete_block(self, block_id: str) -> Block:
+        """Async variant of :meth:`delete_block`."""
+        return cast(Block, await self._awrite(self.async_client.blocks.delete, block_id=block_id))
     
     # ===== USERS METHODS =====
     
-    def get_user(self, user_id: str) -> Dict[str, Any]:
-        """Get user information."""
-        return self.client.users.retrieve(user_id=user_id)
+    def get_user(self, user_id: str) -> User:
+        """Get user information (cached per client)."""
+        return cast(User, self._cached(
+            "user", user_id,
+            lambda: self._read(self.client.users.retrieve)(user_id=user_id)
+        ))
     
-    def list_users(self) -> List[Dict[str, Any]]:
+    def list_users(self) -> List[User]:
         """List all users in the workspace."""
-        results = []
-        has_more = True
-        start_cursor = None
-        
-        while has_more:
-            params = {}
-            if start_cursor:
-                params["start_cursor"] = start_cursor
-            
-            response = self.client.users.list(**params)
-            results.extend(response["results"])
-            
-            has_more = response.get("has_more", False)
-            start_cursor = response.get("next_cursor")
-        
-        return results
+        return list(self.ilist_users())
     
-    def get_self(self) -> Dict[str, Any]:
+    def ilist_users(self) -> Iterator[User]:
+        """Lazily iterate over the users in the workspace."""
+        return cast(Iterator[User], self._paginate(self._read(self.client.users.list)))
+    
+    def get_self(self) -> User:
         """Get information about the bot user."""
-        return self.client.users.me()
+        return cast(User, self._read(self.client.users.me)())
     
     # ===== COMMENTS METHODS =====
     
     def get_comments(self, block_id: str) -> List[Dict[str, Any]]:
         """Get comments on a block."""
-        results = []
-        has_more = True
-        start_cursor = None
-        
-        while has_more:
-            params = {"block_id": block_id}
-            if start_cursor:
-                params["start_cursor"] = start_cursor
-            
-            response = self.client.comments.list(**params)
-            results.extend(response["results"])
-            
-            has_more = response.get("has_more", False)
-            start_cursor = response.get("next_cursor")
-        
-        return results
+        return list(self.iget_comments(block_id))
+    
+    def iget_comments(self, block_id: str) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over the comments on a block."""
+        return self._paginate(self._read(self.client.comments.list), block_id=block_id)
     
     def create_comment(
         self,
@@ -372,7 +1133,9 @@ class NotionClient:
         if isinstance(parent, str):
             parent = {"page_id": parent}
         
-        return self.client.comments.create(
+        return self._write(
+            self.client.comments.create,
+            idempotent=False,
             parent=parent,
             rich_text=rich_text
         )
\ No newline at end of file
@@ -1,5 +1,6 @@
-"""Command modules for Notion CLI."""
+"""Command modules for Notion CLI.
 
-from . import page, database, block, search, config
+Submodules are imported on demand by the CLI's lazy command group.
+"""
 
-__all__ = ["page", "database", "block", "search", "config"]
\ No newline at end of file
+__all__ = ["page", "database", "block", "search", "config"]
@@ -1,10 +1,114 @@
 """Block-related commands."""
 
 import click
-from typing import Optional, List, Dict, Any
+import re
+import sys
+from typing import IO, Callable, Optional, List, Dict, Any
 
-from ..client import NotionClient
-from ..utils import print_output, handle_error
+from ..jsonio import loads
+from ..utils import print_output, handle_error, get_client
+
+# Todo item with an optional "[x]", "[X]" or "[ ]" checkbox prefix
+_TODO_RE = re.compile(r"^\[([xX ])\]\s*(.*?)\s*$", re.DOTALL)
+
+
+def _rich_text(content: str) -> List[Dict[str, Any]]:
+    """Rich text array holding a single plain text fragment."""
+    return [{"type": "text", "text": {"content": content}}]
+
+
+def _text_block(block_type: str, content: str, **extra: Any) -> Dict[str, Any]:
+    """Block of a rich-text based type (paragraph, heading, list item, ...)."""
+    return {
+        "object": "block",
+        "type": block_type,
+        block_type: {"rich_text": _rich_text(content), **extra}
+    }
+
+
+def _para_block(text: str) -> Dict[str, Any]:
+    return _text_block("paragraph", text)
+
+
+def _heading_block(level: int, text: str) -> Dict[str, Any]:
+    return _text_block(f"heading_{level}", text)
+
+
+def _bullet_block(text: str) -> Dict[str, Any]:
+    return _text_block("bulleted_list_item", text)
+
+
+def _number_block(text: str) -> Dict[str, Any]:
+    return _text_block("numbered_list_item", text)
+
+
+def _todo_block(text: str, checked: bool = False) -> Dict[str, Any]:
+    return _text_block("to_do", text, checked=checked)
+
+
+def _todo_item_block(item: str) -> Dict[str, Any]:
+    """To-do block from an item with an optional "[x]"/"[ ]" prefix."""
+    match = _TODO_RE.match(item)
+    checked = bool(match) and match.group(1) in "xX"
+    return _todo_block(match.group(2) if match else item, checked)
+
+
+def _code_block(code: str, language: str = "plain text") -> Dict[str, Any]:
+    return _text_block("code", code, language=language)
+
+
+def _quote_block(text: str) -> Dict[str, Any]:
+    return _text_block("quote", text)
+
+
+def _divider_block() -> Dict[str, Any]:
+    return {"object": "block", "type": "divider", "divider": {}}
+
+
+def _heading_spec_block(spec: str) -> Dict[str, Any]:
+    """Heading block from "level:text", e.g. "1:Title"."""
+    level, sep, heading_text = spec.partition(":")
+    if not sep:
+        raise click.UsageError("Heading format should be level:text (e.g., 1:Title)")
+    try:
+        heading_level = int(level.strip())
+    except ValueError:
+        heading_level = 0
+    if heading_level not in (1, 2, 3):
+        raise click.UsageError("Heading level must be 1, 2, or 3")
+    return _heading_block(heading_level, heading_text)
+
+
+def _code_spec_block(spec: str) -> Dict[str, Any]:
+    """Code block from "language:code", or plain text code without a colon."""
+    language, sep, code_text = spec.partition(":")
+    if not sep:
+        return _code_block(spec)
+    return _code_block(code_text, language)
+
+
+# Block builders keyed by the type names used in "type:content" specs
+BUILDERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "text": _para_block,
+    "heading": _heading_spec_block,
+    "bullet": _bullet_block,
+    "number": _number_block,
+    "todo": _todo_item_block,
+    "code": _code_spec_block,
+    "quote": _quote_block,
+    "divider": lambda _: _divider_block(),
+}
+
+
+def _block_from_spec(spec: str) -> Dict[str, Any]:
+    """Build a block from a "type:content" spec, e.g. "bullet:Buy milk"."""
+    block_type, _, content = spec.partition(":")
+    builder = BUILDERS.get(block_type)
+    if builder is None:
+        raise click.UsageError(
+            f"Unknown block type '{block_type}'. Choose from: {', '.join(BUILDERS)}"
+        )
+    return builder(content)
 
 
 @click.group()
@@ -14,19 +118,46 @@ def block():
 
 
 @block.command()
-@click.argument("block_id")
+@click.argument("block_ids", nargs=-1, required=True)
 @click.option("--limit", "-l", type=int, help="Maximum results")
 @click.option("--output", "-o", default=None, help="Output format")
+@click.option("--raw", is_flag=True, help="Write the API's JSON responses unmodified, one per line")
 @click.pass_context
-def children(ctx: click.Context, block_id: str, limit: Optional[int], output: Optional[str]):
-    """Get children blocks of a page or block."""
+def children(ctx: click.Context, block_ids: tuple, limit: Optional[int], output: Optional[str],
+             raw: bool):
+    """Get children blocks of one or more pages or blocks.
+    
+    Several IDs are fetched concurrently; their children are listed in the
+    order the IDs were given.
+    """
     config = ctx.obj["config"]
     debug = ctx.obj.get("debug", False)
     output_format = output or config.output_format
     
+    if raw and limit:
+        raise click.UsageError("--raw cannot be combined with --limit")
+    
     try:
-        client = NotionClient(config.api_key)
-        blocks = client.get_block_children(block_id)
+        client = get_client(ctx)
+        
+        if raw:
+            # Pass response bodies straight through, skipping decode/re-encode
+            out = sys.stdout.buffer
+            for block_id in block_ids:
+                for body in client.iget_block_children_raw(block_id):
+                    out.write(body)
+                    out.write(b"\n")
+            out.flush()
+            return
+        
+        # Each block needs at most `limit` children, so stop paginating there
+        if len(block_ids) == 1:
+            blocks = client.get_block_children(block_ids[0], max_items=limit)
+        else:
+            children_lists = client.run_async(lambda: client.agather(
+                client.aget_block_children(block_id, max_items=limit) for block_id in block_ids
+            ))
+            blocks = [child for children_list in children_lists for child in children_list]
         
         if limit:
             blocks = blocks[:limit]
@@ -47,12 +178,16 @@ def children(ctx: click.Context, block_id: str, limit: Optional[int], output: Op
 @click.option("--code", "-c", help="Add code block (format: language:code)")
 @click.option("--quote", "-q", help="Add quote block")
 @click.option("--divider", is_flag=True, help="Add divider")
+@click.option("--block", "-B", "block_specs", multiple=True,
+              help="Add block of any type (format: type:content, e.g., bullet:Item)")
+@click.option("--stdin-json", is_flag=True,
+              help="Also append a JSON array of block objects read from stdin")
 @click.option("--output", "-o", default=None, help="Output format")
 @click.pass_context
 def append(ctx: click.Context, block_id: str, text: Optional[str],
            heading: Optional[str], bullet: tuple, number: tuple,
            todo: tuple, code: Optional[str], quote: Optional[str],
-           divider: bool, output: Optional[str]):
+           divider: bool, block_specs: tuple, stdin_json: bool, output: Optional[str]):
     """Append blocks to a page or block.
     
     Examples:
@@ -68,149 +203,58 @@ def append(ctx: click.Context, block_id: str, text: Optional[str],
         --text "Some content" \\
         --bullet "First item" \\
         --bullet "Second item"
+    
+    \b
+    # Mix block types in the order given
+    notion-cli block append <id> -B "heading:2:Notes" -B "todo:[ ] Review" -B "divider:"
+    
+    \b
+    # Append pre-built blocks in one request
+    generate-blocks | notion-cli block append <id> --stdin-json
     """
     config = ctx.obj["config"]
     debug = ctx.obj.get("debug", False)
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Build children blocks
         children = []
         
-        # Add text paragraph
+        # Add text paragraph and heading
         if text:
-            children.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": text}
-                    }]
-                }
-            })
-        
-        # Add heading
+            children.append(_para_block(text))
         if heading:
-            if ":" not in heading:
-                click.echo("Error: Heading format should be level:text (e.g., 1:Title)")
-                ctx.exit(1)
-            level, heading_text = heading.split(":", 1)
-            try:
-                level_int = int(level)
-                if level_int not in [1, 2, 3]:
-                    click.echo("Error: Heading level must be 1, 2, or 3")
-                    ctx.exit(1)
-            except ValueError:
-                click.echo("Error: Invalid heading level")
-                ctx.exit(1)
-            
-            children.append({
-                "object": "block",
-                "type": f"heading_{level_int}",
-                f"heading_{level_int}": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": heading_text}
-                    }]
-                }
-            })
-        
-        # Add bullet list items
-        for item in bullet:
-            children.append({
-                "object": "block",
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": item}
-                    }]
-                }
-            })
-        
-        # Add numbered list items
-        for item in number:
-            children.append({
-                "object": "block",
-                "type": "numbered_list_item",
-                "numbered_list_item": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": item}
-                    }]
-                }
-            })
+            children.append(_heading_spec_block(heading))
         
-        # Add todo items
-        for item in todo:
-            # Check if item starts with [x] or [ ]
-            checked = False
-            todo_text = item
-            if item.startswith("[x]") or item.startswith("[X]"):
-                checked = True
-                todo_text = item[3:].strip()
-            elif item.startswith("[ ]"):
-                todo_text = item[3:].strip()
-            
-            children.append({
-                "object": "block",
-                "type": "to_do",
-                "to_do": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": todo_text}
-                    }],
-                    "checked": checked
-                }
-            })
+        # Add list and todo items
+        children.extend(map(_bullet_block, bullet))
+        children.extend(map(_number_block, number))
+        children.extend(map(_todo_item_block, todo))
         
-        # Add code block
+        # Add code block, quote and divider
         if code:
-            if ":" in code:
-                language, code_text = code.split(":", 1)
-            else:
-                language = "plain text"
-                code_text = code
-            
-            children.append({
-                "object": "block",
-                "type": "code",
-                "code": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": code_text}
-                    }],
-                    "language": language
-                }
-            })
-        
-        # Add quote
+            children.append(_code_spec_block(code))
         if quote:
-            children.append({
-                "object": "block",
-                "type": "quote",
-                "quote": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": quote}
-                    }]
-                }
-            })
-        
-        # Add divider
+            children.append(_quote_block(quote))
         if divider:
-            children.append({
-                "object": "block",
-                "type": "divider",
-                "divider": {}
-            })
+            children.append(_divider_block())
+        
+        # Add generic type:content blocks, in the order given
+        children.extend(map(_block_from_spec, block_specs))
+        
+        # Add pre-built blocks from stdin
+        if stdin_json:
+            stdin_blocks = loads(sys.stdin.buffer.read())
+            if not isinstance(stdin_blocks, list) or not all(
+                isinstance(child, dict) for child in stdin_blocks
+            ):
+                raise click.UsageError("--stdin-json expects a JSON array of block objects")
+            children.extend(stdin_blocks)
         
         if not children:
-            click.echo("Error: No content specified")
-            ctx.exit(1)
+            raise click.UsageError("No content specified")
         
         # Append blocks
         result = client.append_blocks(block_id, children)
@@ -220,6 +264,65 @@ def append(ctx: click.Context, block_id: str, text: Optional[str],
         handle_error(e, debug)
 
 
+@block.command("append-many")
+@click.argument("block_id")
+@click.option("--file", "-f", "ndjson_file", type=click.File("rb"), default="-",
+              help="NDJSON file of block objects (default: stdin)")
+@click.pass_context
+def append_many(ctx: click.Context, block_id: str, ndjson_file: IO[bytes]):
+    """Append blocks read as NDJSON, one block object per line.
+    
+    A line may also be a JSON string in the "type:content" form accepted by
+    `append --block`. An object line may carry a "parent_id" key to append
+    that block somewhere other than BLOCK_ID. Blocks for the same parent are
+    appended in order; different parents are written concurrently.
+    
+    Examples:
+    
+    \b
+    # Import a generated document
+    notion-cli block append-many <id> --file blocks.ndjson
+    """
+    debug = ctx.obj.get("debug", False)
+    
+    try:
+        # Group blocks by parent, keeping their order within each parent
+        by_parent: Dict[str, List[Dict[str, Any]]] = {}
+        for line_number, line in enumerate(ndjson_file, 1):
+            if not line.strip():
+                continue
+            child = loads(line)
+            if isinstance(child, str):
+                child = _block_from_spec(child)
+            elif not isinstance(child, dict):
+                raise click.UsageError(
+                    f"Line {line_number}: expected a block object or a \"type:content\" string"
+                )
+            parent_id = child.pop("parent_id", block_id)
+            by_parent.setdefault(parent_id, []).append(child)
+        
+        if not by_parent:
+            raise click.UsageError("No blocks to append")
+        
+        client = get_client(ctx)
+        results = client.run_async(lambda: client.agather(
+            (client.aappend_blocks(parent_id, blocks) for parent_id, blocks in by_parent.items()),
+            return_exceptions=True
+        ))
+        
+        appended_count = 0
+        for (parent_id, blocks), result in zip(by_parent.items(), results):
+            if isinstance(result, Exception):
+                click.echo(f"Failed to append {len(blocks)} blocks to {parent_id}: {result}")
+            else:
+                appended_count += len(blocks)
+        
+        click.echo(f"Appended {appended_count} blocks to {len(by_parent)} parents")
+        
+    except Exception as e:
+        handle_error(e, debug)
+
+
 @block.command()
 @click.argument("block_id")
 @click.option("--text", "-t", help="New text content")
@@ -234,7 +337,7 @@ def update(ctx: click.Context, block_id: str, text: Optional[str],
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Build update parameters
         update_params = {}
@@ -243,19 +346,13 @@ def update(ctx: click.Context, block_id: str, text: Optional[str],
         # In a real implementation, we'd fetch the block first
         if text:
             # This is simplified - real implementation would need to know block type
-            update_params["paragraph"] = {
-                "rich_text": [{
-                    "type": "text",
-                    "text": {"content": text}
-                }]
-            }
+            update_params["paragraph"] = {"rich_text": _rich_text(text)}
         
         if checked is not None:
             update_params["to_do"] = {"checked": checked}
         
         if not update_params:
-            click.echo("Error: No updates specified")
-            ctx.exit(1)
+            raise click.UsageError("No updates specified")
         
         result = client.update_block(block_id, **update_params)
         print_output(result, output_format, config.color_output)
@@ -270,14 +367,13 @@ def update(ctx: click.Context, block_id: str, text: Optional[str],
 @click.pass_context
 def delete(ctx: click.Context, block_id: str, confirm: bool):
     """Delete a block."""
-    config = ctx.obj["config"]
     debug = ctx.obj.get("debug", False)
     
     try:
         if not confirm:
             click.confirm("Are you sure you want to delete this block?", abort=True)
         
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         client.delete_block(block_id)
         click.echo(f"✅ Block {block_id} deleted successfully")
         
@@ -1,7 +1,7 @@
 """Configuration management commands."""
 
 import click
-from typing import Optional
+from typing import Any, Optional
 from pathlib import Path
 
 from ..config import Config
@@ -53,21 +53,54 @@ def set(ctx: click.Context, key: str, value: str):
     """Set a configuration value."""
     config_obj = ctx.obj["config"]
     
+    value = _parse_value(key, value)
+    config_obj.set(key, value)
+    config_obj.save()
+    
+    click.echo(f"✅ Set {key} = {value}")
+
+
+@config.command(name="set-many")
+@click.argument("assignments", nargs=-1, required=True)
+@click.pass_context
+def set_many(ctx: click.Context, assignments: tuple):
+    """Set several configuration values, writing the file once.
+    
+    Examples:
+    
+    \b
+    notion-cli config set-many output_format=table page_size=50
+    """
+    config_obj = ctx.obj["config"]
+    
+    # Validate everything before changing anything
+    values = {}
+    for assignment in assignments:
+        if "=" not in assignment:
+            raise click.UsageError(f"Invalid assignment format: {assignment} (expected key=value)")
+        key, value = assignment.split("=", 1)
+        values[key] = _parse_value(key, value)
+    
+    for key, value in values.items():
+        config_obj.set(key, value)
+    config_obj.save()
+    
+    for key, value in values.items():
+        click.echo(f"✅ Set {key} = {value}")
+
+
+def _parse_value(key: str, value: str) -> Any:
+    """Convert a value given on the command line to the type its key expects."""
     # Handle boolean values
     if key in ["color_output"]:
-        value = value.lower() in ["true", "1", "yes"]
+        return value.lower() in ["true", "1", "yes"]
     # Handle integer values
-    elif key in ["page_size"]:
+    if key in ["page_size", "cache_ttl"]:
         try:
-            value = int(value)
+            return int(value)
         except ValueError:
-            click.echo(f"Error: {key} must be a number")
-            ctx.exit(1)
-    
-    config_obj.set(key, value)
-    config_obj.save()
-    
-    click.echo(f"✅ Set {key} = {value}")
+            raise click.UsageError(f"{key} must be a number")
+    return value
 
 
 @config.command()
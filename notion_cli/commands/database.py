@@ -1,14 +1,48 @@
 """Database-related commands."""
 
+import asyncio
 import click
-import json
 import csv
-from typing import Optional, List, Dict, Any
+import io
+import os
+import re
+import sys
+from functools import lru_cache
+from itertools import chain
+from typing import (
+    IO, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+)
 from pathlib import Path
 from io import StringIO
 
-from ..client import NotionClient
-from ..utils import print_output, handle_error
+from ..jsonio import dumps, loads
+from ..utils import atomic_write, print_output, handle_error, get_client
+
+# Marks a column with no matching database property
+_UNKNOWN = object()
+
+# Pages created at once by database import; more would only wait on the
+# client's rate limiter
+IMPORT_CONCURRENCY = 3
+
+# Write buffer for export files, so rows reach the disk in large blocks
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# CSV imports above this size are parsed by pyarrow, if installed; below it
+# the import cost outweighs the faster parsing
+ARROW_MIN_SIZE = 1 << 20
+# pyarrow parses in blocks of about a sixteenth of the file, within these bounds
+ARROW_MIN_BLOCK_SIZE = 1 << 20
+ARROW_MAX_BLOCK_SIZE = 64 << 20
+
+# Values recognised by query --filter and --sort
+_BOOLEANS = frozenset(("true", "false"))
+_EMPTY_STATES = frozenset(("empty", "not_empty"))
+_DIRECTIONS = frozenset(("ascending", "descending"))
+
+# Parsing of property values given as strings
+_CHECKBOX_TRUE = frozenset(("true", "1", "yes"))
+_MULTI_SELECT_SEPARATOR = re.compile(r"\s*,\s*")
 
 
 @click.group()
@@ -27,7 +61,7 @@ def list(ctx: click.Context, output: Optional[str]):
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         databases = client.list_databases()
         print_output(databases, output_format, config.color_output)
     except Exception as e:
@@ -45,7 +79,7 @@ def get(ctx: click.Context, database_id: str, output: Optional[str]):
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         db_data = client.get_database(database_id)
         print_output(db_data, output_format, config.color_output)
     except Exception as e:
@@ -57,10 +91,14 @@ def get(ctx: click.Context, database_id: str, output: Optional[str]):
 @click.option("--filter", "-f", "filters", multiple=True, help="Filter: property=value")
 @click.option("--sort", "-s", "sorts", multiple=True, help="Sort: property:direction")
 @click.option("--limit", "-l", type=int, help="Maximum results")
+@click.option("--cache-ttl", type=int,
+              help="Reuse query responses cached on disk up to this many seconds old")
+@click.option("--no-cache", is_flag=True, help="Bypass the response cache")
 @click.option("--output", "-o", default=None, help="Output format")
 @click.pass_context
 def query(ctx: click.Context, database_id: str, filters: tuple, sorts: tuple,
-          limit: Optional[int], output: Optional[str]):
+          limit: Optional[int], cache_ttl: Optional[int], no_cache: bool,
+          output: Optional[str]):
     """Query a database with filters and sorts.
     
     Examples:
@@ -82,77 +120,61 @@ def query(ctx: click.Context, database_id: str, filters: tuple, sorts: tuple,
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Parse filters
         filter_obj = None
         if filters:
-            filter_conditions = []
-            for f in filters:
-                if "=" not in f:
-                    click.echo(f"Error: Invalid filter format: {f}")
-                    ctx.exit(1)
-                prop, value = f.split("=", 1)
-                
-                # Simple filter construction - in reality this would need
-                # to handle different property types
-                if value.lower() in ["true", "false"]:
-                    filter_conditions.append({
-                        "property": prop,
-                        "checkbox": {"equals": value.lower() == "true"}
-                    })
-                elif value in ["empty", "not_empty"]:
-                    filter_conditions.append({
-                        "property": prop,
-                        prop.lower(): {f"is_{value}": True}
-                    })
-                else:
-                    # Assume select/text for now
-                    filter_conditions.append({
-                        "property": prop,
-                        "select": {"equals": value}
-                    })
-            
+            filter_conditions = [_parse_filter(f) for f in filters]
             if len(filter_conditions) == 1:
                 filter_obj = filter_conditions[0]
             else:
                 filter_obj = {"and": filter_conditions}
         
         # Parse sorts
-        sort_list = []
-        if sorts:
-            for s in sorts:
-                if ":" not in s:
-                    click.echo(f"Error: Invalid sort format: {s}")
-                    ctx.exit(1)
-                prop, direction = s.split(":", 1)
-                if direction not in ["ascending", "descending"]:
-                    click.echo(f"Error: Invalid sort direction: {direction}")
-                    ctx.exit(1)
-                sort_list.append({
-                    "property": prop,
-                    "direction": direction
-                })
+        sort_list = [_parse_sort(s) for s in sorts]
         
-        # Query database
-        page_size = min(limit, 100) if limit else 100
+        # Query database, stopping once the limit is reached
         results = client.query_database(
             database_id,
             filter=filter_obj,
             sorts=sort_list if sort_list else None,
-            page_size=page_size
+            cache_ttl=_cache_ttl(config, cache_ttl, no_cache),
+            max_items=limit
         )
         
-        # Apply limit if specified
-        if limit and len(results) > limit:
-            results = results[:limit]
-        
         print_output(results, output_format, config.color_output)
         
     except Exception as e:
         handle_error(e, debug)
 
 
+def _parse_filter(f: str) -> Dict[str, Any]:
+    """Build a Notion filter condition from a ``property=value`` option."""
+    prop, sep, value = f.partition("=")
+    if not sep:
+        raise click.UsageError(f"Invalid filter format: {f}")
+    
+    # Simple filter construction - in reality this would need
+    # to handle different property types
+    if value.lower() in _BOOLEANS:
+        return {"property": prop, "checkbox": {"equals": value.lower() == "true"}}
+    if value in _EMPTY_STATES:
+        return {"property": prop, prop.lower(): {f"is_{value}": True}}
+    # Assume select/text for now
+    return {"property": prop, "select": {"equals": value}}
+
+
+def _parse_sort(s: str) -> Dict[str, str]:
+    """Build a Notion sort from a ``property:direction`` option."""
+    prop, sep, direction = s.partition(":")
+    if not sep:
+        raise click.UsageError(f"Invalid sort format: {s}")
+    if direction not in _DIRECTIONS:
+        raise click.UsageError(f"Invalid sort direction: {direction}")
+    return {"property": prop, "direction": direction}
+
+
 @database.command(name="create-page")
 @click.argument("database_id")
 @click.option("--property", "-p", "properties", multiple=True, required=True,
@@ -177,19 +199,20 @@ def create_page(ctx: click.Context, database_id: str, properties: tuple,
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
-        # First, get the database schema to understand property types
-        db_schema = client.get_database(database_id)
+        # First, get the database schema to understand property types;
+        # scripts creating many pages can reuse it via NOTION_CACHE_TTL
+        db_schema = client.get_database(database_id, cache_ttl=config.cache_ttl)
         db_properties = db_schema.get("properties", {})
         
         # Build properties
         page_properties = {}
         for prop in properties:
-            if "=" not in prop:
+            name, sep, value = prop.partition("=")
+            if not sep:
                 click.echo(f"Error: Invalid property format: {prop}")
                 ctx.exit(1)
-            name, value = prop.split("=", 1)
             
             # Check if property exists in schema
             if name not in db_properties:
@@ -199,51 +222,21 @@ def create_page(ctx: click.Context, database_id: str, properties: tuple,
             prop_type = db_properties[name].get("type")
             
             # Format value based on property type
-            if prop_type == "title":
-                page_properties[name] = {
-                    "title": [{
-                        "type": "text",
-                        "text": {"content": value}
-                    }]
-                }
-            elif prop_type == "rich_text":
-                page_properties[name] = {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": value}
-                    }]
-                }
-            elif prop_type == "number":
-                try:
-                    page_properties[name] = {"number": float(value)}
-                except ValueError:
-                    click.echo(f"Error: Invalid number value for {name}: {value}")
-                    ctx.exit(1)
-            elif prop_type == "checkbox":
-                page_properties[name] = {"checkbox": value.lower() in ["true", "1", "yes"]}
-            elif prop_type == "select":
-                page_properties[name] = {"select": {"name": value}}
-            elif prop_type == "multi_select":
-                # Support comma-separated values
-                values = [v.strip() for v in value.split(",")]
-                page_properties[name] = {
-                    "multi_select": [{"name": v} for v in values]
-                }
-            elif prop_type == "date":
-                page_properties[name] = {"date": {"start": value}}
-            elif prop_type == "url":
-                page_properties[name] = {"url": value}
-            elif prop_type == "email":
-                page_properties[name] = {"email": value}
-            elif prop_type == "phone_number":
-                page_properties[name] = {"phone_number": value}
-            else:
+            try:
+                prop_value = _property_value(prop_type, value)
+            except ValueError:
+                click.echo(f"Error: Invalid number value for {name}: {value}")
+                ctx.exit(1)
+            if prop_value is None:
                 click.echo(f"Warning: Unsupported property type '{prop_type}' for '{name}'")
+            else:
+                page_properties[name] = prop_value
         
         # Create the page
         page_data = client.create_page(
             parent=database_id,
-            properties=page_properties
+            properties=page_properties,
+            parent_type="database"
         )
         
         print_output(page_data, output_format, config.color_output)
@@ -252,6 +245,144 @@ def create_page(ctx: click.Context, database_id: str, properties: tuple,
         handle_error(e, debug)
 
 
+@database.command(name="import")
+@click.argument("database_id")
+@click.option("--file", "-f", "records_file", type=click.File("r", encoding="utf-8"),
+              default="-", help="CSV or NDJSON file (default: stdin)")
+@click.option("--format", "import_format", type=click.Choice(["csv", "ndjson"]),
+              help="Input format (inferred from the file name if omitted)")
+@click.pass_context
+def import_pages(ctx: click.Context, database_id: str, records_file: IO[str],
+                 import_format: Optional[str]):
+    """Create one database page per CSV row or NDJSON record.
+    
+    Columns are matched to database properties by name; unknown columns and
+    empty values are skipped. Records are read only as fast as pages are
+    created, so large files are never loaded into memory at once.
+    
+    Examples:
+    
+    \b
+    # Import tasks from a spreadsheet export
+    notion-cli database import <id> --file tasks.csv
+    """
+    config = ctx.obj["config"]
+    debug = ctx.obj.get("debug", False)
+    
+    if import_format is None:
+        import_format = "ndjson" if records_file.name.endswith((".ndjson", ".jsonl")) else "csv"
+    
+    try:
+        client = get_client(ctx)
+        db_properties = client.get_database(
+            database_id, cache_ttl=config.cache_ttl
+        ).get("properties", {})
+        
+        # Resolved once, as this runs for every cell of the input
+        prop_types = {name: prop.get("type") for name, prop in db_properties.items()}
+        property_value = _property_value
+        unknown = set()
+        
+        def page_properties(record: Dict[str, Any]) -> Dict[str, Any]:
+            if not isinstance(record, dict):
+                raise ValueError(f"expected a JSON object, got {type(record).__name__}")
+            properties = {}
+            for name, value in record.items():
+                if value is None or value == "":
+                    continue
+                prop_type = prop_types.get(name, _UNKNOWN)
+                if prop_type is _UNKNOWN:
+                    if name not in unknown:
+                        unknown.add(name)
+                        click.echo(f"Warning: Property '{name}' not found in database schema")
+                    continue
+                if not isinstance(value, str):
+                    if isinstance(value, dict):
+                        # Already in API form
+                        properties[name] = value
+                        continue
+                    value = str(value)
+                prop_value = property_value(prop_type, value)
+                if prop_value is not None:
+                    properties[name] = prop_value
+            return properties
+        
+        columns: Optional[List[Tuple[str, Optional[str]]]] = None
+        
+        def row_properties(row: Dict[str, Any]) -> Dict[str, Any]:
+            # Every CSV row has the header's columns, so the known ones are
+            # resolved on the first row and the rest skip the checks
+            nonlocal columns
+            if columns is None:
+                columns = []
+                for name in row:
+                    if name in prop_types:
+                        columns.append((name, prop_types[name]))
+                    else:
+                        click.echo(f"Warning: Property '{name}' not found in database schema")
+            
+            properties = {}
+            for name, prop_type in columns:
+                value = row[name]
+                if value is None or value == "":
+                    continue
+                if not isinstance(value, str):
+                    value = str(value)
+                prop_value = property_value(prop_type, value)
+                if prop_value is not None:
+                    properties[name] = prop_value
+            return properties
+        
+        build_properties = row_properties if import_format == "csv" else page_properties
+        
+        async def create_all() -> Tuple[int, int]:
+            # Parsing waits while the queue is full, so only a few records
+            # are ever held in memory however fast the file reads
+            queue: "asyncio.Queue[Optional[Tuple[int, Dict[str, Any]]]]" = asyncio.Queue(
+                maxsize=2 * IMPORT_CONCURRENCY
+            )
+            created = total = 0
+            
+            async def worker() -> None:
+                nonlocal created
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    row, properties = item
+                    try:
+                        await client.acreate_page(database_id, properties, parent_type="database")
+                    except Exception as e:
+                        click.echo(f"Failed to import record {row}: {e}")
+                    else:
+                        created += 1
+            
+            workers = [asyncio.create_task(worker()) for _ in range(IMPORT_CONCURRENCY)]
+            try:
+                for total, record in enumerate(iter_records(records_file, import_format), start=1):
+                    try:
+                        properties = build_properties(record)
+                    except ValueError as e:
+                        click.echo(f"Failed to import record {total}: {e}")
+                        continue
+                    await queue.put((total, properties))
+            except BaseException:
+                for task in workers:
+                    task.cancel()
+                raise
+            
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+            return created, total
+        
+        created, total = client.run_async(create_all)
+        click.echo(f"Imported {created} of {total} records")
+        
+    except Exception as e:
+        handle_error(e, debug)
+
+
 @database.command()
 @click.argument("database_id")
 @click.option("--format", "-f", "export_format", default="csv",
@@ -259,18 +390,27 @@ def create_page(ctx: click.Context, database_id: str, properties: tuple,
               help="Export format")
 @click.option("--output-file", "-o", type=click.Path(), help="Output file path")
 @click.option("--filter", "filters", multiple=True, help="Filter: property=value")
+@click.option("--cache-ttl", type=int,
+              help="Reuse query responses cached on disk up to this many seconds old")
+@click.option("--no-cache", is_flag=True, help="Bypass the response cache")
 @click.pass_context
 def export(ctx: click.Context, database_id: str, export_format: str,
-           output_file: Optional[str], filters: tuple):
+           output_file: Optional[str], filters: tuple, cache_ttl: Optional[int],
+           no_cache: bool):
     """Export database to CSV, JSON, or Excel."""
     config = ctx.obj["config"]
     debug = ctx.obj.get("debug", False)
     
+    if export_format == "excel" and not output_file:
+        raise click.UsageError("Excel export requires --output-file")
+    
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
+        
+        ttl = _cache_ttl(config, cache_ttl, no_cache)
         
         # Get database schema first
-        db_schema = client.get_database(database_id)
+        db_schema = client.get_database(database_id, cache_ttl=ttl)
         db_properties = db_schema.get("properties", {})
         
         # Parse filters (simplified)
@@ -278,10 +418,10 @@ def export(ctx: click.Context, database_id: str, export_format: str,
         if filters:
             filter_conditions = []
             for f in filters:
-                if "=" not in f:
+                prop, sep, value = f.partition("=")
+                if not sep:
                     click.echo(f"Error: Invalid filter format: {f}")
                     ctx.exit(1)
-                prop, value = f.split("=", 1)
                 filter_conditions.append({
                     "property": prop,
                     "select": {"equals": value}
@@ -292,24 +432,44 @@ def export(ctx: click.Context, database_id: str, export_format: str,
             else:
                 filter_obj = {"and": filter_conditions}
         
-        # Query all pages
-        pages = client.query_database(database_id, filter=filter_obj)
+        # Stream pages straight to the output as they are fetched, with the
+        # next API page already in flight while one is being written
+        pages = client.iquery_database(
+            database_id, filter=filter_obj, cache_ttl=ttl, prefetch=True
+        )
         
-        # Export based on format
-        if export_format == "csv":
-            content = export_to_csv(pages, db_properties)
-        elif export_format == "json":
-            content = json.dumps(pages, indent=2, default=str)
-        else:  # excel
-            click.echo("Excel export not yet implemented")
-            ctx.exit(1)
+        def write(file: IO[str]) -> int:
+            if export_format == "csv":
+                return write_csv(pages, db_properties, file)
+            return write_json(pages, file)
         
-        # Output
         if output_file:
-            Path(output_file).write_text(content)
-            click.echo(f"✅ Exported {len(pages)} records to {output_file}")
+            # Leave any existing file alone when there is nothing to export
+            first = next(pages, None)
+            if first is None:
+                click.echo("No records to export")
+                return
+            pages = chain((first,), pages)
+        
+        # Output
+        if export_format == "excel":
+            count = write_excel(pages, db_properties, output_file)
+            click.echo(f"✅ Exported {count} records to {output_file}")
+        elif output_file:
+            with atomic_write(output_file, encoding="utf-8", newline="",
+                              buffering=EXPORT_BUFFER_SIZE) as f:
+                count = write(f)
+            click.echo(f"✅ Exported {count} records to {output_file}")
         else:
-            click.echo(content)
+            # Write through a CSV-safe (untranslated newline) wrapper around
+            # stdout's buffer, flushed in large blocks
+            sys.stdout.flush()
+            stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="")
+            try:
+                write(stdout)
+            finally:
+                stdout.flush()
+                stdout.detach()
         
     except Exception as e:
         handle_error(e, debug)
@@ -330,14 +490,13 @@ def create(ctx: click.Context, parent: str, title: str, schema: Optional[str],
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Load schema if provided
         properties = {}
         if schema:
-            with open(schema, 'r') as f:
-                schema_data = json.load(f)
-                properties = schema_data.get("properties", {})
+            schema_data = loads(Path(schema).read_bytes())
+            properties = schema_data.get("properties", {})
         else:
             # Default schema with just a title
             properties = {
@@ -359,64 +518,265 @@ def create(ctx: click.Context, parent: str, title: str, schema: Optional[str],
         handle_error(e, debug)
 
 
+def _cache_ttl(config, cache_ttl: Optional[int], no_cache: bool) -> int:
+    """Response cache lifetime for a command: --no-cache, then --cache-ttl, then config."""
+    if no_cache:
+        return 0
+    return cache_ttl if cache_ttl is not None else config.cache_ttl
+
+
+def _text_value(prop_type: str, value: str) -> Dict[str, Any]:
+    return {
+        prop_type: [{
+            "type": "text",
+            "text": {"content": value}
+        }]
+    }
+
+
+def _multi_select_value(value: str) -> Dict[str, Any]:
+    # Support comma-separated values
+    return {
+        "multi_select": [
+            {"name": v} for v in _MULTI_SELECT_SEPARATOR.split(value.strip()) if v
+        ]
+    }
+
+
+# Property type -> builder of its value from a string
+_PROPERTY_BUILDERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "title": lambda value: _text_value("title", value),
+    "rich_text": lambda value: _text_value("rich_text", value),
+    "number": lambda value: {"number": float(value)},
+    "checkbox": lambda value: {"checkbox": value.lower() in _CHECKBOX_TRUE},
+    "select": lambda value: {"select": {"name": value}},
+    "multi_select": _multi_select_value,
+    "date": lambda value: {"date": {"start": value}},
+    "url": lambda value: {"url": value},
+    "email": lambda value: {"email": value},
+    "phone_number": lambda value: {"phone_number": value},
+}
+
+
+@lru_cache(maxsize=8192)
+def _property_value(prop_type: Optional[str], value: str) -> Optional[Dict[str, Any]]:
+    """Property value for a page, built from its string form.
+    
+    Returns None for property types that can't be set from a string.
+    Results are cached, since imports repeat the same select and status
+    values on many rows, so callers must not mutate them.
+    
+    Raises:
+        ValueError: If a number property's value is not a number
+    """
+    builder = _PROPERTY_BUILDERS.get(prop_type)
+    return builder(value) if builder else None
+
+
+def iter_records(file: IO[str], import_format: str) -> Iterator[Dict[str, Any]]:
+    """Yield records from a CSV or NDJSON file one at a time.
+    
+    Rows are parsed as they are consumed, so the file is never held in
+    memory as a whole. CSV files larger than ARROW_MIN_SIZE are parsed with
+    pyarrow when it is installed.
+    """
+    if import_format == "csv":
+        path = getattr(file, "name", None)
+        size = os.path.getsize(path) if isinstance(path, str) and os.path.isfile(path) else 0
+        if size > ARROW_MIN_SIZE:
+            try:
+                yield from _iter_csv_arrow(path, _arrow_block_size(size))
+                return
+            except ImportError:
+                pass
+        yield from csv.DictReader(file)
+    else:
+        for line in file:
+            if line.strip():
+                yield loads(line)
+
+
+def _arrow_block_size(file_size: int) -> int:
+    """Bytes per pyarrow parse block for a file of ``file_size`` bytes.
+    
+    Small blocks spend more time on per-block overhead, large ones hold
+    more of the file in memory at once.
+    """
+    return max(ARROW_MIN_BLOCK_SIZE, min(ARROW_MAX_BLOCK_SIZE, file_size // 16))
+
+
+def _iter_csv_arrow(path: str, block_size: int) -> Iterator[Dict[str, Any]]:
+    """Yield CSV rows parsed in blocks by pyarrow's native reader.
+    
+    Every column is read as text, with empty cells as empty strings, so
+    rows match those of ``csv.DictReader`` whichever reader a file gets.
+    
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+    from pyarrow import csv as arrow_csv
+    
+    with open(path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    
+    reader = arrow_csv.open_csv(
+        path,
+        read_options=arrow_csv.ReadOptions(block_size=block_size),
+        convert_options=arrow_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+    for batch in reader:
+        yield from batch.to_pylist()
+
+
 def export_to_csv(pages: List[Dict[str, Any]], schema: Dict[str, Any]) -> str:
     """Export pages to CSV format."""
-    if not pages:
-        return ""
+    output = StringIO()
+    write_csv(pages, schema, output)
+    return output.getvalue()
+
+
+def write_csv(pages: Iterable[Mapping[str, Any]], schema: Dict[str, Any], file: IO[str]) -> int:
+    """Write pages to a file as CSV, one row at a time.
     
-    # Extract all property names from schema
-    headers = list(schema.keys())
-    headers.insert(0, "Page ID")
-    headers.append("Created Time")
-    headers.append("Last Edited Time")
-    headers.append("URL")
+    Nothing, not even the header, is written if there are no pages.
     
-    # Create CSV
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=headers, extrasaction='ignore')
-    writer.writeheader()
+    Returns:
+        Number of pages written
+    """
+    pages = iter(pages)
+    first = next(pages, None)
+    if first is None:
+        return 0
     
-    for page in pages:
-        row = {
-            "Page ID": page.get("id"),
-            "Created Time": page.get("created_time"),
-            "Last Edited Time": page.get("last_edited_time"),
-            "URL": page.get("url")
-        }
-        
-        # Extract properties
-        props = page.get("properties", {})
-        for name, prop_data in props.items():
-            prop_type = prop_data.get("type")
-            
-            if prop_type == "title":
-                title_arr = prop_data.get("title", [])
-                row[name] = title_arr[0].get("plain_text", "") if title_arr else ""
-            elif prop_type == "rich_text":
-                text_arr = prop_data.get("rich_text", [])
-                row[name] = text_arr[0].get("plain_text", "") if text_arr else ""
-            elif prop_type == "number":
-                row[name] = prop_data.get("number", "")
-            elif prop_type == "checkbox":
-                row[name] = prop_data.get("checkbox", False)
-            elif prop_type == "select":
-                select = prop_data.get("select")
-                row[name] = select.get("name", "") if select else ""
-            elif prop_type == "multi_select":
-                items = prop_data.get("multi_select", [])
-                row[name] = ", ".join([item.get("name", "") for item in items])
-            elif prop_type == "date":
-                date = prop_data.get("date")
-                row[name] = date.get("start", "") if date else ""
-            elif prop_type == "url":
-                row[name] = prop_data.get("url", "")
-            elif prop_type == "email":
-                row[name] = prop_data.get("email", "")
-            elif prop_type == "phone_number":
-                row[name] = prop_data.get("phone_number", "")
-            else:
-                row[name] = str(prop_data)
-        
-        writer.writerow(row)
+    columns = _export_columns(schema)
+    writer = csv.writer(file)
+    writer.writerow(_export_headers(columns))
+    
+    count = 0
     
-    return output.getvalue()
\ No newline at end of file
+    def rows() -> Iterator[List[Any]]:
+        nonlocal count
+        for page in chain((first,), pages):
+            count += 1
+            yield _page_row(page, columns)
+    
+    # writerows drives the generator itself rather than being called per row
+    writer.writerows(rows())
+    return count
+
+
+def write_excel(pages: Iterable[Mapping[str, Any]], schema: Dict[str, Any], path: str) -> int:
+    """Write pages to an Excel workbook with the same columns as CSV export.
+    
+    The workbook is written in xlsxwriter's constant memory mode, which
+    flushes each row to disk as soon as the next one starts.
+    
+    Returns:
+        Number of pages written
+    
+    Raises:
+        click.ClickException: If xlsxwriter is not installed
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        raise click.ClickException(
+            'Excel export requires xlsxwriter: pip install "notion-cli[excel]"'
+        )
+    
+    columns = _export_columns(schema)
+    headers = _export_headers(columns)
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet()
+        count = 0
+        for page in pages:
+            if not count:
+                worksheet.write_row(0, 0, headers)
+            count += 1
+            worksheet.write_row(count, 0, _page_row(page, columns))
+    finally:
+        workbook.close()
+    return count
+
+
+# Export column: property name and the extractor of its cell value
+_Column = Tuple[str, Callable[[Dict[str, Any]], Any]]
+
+
+def _export_columns(schema: Dict[str, Any]) -> Tuple[_Column, ...]:
+    """Export columns of a database, with extractors resolved from the schema.
+    
+    A property's type is fixed by the schema, so its extractor is looked up
+    once per column rather than once per cell.
+    """
+    return tuple(
+        (name, _VALUE_EXTRACTORS.get(meta.get("type"), str))
+        for name, meta in schema.items()
+    )
+
+
+# Page fields exported after the properties, and their column headers
+_PAGE_METADATA = ("created_time", "last_edited_time", "url")
+_PAGE_METADATA_HEADERS = ("Created Time", "Last Edited Time", "URL")
+
+
+def _export_headers(columns: Tuple[_Column, ...]) -> Tuple[str, ...]:
+    return ("Page ID", *(name for name, _ in columns), *_PAGE_METADATA_HEADERS)
+
+
+def _page_row(page: Mapping[str, Any], columns: Tuple[_Column, ...]) -> List[Any]:
+    """Export row of a page: its ID, the column values, then page metadata."""
+    props = page.get("properties", {})
+    return [
+        page.get("id"),
+        *(extract(props[name]) if name in props else "" for name, extract in columns),
+        *map(page.get, _PAGE_METADATA)
+    ]
+
+
+def _first_plain_text(rich_text: List[Dict[str, Any]]) -> str:
+    return rich_text[0].get("plain_text", "") if rich_text else ""
+
+
+def _optional_field(value: Optional[Dict[str, Any]], key: str) -> Any:
+    return value.get(key, "") if value else ""
+
+
+# Property type -> extractor of its export cell value
+_VALUE_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "title": lambda prop: _first_plain_text(prop.get("title", [])),
+    "rich_text": lambda prop: _first_plain_text(prop.get("rich_text", [])),
+    "number": lambda prop: prop.get("number", ""),
+    "checkbox": lambda prop: prop.get("checkbox", False),
+    "select": lambda prop: _optional_field(prop.get("select"), "name"),
+    "multi_select": lambda prop: ", ".join(
+        [item.get("name", "") for item in prop.get("multi_select", [])]
+    ),
+    "date": lambda prop: _optional_field(prop.get("date"), "start"),
+    "url": lambda prop: prop.get("url", ""),
+    "email": lambda prop: prop.get("email", ""),
+    "phone_number": lambda prop: prop.get("phone_number", ""),
+}
+
+
+def write_json(pages: Iterable[Mapping[str, Any]], file: IO[str]) -> int:
+    """Write pages to a file as an indented JSON array, one page at a time.
+    
+    Returns:
+        Number of pages written
+    """
+    count = 0
+    for page in pages:
+        file.write(",\n" if count else "[\n")
+        # Encoding the page as a one-element array lets the encoder nest
+        # its indentation; strip the surrounding "[\n" and "\n]"
+        file.write(dumps([page], indent=True)[2:-2])
+        count += 1
+    file.write("\n]\n" if count else "[]\n")
+    return count
@@ -1,12 +1,27 @@
 """Page-related commands."""
 
 import click
-import json
-from typing import Optional, Dict, Any
+import re
+import sys
+from functools import lru_cache
+from operator import itemgetter
+from typing import IO, Callable, Iterable, Mapping, Optional, List, Dict, Any
 from pathlib import Path
+from io import StringIO
 
-from ..client import NotionClient
-from ..utils import print_output, handle_error
+from ..jsonio import loads
+from ..utils import atomic_write, print_output, handle_error, get_client, page_title
+
+# Values of --property that are stored as a checkbox
+_BOOLEANS = frozenset(("true", "false"))
+
+_plain_text = itemgetter("plain_text")
+
+# --icon values starting with these are image URLs rather than emoji
+_URL_PREFIXES = ("http://", "https://")
+
+# A paragraph of --content: text up to the next blank line ("\n\n")
+_PARAGRAPH = re.compile(r"\S[^\n]*(?:\n(?!\n)[^\n]*)*")
 
 
 @click.group()
@@ -26,7 +41,7 @@ def get(ctx: click.Context, page_id: str, output: Optional[str]):
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         page_data = client.get_page(page_id)
         print_output(page_data, output_format, config.color_output)
     except Exception as e:
@@ -36,53 +51,35 @@ def get(ctx: click.Context, page_id: str, output: Optional[str]):
 @page.command()
 @click.option("--title", "-t", required=True, help="Page title")
 @click.option("--parent", "-p", required=True, help="Parent page/database ID")
+@click.option("--parent-type", type=click.Choice(["page", "database"]),
+              help="Parent type (inferred from the ID format if omitted)")
 @click.option("--property", "properties", multiple=True, help="Property: name=value")
 @click.option("--content", "-c", help="Page content (text or file path)")
 @click.option("--icon", help="Page icon (emoji or URL)")
 @click.option("--cover", help="Page cover image URL")
 @click.option("--output", "-o", default=None, help="Output format")
 @click.pass_context
-def create(ctx: click.Context, title: str, parent: str, properties: tuple, 
-           content: Optional[str], icon: Optional[str], cover: Optional[str],
-           output: Optional[str]):
+def create(ctx: click.Context, title: str, parent: str, parent_type: Optional[str],
+           properties: tuple, content: Optional[str], icon: Optional[str],
+           cover: Optional[str], output: Optional[str]):
     """Create a new page."""
     config = ctx.obj["config"]
     debug = ctx.obj.get("debug", False)
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Build properties
-        page_properties = {
-            "title": {
-                "title": [{
-                    "type": "text",
-                    "text": {"content": title}
-                }]
-            }
-        }
+        page_properties = {"title": _title_property(title)}
         
         # Parse additional properties
         for prop in properties:
-            if "=" not in prop:
+            name, sep, value = prop.partition("=")
+            if not sep:
                 click.echo(f"Error: Invalid property format: {prop}")
                 ctx.exit(1)
-            name, value = prop.split("=", 1)
-            
-            # Try to infer property type
-            if value.lower() in ["true", "false"]:
-                page_properties[name] = {"checkbox": value.lower() == "true"}
-            elif value.isdigit():
-                page_properties[name] = {"number": int(value)}
-            else:
-                # Default to rich text
-                page_properties[name] = {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": value}
-                    }]
-                }
+            page_properties[name] = _parse_property(value)
         
         # Build children blocks if content provided
         children = []
@@ -95,31 +92,15 @@ def create(ctx: click.Context, title: str, parent: str, properties: tuple,
                 content_text = content
             
             # Split content into paragraphs
-            for paragraph in content_text.split("\n\n"):
-                if paragraph.strip():
-                    children.append({
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": [{
-                                "type": "text",
-                                "text": {"content": paragraph.strip()}
-                            }]
-                        }
-                    })
-        
-        # Handle icon
-        icon_obj = None
-        if icon:
-            if len(icon) <= 2:  # Likely an emoji
-                icon_obj = {"type": "emoji", "emoji": icon}
-            else:  # URL
-                icon_obj = {"type": "external", "external": {"url": icon}}
-        
-        # Handle cover
-        cover_obj = None
-        if cover:
-            cover_obj = {"type": "external", "external": {"url": cover}}
+            for match in _PARAGRAPH.finditer(content_text):
+                children.append({
+                    "object": "block",
+                    "type": "paragraph",
+                    "paragraph": {"rich_text": _text(match.group().rstrip())}
+                })
+        
+        icon_obj = _build_icon(icon)
+        cover_obj = _build_cover(cover)
         
         # Create page
         page_data = client.create_page(
@@ -127,7 +108,8 @@ def create(ctx: click.Context, title: str, parent: str, properties: tuple,
             properties=page_properties,
             children=children if children else None,
             icon=icon_obj,
-            cover=cover_obj
+            cover=cover_obj,
+            parent_type=parent_type
         )
         
         print_output(page_data, output_format, config.color_output)
@@ -136,6 +118,76 @@ def create(ctx: click.Context, title: str, parent: str, properties: tuple,
         handle_error(e, debug)
 
 
+@page.command(name="create-many")
+@click.argument("parent")
+@click.option("--file", "-f", "ndjson_file", type=click.File("rb"), default="-",
+              help="NDJSON file of pages, one per line (default: stdin)")
+@click.option("--parent-type", type=click.Choice(["page", "database"]),
+              help="Parent type (inferred from the ID format if omitted)")
+@click.pass_context
+def create_many(ctx: click.Context, parent: str, ndjson_file: IO[bytes],
+                parent_type: Optional[str]):
+    """Create many pages under PARENT concurrently.
+    
+    Each line is either a JSON string, used as the page title, or an object
+    with a "title" and optionally "properties" (name to value, typed as
+    with --property unless already in API form), "icon" and "cover".
+    
+    Examples:
+    
+    \b
+    # One page per line of a text file
+    jq -R . titles.txt | notion-cli page create-many <parent-id>
+    """
+    debug = ctx.obj.get("debug", False)
+    
+    try:
+        pages = []
+        for line_number, line in enumerate(ndjson_file, 1):
+            if not line.strip():
+                continue
+            record = loads(line)
+            if isinstance(record, str):
+                record = {"title": record}
+            elif not isinstance(record, dict):
+                raise click.UsageError(f"Line {line_number}: expected a page object or a title")
+            record_properties = record.get("properties", {})
+            if not isinstance(record_properties, dict):
+                raise click.UsageError(f"Line {line_number}: \"properties\" must be an object")
+            
+            properties = {"title": _title_property(record.get("title", ""))}
+            for name, value in record_properties.items():
+                properties[name] = value if isinstance(value, dict) else _parse_property(str(value))
+            pages.append({
+                "parent": parent,
+                "properties": properties,
+                "icon": _build_icon(record.get("icon")),
+                "cover": _build_cover(record.get("cover")),
+                "parent_type": parent_type,
+            })
+        
+        if not pages:
+            raise click.UsageError("No pages to create")
+        
+        client = get_client(ctx)
+        results = client.run_async(lambda: client.acreate_pages(pages))
+        
+        created = 0
+        for number, result in enumerate(results, start=1):
+            if isinstance(result, Exception):
+                click.echo(f"Failed to create page {number}: {result}")
+            else:
+                created += 1
+        
+        click.echo(f"Created {created} of {len(pages)} pages")
+        
+        if created < len(pages):
+            ctx.exit(1)
+        
+    except Exception as e:
+        handle_error(e, debug)
+
+
 @page.command()
 @click.argument("page_id")
 @click.option("--title", "-t", help="New page title")
@@ -154,57 +206,24 @@ def update(ctx: click.Context, page_id: str, title: Optional[str],
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Build properties to update
         page_properties = {}
         
         if title:
-            page_properties["title"] = {
-                "title": [{
-                    "type": "text",
-                    "text": {"content": title}
-                }]
-            }
+            page_properties["title"] = _title_property(title)
         
         # Parse additional properties
         for prop in properties:
-            if "=" not in prop:
+            name, sep, value = prop.partition("=")
+            if not sep:
                 click.echo(f"Error: Invalid property format: {prop}")
                 ctx.exit(1)
-            name, value = prop.split("=", 1)
-            
-            # Try to infer property type
-            if value.lower() in ["true", "false"]:
-                page_properties[name] = {"checkbox": value.lower() == "true"}
-            elif value.isdigit():
-                page_properties[name] = {"number": int(value)}
-            else:
-                # Default to rich text
-                page_properties[name] = {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": value}
-                    }]
-                }
-        
-        # Handle icon
-        icon_obj = None
-        if icon:
-            if icon == "none":
-                icon_obj = None
-            elif len(icon) <= 2:  # Likely an emoji
-                icon_obj = {"type": "emoji", "emoji": icon}
-            else:  # URL
-                icon_obj = {"type": "external", "external": {"url": icon}}
-        
-        # Handle cover
-        cover_obj = None
-        if cover:
-            if cover == "none":
-                cover_obj = None
-            else:
-                cover_obj = {"type": "external", "external": {"url": cover}}
+            page_properties[name] = _parse_property(value)
+        
+        icon_obj = _build_icon(icon)
+        cover_obj = _build_cover(cover)
         
         # Update page
         update_params = {}
@@ -228,27 +247,109 @@ def update(ctx: click.Context, page_id: str, title: Optional[str],
         handle_error(e, debug)
 
 
+def _text(content: str) -> List[Dict[str, Any]]:
+    return [{"type": "text", "text": {"content": content}}]
+
+
+def _title_property(title: str) -> Dict[str, Any]:
+    return {"title": _text(title)}
+
+
+def _build_icon(icon: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Icon object for ``--icon``: a URL, an emoji, or "none" to remove it."""
+    if not icon or icon == "none":
+        return None
+    if icon.startswith(_URL_PREFIXES):
+        return {"type": "external", "external": {"url": icon}}
+    # Anything else is an emoji, including multi-codepoint ones
+    return {"type": "emoji", "emoji": icon}
+
+
+def _build_cover(cover: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Cover object for ``--cover``: an image URL, or "none" to remove it."""
+    if not cover or cover == "none":
+        return None
+    return {"type": "external", "external": {"url": cover}}
+
+
+@lru_cache(maxsize=256)
+def _parse_property(value: str) -> Dict[str, Any]:
+    """Property value for a ``--property`` option, with its type inferred.
+    
+    Scripts tend to pass the same values over and over, so results are
+    cached; callers must not modify them.
+    """
+    lowered = value.lower()
+    if lowered in _BOOLEANS:
+        return {"checkbox": lowered == "true"}
+    if value.isdigit():
+        return {"number": int(value)}
+    # Default to rich text
+    return {"rich_text": _text(value)}
+
+
 @page.command()
-@click.argument("page_id")
+@click.argument("page_ids", nargs=-1, required=True)
 @click.option("--confirm", is_flag=True, help="Skip confirmation")
 @click.pass_context
-def delete(ctx: click.Context, page_id: str, confirm: bool):
-    """Delete (archive) a page."""
-    config = ctx.obj["config"]
+def delete(ctx: click.Context, page_ids: tuple, confirm: bool):
+    """Delete (archive) one or more pages.
+    
+    Several pages are archived concurrently. Repeated IDs are archived once,
+    and pages that are already archived are skipped.
+    """
     debug = ctx.obj.get("debug", False)
     
+    # Drop duplicates, keeping the given order
+    page_ids = tuple(dict.fromkeys(page_ids))
+    
     try:
         if not confirm:
-            click.confirm("Are you sure you want to archive this page?", abort=True)
+            noun = "this page" if len(page_ids) == 1 else f"these {len(page_ids)} pages"
+            click.confirm(f"Are you sure you want to archive {noun}?", abort=True)
+        
+        client = get_client(ctx)
+        results = client.run_async(lambda: client.adelete_pages(page_ids))
+        
+        archived = skipped = failed = 0
+        for page_id, result in zip(page_ids, results):
+            if _already_archived(result):
+                skipped += 1
+                click.echo(f"Page {page_id} is already archived")
+            elif isinstance(result, Exception):
+                failed += 1
+                click.echo(f"Failed to archive page {page_id}: {result}")
+            else:
+                archived += 1
+                click.echo(f"✅ Page {page_id} archived successfully")
+        
+        if len(page_ids) > 1:
+            click.echo(f"Archived {archived}, skipped {skipped}, failed {failed}")
         
-        client = NotionClient(config.api_key)
-        client.delete_page(page_id)
-        click.echo(f"✅ Page {page_id} archived successfully")
+        if failed:
+            ctx.exit(1)
         
     except Exception as e:
         handle_error(e, debug)
 
 
+# Start of Notion's validation error for editing a page that is itself
+# archived. An archived parent or ancestor gets a different message and is
+# a real failure.
+_ALREADY_ARCHIVED_MESSAGE = "can't edit block that is archived"
+
+
+def _already_archived(result: Any) -> bool:
+    """Whether a page update failed only because the page was already archived."""
+    from notion_client.errors import APIErrorCode, APIResponseError
+    
+    return (
+        isinstance(result, APIResponseError)
+        and result.code == APIErrorCode.ValidationError
+        and str(result).lower().startswith(_ALREADY_ARCHIVED_MESSAGE)
+    )
+
+
 @page.command()
 @click.argument("query")
 @click.option("--limit", "-l", default=10, help="Maximum results")
@@ -261,8 +362,8 @@ def search(ctx: click.Context, query: str, limit: int, output: Optional[str]):
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
-        results = client.search(query=query, filter_type="page", page_size=limit)
+        client = get_client(ctx)
+        results = client.search(query=query, filter_type="page", max_items=limit)
         print_output(results, output_format, config.color_output)
         
     except Exception as e:
@@ -280,146 +381,110 @@ def search(ctx: click.Context, query: str, limit: int, output: Optional[str]):
 def export(ctx: click.Context, page_id: str, export_format: str,
            output_file: Optional[str], include_children: bool):
     """Export a page to various formats."""
-    config = ctx.obj["config"]
     debug = ctx.obj.get("debug", False)
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Get page data
         page_data = client.get_page(page_id)
         
-        # Get blocks if requested
-        blocks = []
-        if include_children:
-            blocks = client.get_block_children(page_id)
-        
-        # Export based on format
-        if export_format == "markdown":
-            content = export_to_markdown(page_data, blocks)
-        elif export_format == "html":
-            content = export_to_html(page_data, blocks)
-        else:  # text
-            content = export_to_text(page_data, blocks)
+        # Get blocks if requested; they are written out as they are fetched
+        blocks = client.iget_block_children(page_id) if include_children else ()
+        write = _PAGE_WRITERS[export_format]
         
         # Output
         if output_file:
-            Path(output_file).write_text(content)
+            with atomic_write(output_file, encoding="utf-8") as f:
+                write(page_data, blocks, f)
             click.echo(f"✅ Exported to {output_file}")
         else:
-            click.echo(content)
+            write(page_data, blocks, sys.stdout)
         
     except Exception as e:
         handle_error(e, debug)
 
 
-def export_to_markdown(page: Dict[str, Any], blocks: list) -> str:
+def export_to_markdown(page: Mapping[str, Any], blocks: Iterable[Mapping[str, Any]]) -> str:
     """Export page to Markdown format."""
-    lines = []
-    
-    # Extract title
-    title = "Untitled"
-    for prop in page.get("properties", {}).values():
-        if prop.get("type") == "title":
-            title_arr = prop.get("title", [])
-            if title_arr:
-                title = title_arr[0].get("plain_text", "Untitled")
-            break
+    output = StringIO()
+    write_markdown(page, blocks, output)
+    return output.getvalue()
+
+
+def export_to_html(page: Mapping[str, Any], blocks: Iterable[Mapping[str, Any]]) -> str:
+    """Export page to HTML format."""
+    output = StringIO()
+    write_html(page, blocks, output)
+    return output.getvalue()
+
+
+def export_to_text(page: Mapping[str, Any], blocks: Iterable[Mapping[str, Any]]) -> str:
+    """Export page to plain text format."""
+    output = StringIO()
+    write_text(page, blocks, output)
+    return output.getvalue()
+
+
+def write_markdown(
+    page: Mapping[str, Any],
+    blocks: Iterable[Mapping[str, Any]],
+    file: IO[str]
+) -> None:
+    """Write a page to a file as Markdown, one block at a time."""
+    write = file.write
     
-    lines.append(f"# {title}\n")
+    title = page_title(page)
+    write(f"# {title}\n\n")
     
     # Add metadata
-    lines.append(f"*Created: {page.get('created_time', 'Unknown')}*")
-    lines.append(f"*Last edited: {page.get('last_edited_time', 'Unknown')}*")
-    lines.append(f"*URL: {page.get('url', 'Unknown')}*\n")
+    write(f"*Created: {page.get('created_time', 'Unknown')}*\n")
+    write(f"*Last edited: {page.get('last_edited_time', 'Unknown')}*\n")
+    write(f"*URL: {page.get('url', 'Unknown')}*\n\n")
     
     # Process blocks
     for block in blocks:
         block_type = block.get("type")
-        block_data = block.get(block_type, {})
-        
-        if block_type == "paragraph":
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(f"{text}\n")
-        elif block_type.startswith("heading_"):
-            level = int(block_type[-1])
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(f"{'#' * level} {text}\n")
-        elif block_type == "bulleted_list_item":
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(f"- {text}")
-        elif block_type == "numbered_list_item":
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(f"1. {text}")
-        elif block_type == "to_do":
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            checked = "x" if block_data.get("checked", False) else " "
-            lines.append(f"- [{checked}] {text}")
-        elif block_type == "code":
-            language = block_data.get("language", "")
-            code = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(f"```{language}\n{code}\n```\n")
-        elif block_type == "quote":
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(f"> {text}\n")
-        elif block_type == "divider":
-            lines.append("---\n")
-        else:
-            lines.append(f"[{block_type} block]\n")
-    
-    return "\n".join(lines)
+        handler = _MD_HANDLERS.get(block_type)
+        write(handler(block.get(block_type, {})) if handler else f"[{block_type} block]\n")
+        write("\n")
 
 
-def export_to_html(page: Dict[str, Any], blocks: list) -> str:
-    """Export page to HTML format."""
-    # Simplified HTML export
-    lines = ["<!DOCTYPE html>", "<html>", "<head>", "<title>Page Export</title>", "</head>", "<body>"]
+def write_html(
+    page: Mapping[str, Any],
+    blocks: Iterable[Mapping[str, Any]],
+    file: IO[str]
+) -> None:
+    """Write a page to a file as HTML, one block at a time."""
+    write = file.write
     
-    # Extract title
-    title = "Untitled"
-    for prop in page.get("properties", {}).values():
-        if prop.get("type") == "title":
-            title_arr = prop.get("title", [])
-            if title_arr:
-                title = title_arr[0].get("plain_text", "Untitled")
-            break
+    # Simplified HTML export
+    write("<!DOCTYPE html>\n<html>\n<head>\n<title>Page Export</title>\n</head>\n<body>\n")
     
-    lines.append(f"<h1>{title}</h1>")
+    title = page_title(page)
+    write(f"<h1>{title}</h1>\n")
     
     # Process blocks
     for block in blocks:
         block_type = block.get("type")
-        block_data = block.get(block_type, {})
-        
-        if block_type == "paragraph":
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(f"<p>{text}</p>")
-        elif block_type.startswith("heading_"):
-            level = int(block_type[-1])
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(f"<h{level}>{text}</h{level}>")
-        # ... add more block types as needed
+        handler = _HTML_HANDLERS.get(block_type)
+        if handler:
+            write(handler(block.get(block_type, {})))
+            write("\n")
     
-    lines.extend(["</body>", "</html>"])
-    return "\n".join(lines)
+    write("</body>\n</html>\n")
 
 
-def export_to_text(page: Dict[str, Any], blocks: list) -> str:
-    """Export page to plain text format."""
-    lines = []
-    
-    # Extract title
-    title = "Untitled"
-    for prop in page.get("properties", {}).values():
-        if prop.get("type") == "title":
-            title_arr = prop.get("title", [])
-            if title_arr:
-                title = title_arr[0].get("plain_text", "Untitled")
-            break
+def write_text(
+    page: Mapping[str, Any],
+    blocks: Iterable[Mapping[str, Any]],
+    file: IO[str]
+) -> None:
+    """Write a page to a file as plain text, one block at a time."""
+    write = file.write
     
-    lines.append(title)
-    lines.append("=" * len(title))
-    lines.append("")
+    title = page_title(page)
+    write(f"{title}\n{'=' * len(title)}\n\n")
     
     # Process blocks
     for block in blocks:
@@ -427,13 +492,71 @@ def export_to_text(page: Dict[str, Any], blocks: list) -> str:
         block_data = block.get(block_type, {})
         
         if "rich_text" in block_data:
-            text = extract_text_from_rich_text(block_data.get("rich_text", []))
-            lines.append(text)
-            lines.append("")
-    
-    return "\n".join(lines)
+            write(extract_text_from_rich_text(block_data["rich_text"]))
+            write("\n\n")
+
+
+_PageWriter = Callable[[Mapping[str, Any], Iterable[Mapping[str, Any]], IO[str]], None]
+
+# Page writer for each export format
+_PAGE_WRITERS: Dict[str, _PageWriter] = {
+    "markdown": write_markdown,
+    "html": write_html,
+    "text": write_text,
+}
 
 
 def extract_text_from_rich_text(rich_text: list) -> str:
     """Extract plain text from rich text array."""
-    return "".join([t.get("plain_text", "") for t in rich_text])
\ No newline at end of file
+    # The API always includes plain_text; fall back for hand-built fragments
+    try:
+        return "".join(map(_plain_text, rich_text))
+    except KeyError:
+        return "".join([t.get("plain_text", "") for t in rich_text])
+
+
+def _block_text(block_data: Dict[str, Any]) -> str:
+    return extract_text_from_rich_text(block_data.get("rich_text", []))
+
+
+def _md_text(prefix: str, suffix: str = "") -> Callable[[Dict[str, Any]], str]:
+    return lambda block_data: f"{prefix}{_block_text(block_data)}{suffix}"
+
+
+def _md_to_do(block_data: Dict[str, Any]) -> str:
+    checked = "x" if block_data.get("checked", False) else " "
+    return f"- [{checked}] {_block_text(block_data)}"
+
+
+def _md_code(block_data: Dict[str, Any]) -> str:
+    language = block_data.get("language", "")
+    return f"```{language}\n{_block_text(block_data)}\n```\n"
+
+
+# Block type -> Markdown renderer of its type-specific data
+_MD_HANDLERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "paragraph": _md_text("", "\n"),
+    "heading_1": _md_text("# ", "\n"),
+    "heading_2": _md_text("## ", "\n"),
+    "heading_3": _md_text("### ", "\n"),
+    "bulleted_list_item": _md_text("- "),
+    "numbered_list_item": _md_text("1. "),
+    "to_do": _md_to_do,
+    "code": _md_code,
+    "quote": _md_text("> ", "\n"),
+    "divider": lambda block_data: "---\n",
+}
+
+
+def _html_element(tag: str) -> Callable[[Dict[str, Any]], str]:
+    return lambda block_data: f"<{tag}>{_block_text(block_data)}</{tag}>"
+
+
+# Block type -> HTML renderer; add more block types as needed, others are
+# left out
+_HTML_HANDLERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "paragraph": _html_element("p"),
+    "heading_1": _html_element("h1"),
+    "heading_2": _html_element("h2"),
+    "heading_3": _html_element("h3"),
+}
\ No newline at end of file
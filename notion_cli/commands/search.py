@@ -3,8 +3,7 @@
 import click
 from typing import Optional
 
-from ..client import NotionClient
-from ..utils import print_output, handle_error
+from ..utils import print_output, handle_error, get_client
 
 
 @click.command(name="search")
@@ -40,7 +39,7 @@ def search_cmd(ctx: click.Context, query: str, filter_type: str,
     output_format = output or config.output_format
     
     try:
-        client = NotionClient(config.api_key)
+        client = get_client(ctx)
         
         # Build sort parameter
         sort_param = None
@@ -50,25 +49,21 @@ def search_cmd(ctx: click.Context, query: str, filter_type: str,
                 "timestamp": "last_edited_time"
             }
         
-        # Perform search
+        # Perform search, stopping once the limit is reached
         if filter_type == "all":
             results = client.search(
                 query=query,
                 sort=sort_param,
-                page_size=limit
+                max_items=limit
             )
         else:
             results = client.search(
                 query=query,
                 filter_type=filter_type,
                 sort=sort_param,
-                page_size=limit
+                max_items=limit
             )
         
-        # Limit results
-        if len(results) > limit:
-            results = results[:limit]
-        
         # Output results
         if not results:
             if query:
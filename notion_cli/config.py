@@ -1,7 +1,6 @@
 """Configuration management for Notion CLI."""
 
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
@@ -9,6 +8,25 @@ from dotenv import load_dotenv
 # Load .env file if it exists
 load_dotenv()
 
+# Environment variables that override config file values
+_ENV_MAPPING = {
+    "NOTION_API_KEY": "api_key",
+    "NOTION_DEFAULT_DATABASE": "default_database",
+    "NOTION_OUTPUT_FORMAT": "output_format",
+    "NOTION_COLOR_OUTPUT": "color_output",
+    "NOTION_PAGE_SIZE": "page_size",
+    "NOTION_CACHE_TTL": "cache_ttl",
+}
+_BOOLEAN_KEYS = frozenset(("color_output",))
+_INTEGER_KEYS = frozenset(("page_size", "cache_ttl"))
+_TRUE_VALUES = frozenset(("true", "1", "yes"))
+
+_DEFAULTS = {
+    "output_format": "json",
+    "color_output": True,
+    "page_size": 100,
+}
+
 
 class Config:
     """Configuration manager for Notion CLI."""
@@ -25,7 +43,18 @@ class Config:
         """
         self.config_dir = self.DEFAULT_CONFIG_DIR
         self.config_path = config_path or (self.config_dir / self.DEFAULT_CONFIG_FILE)
-        self._config = self._load_config()
+        self._values: Optional[Dict[str, Any]] = None
+    
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """Configuration values, loaded on first access.
+        
+        Commands such as ``--help`` never read the config, so the file and
+        environment are only consulted once something asks for a value.
+        """
+        if self._values is None:
+            self._values = self._load_config()
+        return self._values
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file and environment."""
@@ -33,26 +62,21 @@ class Config:
         
         # Load from config file if it exists
         if self.config_path.exists():
+            import yaml
             with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f) or {}
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                config = yaml.load(f, Loader=loader) or {}
         
         # Override with environment variables
-        env_mapping = {
-            "NOTION_API_KEY": "api_key",
-            "NOTION_DEFAULT_DATABASE": "default_database",
-            "NOTION_OUTPUT_FORMAT": "output_format",
-            "NOTION_COLOR_OUTPUT": "color_output",
-            "NOTION_PAGE_SIZE": "page_size",
-        }
-        
-        for env_var, config_key in env_mapping.items():
-            value = os.getenv(env_var)
+        env = os.environ
+        for env_var, config_key in _ENV_MAPPING.items():
+            value = env.get(env_var)
             if value:
                 # Handle boolean conversion
-                if config_key in ["color_output"]:
-                    config[config_key] = value.lower() in ["true", "1", "yes"]
+                if config_key in _BOOLEAN_KEYS:
+                    config[config_key] = value.lower() in _TRUE_VALUES
                 # Handle integer conversion
-                elif config_key in ["page_size"]:
+                elif config_key in _INTEGER_KEYS:
                     try:
                         config[config_key] = int(value)
                     except ValueError:
@@ -61,13 +85,7 @@ class Config:
                     config[config_key] = value
         
         # Set defaults
-        defaults = {
-            "output_format": "json",
-            "color_output": True,
-            "page_size": 100,
-        }
-        
-        for key, default_value in defaults.items():
+        for key, default_value in _DEFAULTS.items():
             if key not in config:
                 config[key] = default_value
         
@@ -75,10 +93,13 @@ class Config:
     
     def save(self) -> None:
         """Save current configuration to file."""
+        import yaml
+        
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         with open(self.config_path, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False)
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            yaml.dump(self._config, f, Dumper=dumper, default_flow_style=False)
     
     def init_config(self) -> None:
         """Initialize a new configuration file with prompts."""
@@ -176,6 +197,11 @@ class Config:
         """Get page size for API requests."""
         return self.get("page_size", 100)
     
+    @property
+    def cache_ttl(self) -> int:
+        """Get how long cached API responses are reused, in seconds (0 disables)."""
+        return self.get("cache_ttl", 0)
+    
     def __repr__(self) -> str:
         """String representation."""
         return f"Config(path={self.config_path}, keys={list(self._config.keys())})"
\ No newline at end of file
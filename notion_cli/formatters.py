@@ -1,15 +1,20 @@
 """Output formatters for different display formats."""
 
-import json
-import yaml
-from typing import Any, Dict, List, Union
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
 from datetime import datetime
-from tabulate import tabulate
-from rich.console import Console
-from rich.table import Table
-from rich.syntax import Syntax
-from rich.panel import Panel
-from rich.text import Text
+
+from .jsonio import dumps
+
+# Rich is imported only where colored output is rendered, tabulate only for
+# plain tables and PyYAML only for YAML output, so other output never pays
+# for loading them
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Longer listings are printed as tab-separated rows instead of a drawn table
+MAX_TABLE_ROWS = 500
 
 
 class OutputFormatter:
@@ -22,7 +27,12 @@ class OutputFormatter:
             color: Whether to use colored output
         """
         self.color = color
-        self.console = Console(force_terminal=color)
+    
+    @cached_property
+    def console(self) -> "Console":
+        """Console for rendering this formatter's output, created on first use."""
+        from rich.console import Console
+        return Console(force_terminal=self.color)
     
     def format(self, data: Any) -> str:
         """Format data for output.
@@ -41,9 +51,10 @@ class JSONFormatter(OutputFormatter):
     
     def format(self, data: Any) -> str:
         """Format data as JSON."""
-        json_str = json.dumps(data, indent=2, default=str)
+        json_str = dumps(data, indent=True)
         
         if self.color:
+            from rich.syntax import Syntax
             syntax = Syntax(json_str, "json", theme="monokai")
             return syntax
         return json_str
@@ -54,9 +65,12 @@ class YAMLFormatter(OutputFormatter):
     
     def format(self, data: Any) -> str:
         """Format data as YAML."""
+        import yaml
+        
         yaml_str = yaml.dump(data, default_flow_style=False, allow_unicode=True)
         
         if self.color:
+            from rich.syntax import Syntax
             syntax = Syntax(yaml_str, "yaml", theme="monokai")
             return syntax
         return yaml_str
@@ -85,6 +99,7 @@ class TableFormatter(OutputFormatter):
     def _format_dict(self, data: Dict[str, Any]) -> str:
         """Format a dictionary as a key-value table."""
         if self.color:
+            from rich.table import Table
             table = Table(show_header=False, box=None)
             table.add_column("Key", style="cyan", no_wrap=True)
             table.add_column("Value")
@@ -94,6 +109,7 @@ class TableFormatter(OutputFormatter):
             
             return table
         else:
+            from tabulate import tabulate
             rows = [[key, self._format_value(value)] for key, value in data.items()]
             return tabulate(rows, headers=["Key", "Value"], tablefmt="simple")
     
@@ -104,23 +120,33 @@ class TableFormatter(OutputFormatter):
         
         # Extract headers from first item
         headers = list(data[0].keys())
+        # Bound once, as these run for every cell
+        format_value = self._format_value
+        
+        if len(data) > MAX_TABLE_ROWS:
+            # Both Rich and tabulate measure every cell to size the columns,
+            # which dominates for long listings; write tab-separated rows
+            lines = ["\t".join(headers)]
+            lines.extend(
+                "\t".join([format_value(item.get(h, "")) for h in headers])
+                for item in data
+            )
+            return "\n".join(lines)
         
         if self.color:
+            from rich.table import Table
             table = Table()
             for header in headers:
                 table.add_column(header, style="cyan")
             
+            add_row = table.add_row
             for item in data:
-                row = [self._format_value(item.get(h, "")) for h in headers]
-                table.add_row(*row)
+                add_row(*[format_value(item.get(h, "")) for h in headers])
             
             return table
         else:
-            rows = []
-            for item in data:
-                row = [self._format_value(item.get(h, "")) for h in headers]
-                rows.append(row)
-            
+            from tabulate import tabulate
+            rows = [[format_value(item.get(h, "")) for h in headers] for item in data]
             return tabulate(rows, headers=headers, tablefmt="grid")
     
     def _format_list(self, data: List[Any]) -> str:
@@ -137,7 +163,7 @@ class TableFormatter(OutputFormatter):
         elif isinstance(value, bool):
             return "✓" if value else "✗" if self.color else str(value)
         elif isinstance(value, (list, dict)):
-            return json.dumps(value, default=str)
+            return dumps(value)
         elif isinstance(value, datetime):
             return value.strftime("%Y-%m-%d %H:%M:%S")
         else:
@@ -159,45 +185,127 @@ class TextFormatter(OutputFormatter):
     def _format_dict(self, data: Dict[str, Any], indent: int = 0) -> str:
         """Format a dictionary as plain text."""
         lines = []
+        self._write_dict(data, lines.append, indent)
+        return "\n".join(lines)
+    
+    def _write_dict(
+        self,
+        data: Dict[str, Any],
+        write: Callable[[str], Any],
+        indent: int = 0
+    ) -> None:
+        """Write a dictionary as plain text, one line per ``write`` call.
+        
+        Nested values are written through the same ``write``, so the text
+        is joined once at the top instead of at every level.
+        """
+        # An empty mapping renders as a blank line
+        if not data:
+            write("")
+            return
+        
         indent_str = "  " * indent
         
         for key, value in data.items():
             if isinstance(value, dict):
-                lines.append(f"{indent_str}{key}:")
-                lines.append(self._format_dict(value, indent + 1))
+                write(f"{indent_str}{key}:")
+                self._write_dict(value, write, indent + 1)
             elif isinstance(value, list):
-                lines.append(f"{indent_str}{key}:")
+                write(f"{indent_str}{key}:")
                 for item in value:
                     if isinstance(item, dict):
-                        lines.append(self._format_dict(item, indent + 1))
+                        self._write_dict(item, write, indent + 1)
                     else:
-                        lines.append(f"{indent_str}  - {item}")
+                        write(f"{indent_str}  - {item}")
             else:
-                lines.append(f"{indent_str}{key}: {value}")
-        
-        return "\n".join(lines)
+                write(f"{indent_str}{key}: {value}")
     
     def _format_list(self, data: List[Any]) -> str:
         """Format a list as plain text."""
         lines = []
+        write = lines.append
         
         for i, item in enumerate(data):
             if isinstance(item, dict):
-                lines.append(f"\n--- Item {i + 1} ---")
-                lines.append(self._format_dict(item))
+                write(f"\n--- Item {i + 1} ---")
+                self._write_dict(item, write)
             else:
-                lines.append(f"{i + 1}. {item}")
+                write(f"{i + 1}. {item}")
         
         return "\n".join(lines)
 
 
+_fragment_text = itemgetter("plain_text")
+
+
+def _plain_text(rich_text: List[Dict[str, Any]]) -> str:
+    """Extract plain text from rich text array."""
+    if not rich_text:
+        return ""
+    # The API always includes plain_text; fall back for hand-built fragments
+    try:
+        return "".join(map(_fragment_text, rich_text))
+    except KeyError:
+        return "".join([t.get("plain_text", "") for t in rich_text])
+
+
+def _option_names(prop: Dict[str, Any]) -> Dict[str, Any]:
+    """Option names of a select or multi-select schema property."""
+    return {"options": [opt.get("name") for opt in prop.get(prop["type"], {}).get("options", [])]}
+
+
+# Readable value of a page property, by property type. Types not listed are
+# passed through as-is.
+_PROPERTY_VALUES = {
+    "title": lambda p: _plain_text(p.get("title", [])),
+    "rich_text": lambda p: _plain_text(p.get("rich_text", [])),
+    "number": lambda p: p.get("number"),
+    "select": lambda p: (p.get("select") or {}).get("name"),
+    "multi_select": lambda p: [s.get("name") for s in p.get("multi_select", [])],
+    "date": lambda p: (p.get("date") or {}).get("start"),
+    "checkbox": lambda p: p.get("checkbox", False),
+    "url": lambda p: p.get("url"),
+    "email": lambda p: p.get("email"),
+    "phone_number": lambda p: p.get("phone_number"),
+    "relation": lambda p: [r.get("id") for r in p.get("relation", [])],
+    "people": lambda p: [u.get("name", u.get("id")) for u in p.get("people", [])],
+}
+
+# Extra fields shown for database schema properties, by property type
+_SCHEMA_DETAILS = {
+    "select": _option_names,
+    "multi_select": _option_names,
+    "relation": lambda p: {"database_id": p.get("relation", {}).get("database_id")},
+}
+
+
+def _file_url(data: Dict[str, Any]) -> str:
+    """URL of a file block's hosted or external file."""
+    return data.get(data.get("type"), {}).get("url", "")
+
+
+# Content of blocks without rich text or a caption, by block type. Other
+# types are shown as a "[type block]" placeholder.
+_BLOCK_CONTENT = {
+    "code": lambda d: f"[{d.get('language', 'plain')}] {_plain_text(d.get('rich_text', []))}",
+    "image": _file_url,
+    "video": _file_url,
+    "file": _file_url,
+    "pdf": _file_url,
+}
+
+
 class NotionDataFormatter:
     """Specialized formatter for Notion data structures."""
     
     def __init__(self, formatter: OutputFormatter):
         """Initialize with a base formatter."""
         self.formatter = formatter
-        self.console = formatter.console
+    
+    @property
+    def console(self) -> "Console":
+        """The base formatter's console."""
+        return self.formatter.console
     
     def format_page(self, page: Dict[str, Any]) -> Any:
         """Format a Notion page."""
@@ -234,29 +342,37 @@ class NotionDataFormatter:
     
     def format_search_results(self, results: List[Dict[str, Any]]) -> Any:
         """Format search results."""
-        simplified = []
+        # Pages from one database share a schema, so the title property
+        # found for one page is tried first for the next
+        title_name = None
         
-        for result in results:
-            item = {
+        def page_title(props: Dict[str, Any]) -> str:
+            nonlocal title_name
+            title_prop = props.get(title_name)
+            if title_prop is None or title_prop.get("type") != "title":
+                title_name, title_prop = next(
+                    ((name, prop) for name, prop in props.items() if prop.get("type") == "title"),
+                    (title_name, None)
+                )
+            if title_prop is None:
+                return "Untitled"
+            return self._get_title_from_property(title_prop)
+        
+        rich_text_title = self._get_title_from_rich_text
+        simplified = [
+            {
                 "type": result.get("object"),
                 "id": result.get("id"),
                 "url": result.get("url"),
                 "last_edited": result.get("last_edited_time", "")[:10],  # Date only
+                "title": (
+                    rich_text_title(result.get("title", []))
+                    if result["object"] == "database"
+                    else page_title(result.get("properties", {}))
+                ),
             }
-            
-            # Extract title
-            if result["object"] == "database":
-                item["title"] = self._get_title_from_rich_text(result.get("title", []))
-            else:  # page
-                props = result.get("properties", {})
-                for prop_value in props.values():
-                    if prop_value.get("type") == "title":
-                        item["title"] = self._get_title_from_property(prop_value)
-                        break
-                else:
-                    item["title"] = "Untitled"
-            
-            simplified.append(item)
+            for result in results
+        ]
         
         return self.formatter.format(simplified)
     
@@ -283,36 +399,8 @@ class NotionDataFormatter:
         simplified = {}
         
         for name, prop in properties.items():
-            prop_type = prop.get("type")
-            
-            if prop_type == "title":
-                simplified[name] = self._get_title_from_property(prop)
-            elif prop_type == "rich_text":
-                simplified[name] = self._get_text_from_rich_text(prop.get("rich_text", []))
-            elif prop_type == "number":
-                simplified[name] = prop.get("number")
-            elif prop_type == "select":
-                select = prop.get("select")
-                simplified[name] = select.get("name") if select else None
-            elif prop_type == "multi_select":
-                simplified[name] = [s.get("name") for s in prop.get("multi_select", [])]
-            elif prop_type == "date":
-                date = prop.get("date")
-                simplified[name] = date.get("start") if date else None
-            elif prop_type == "checkbox":
-                simplified[name] = prop.get("checkbox", False)
-            elif prop_type == "url":
-                simplified[name] = prop.get("url")
-            elif prop_type == "email":
-                simplified[name] = prop.get("email")
-            elif prop_type == "phone_number":
-                simplified[name] = prop.get("phone_number")
-            elif prop_type == "relation":
-                simplified[name] = [r.get("id") for r in prop.get("relation", [])]
-            elif prop_type == "people":
-                simplified[name] = [p.get("name", p.get("id")) for p in prop.get("people", [])]
-            else:
-                simplified[name] = prop
+            extract = _PROPERTY_VALUES.get(prop.get("type"))
+            simplified[name] = extract(prop) if extract else prop
         
         return simplified
     
@@ -321,23 +409,16 @@ class NotionDataFormatter:
         simplified = {}
         
         for name, prop in properties.items():
+            prop_type = prop.get("type")
             simplified[name] = {
-                "type": prop.get("type"),
+                "type": prop_type,
                 "id": prop.get("id")
             }
             
             # Add type-specific info
-            if prop["type"] == "select":
-                simplified[name]["options"] = [
-                    opt.get("name") for opt in prop.get("select", {}).get("options", [])
-                ]
-            elif prop["type"] == "multi_select":
-                simplified[name]["options"] = [
-                    opt.get("name") for opt in prop.get("multi_select", {}).get("options", [])
-                ]
-            elif prop["type"] == "relation":
-                rel = prop.get("relation", {})
-                simplified[name]["database_id"] = rel.get("database_id")
+            details = _SCHEMA_DETAILS.get(prop_type)
+            if details:
+                simplified[name].update(details(prop))
         
         return simplified
     
@@ -360,9 +441,7 @@ class NotionDataFormatter:
     
     def _get_text_from_rich_text(self, rich_text: List[Dict[str, Any]]) -> str:
         """Extract plain text from rich text array."""
-        if not rich_text:
-            return ""
-        return "".join([t.get("plain_text", "") for t in rich_text])
+        return _plain_text(rich_text)
     
     def _extract_block_content(self, block: Dict[str, Any]) -> str:
         """Extract content from a block."""
@@ -374,18 +453,26 @@ class NotionDataFormatter:
             return self._get_text_from_rich_text(block_data.get("rich_text", []))
         elif "caption" in block_data:
             return self._get_text_from_rich_text(block_data.get("caption", []))
-        elif block_type == "code":
-            return f"[{block_data.get('language', 'plain')}] {self._get_text_from_rich_text(block_data.get('rich_text', []))}"
-        elif block_type in ["image", "video", "file", "pdf"]:
-            file_data = block_data.get(block_data.get("type"), {})
-            return file_data.get("url", "")
-        else:
-            return f"[{block_type} block]"
+        
+        extract = _BLOCK_CONTENT.get(block_type)
+        return extract(block_data) if extract else f"[{block_type} block]"
+
 
+_FORMATTERS = {
+    "json": JSONFormatter,
+    "yaml": YAMLFormatter,
+    "table": TableFormatter,
+    "text": TextFormatter,
+}
 
+
+@lru_cache(maxsize=8)
 def get_formatter(format_type: str, color: bool = True) -> OutputFormatter:
     """Get a formatter instance by type.
     
+    Formatters hold no per-call state, so one instance (and its console)
+    is shared by every caller asking for the same type and color setting.
+    
     Args:
         format_type: One of 'json', 'yaml', 'table', 'text'
         color: Whether to use colored output
@@ -393,12 +480,5 @@ def get_formatter(format_type: str, color: bool = True) -> OutputFormatter:
     Returns:
         Formatter instance
     """
-    formatters = {
-        "json": JSONFormatter,
-        "yaml": YAMLFormatter,
-        "table": TableFormatter,
-        "text": TextFormatter,
-    }
-    
-    formatter_class = formatters.get(format_type.lower(), JSONFormatter)
-    return formatter_class(color=color)
\ No newline at end of file
+    formatter_class = _FORMATTERS.get(format_type.lower(), JSONFormatter)
+    return formatter_class(color=color)
@@ -0,0 +1,71 @@
+"""Opt-in on-disk cache for read-only Notion API responses."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .jsonio import dumps, loads
+from .utils import cache_dir
+
+
+def default_cache_path() -> Path:
+    """Location of the response cache, in the CLI's cache directory."""
+    return cache_dir() / "responses.sqlite"
+
+
+class ResponseCache:
+    """API responses stored in SQLite, keyed by endpoint and parameters.
+    
+    Notion has no conditional requests, so entries are trusted for a
+    caller-chosen time to live rather than revalidated.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        """Open (creating if needed) the cache database.
+        
+        Args:
+            path: Database file. Defaults to :func:`default_cache_path`.
+        """
+        self.path = path or default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Paginated reads may be prefetched from a worker thread
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, stored REAL NOT NULL, body TEXT NOT NULL)"
+        )
+    
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Cache key for a request, stable across runs and JSON backends."""
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode()
+        ).hexdigest()
+    
+    def get(self, key: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """Return the response stored under ``key`` if it is under ``ttl`` seconds old."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stored, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[0] > ttl:
+            return None
+        return loads(row[1])
+    
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """Store a response under ``key``."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, time.time(), dumps(response))
+            )
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
@@ -1,8 +1,10 @@
 """Interactive mode for Notion CLI."""
 
 import click
+import re
 import shlex
-from typing import Optional, List
+from bisect import bisect_left
+from typing import Iterator, List
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import WordCompleter, Completer, Completion
 from prompt_toolkit.history import FileHistory
@@ -11,57 +13,85 @@ from prompt_toolkit.styles import Style
 from rich.console import Console
 from pathlib import Path
 
-from .client import NotionClient
+from .client import NotionClient, RATE_LIMIT
 from .config import Config
+from .ratelimit import TokenBucket
 from .utils import handle_error
 
 
 console = Console()
 
+# Characters that make shlex parse a line differently from str.split
+_NEEDS_SHLEX = re.compile(r"[\"'\\]")
+
+_SESSION_STYLE = Style.from_dict({
+    'prompt': '#00aa00 bold',
+})
+_PROMPT_STYLE = Style.from_dict({'': '#00aa00'})
+
+
+# Commands offered by the completer: top-level names map to their options,
+# or for command groups to a dict of subcommand options
+_COMMANDS = {
+    "search": ["--type", "--limit", "--sort", "--output"],
+    "page": {
+        "get": ["--output"],
+        "create": [
+            "--title", "--parent", "--property", "--content", "--icon", "--cover", "--output"
+        ],
+        "update": ["--title", "--property", "--archived", "--icon", "--cover", "--output"],
+        "delete": ["--confirm"],
+        "search": ["--limit", "--output"],
+        "export": ["--format", "--output-file", "--include-children"]
+    },
+    "database": {
+        "list": ["--output"],
+        "get": ["--output"],
+        "query": ["--filter", "--sort", "--limit", "--output"],
+        "create-page": ["--property", "--output"],
+        "export": ["--format", "--output-file", "--filter"],
+        "create": ["--parent", "--title", "--schema", "--output"]
+    },
+    "block": {
+        "children": ["--limit", "--output"],
+        "append": [
+            "--text", "--heading", "--bullet", "--number", "--todo", "--code", "--quote",
+            "--divider", "--output"
+        ],
+        "update": ["--text", "--checked", "--output"],
+        "delete": ["--confirm"]
+    },
+    "config": {
+        "init": [],
+        "show": ["--output"],
+        "set": [],
+        "get": [],
+        "unset": ["--confirm"],
+        "path": [],
+        "edit": ["--editor"]
+    },
+    "bulk": ["--filter", "--set", "--output", "--dry-run"],
+    "help": [],
+    "exit": [],
+    "quit": [],
+    "clear": []
+}
+
+# Sorted names, so prefix matches can be found by bisection
+_NAMES = sorted(_COMMANDS)
+_SUBCOMMAND_NAMES = {
+    cmd: sorted(subcmds)
+    for cmd, subcmds in _COMMANDS.items()
+    if isinstance(subcmds, dict)
+}
+_ALL_COMMANDS = tuple(Completion(cmd, start_position=0) for cmd in _NAMES)
+
 
 class NotionCompleter(Completer):
     """Custom completer for Notion CLI commands."""
     
     def __init__(self):
-        self.commands = {
-            "search": ["--type", "--limit", "--sort", "--output"],
-            "page": {
-                "get": ["--output"],
-                "create": ["--title", "--parent", "--property", "--content", "--icon", "--cover", "--output"],
-                "update": ["--title", "--property", "--archived", "--icon", "--cover", "--output"],
-                "delete": ["--confirm"],
-                "search": ["--limit", "--output"],
-                "export": ["--format", "--output-file", "--include-children"]
-            },
-            "database": {
-                "list": ["--output"],
-                "get": ["--output"],
-                "query": ["--filter", "--sort", "--limit", "--output"],
-                "create-page": ["--property", "--output"],
-                "export": ["--format", "--output-file", "--filter"],
-                "create": ["--parent", "--title", "--schema", "--output"]
-            },
-            "block": {
-                "children": ["--limit", "--output"],
-                "append": ["--text", "--heading", "--bullet", "--number", "--todo", "--code", "--quote", "--divider", "--output"],
-                "update": ["--text", "--checked", "--output"],
-                "delete": ["--confirm"]
-            },
-            "config": {
-                "init": [],
-                "show": ["--output"],
-                "set": [],
-                "get": [],
-                "unset": ["--confirm"],
-                "path": [],
-                "edit": ["--editor"]
-            },
-            "bulk": ["--filter", "--set", "--output", "--dry-run"],
-            "help": [],
-            "exit": [],
-            "quit": [],
-            "clear": []
-        }
+        self.commands = _COMMANDS
     
     def get_completions(self, document, complete_event):
         """Get completions based on current input."""
@@ -70,19 +100,15 @@ class NotionCompleter(Completer):
         
         if not words:
             # Complete top-level commands
-            for cmd in self.commands.keys():
-                yield Completion(cmd, start_position=0)
+            yield from _ALL_COMMANDS
         elif len(words) == 1:
             # Complete commands that start with current word
-            for cmd in self.commands.keys():
-                if cmd.startswith(words[0]):
-                    yield Completion(cmd, start_position=-len(words[0]))
+            for cmd in _starting_with(_NAMES, words[0]):
+                yield Completion(cmd, start_position=-len(words[0]))
         elif len(words) == 2 and words[0] in ["page", "database", "block", "config"]:
             # Complete subcommands
-            if isinstance(self.commands[words[0]], dict):
-                for subcmd in self.commands[words[0]].keys():
-                    if subcmd.startswith(words[1]):
-                        yield Completion(subcmd, start_position=-len(words[1]))
+            for subcmd in _starting_with(_SUBCOMMAND_NAMES[words[0]], words[1]):
+                yield Completion(subcmd, start_position=-len(words[1]))
         else:
             # Complete options
             cmd_path = words[0]
@@ -107,6 +133,14 @@ class NotionCompleter(Completer):
                         yield Completion(opt, start_position=0)
 
 
+def _starting_with(names: List[str], prefix: str) -> Iterator[str]:
+    """Names from a sorted list that start with ``prefix``."""
+    for name in names[bisect_left(names, prefix):]:
+        if not name.startswith(prefix):
+            break
+        yield name
+
+
 @click.command()
 @click.pass_context
 def interactive_mode(ctx: click.Context):
@@ -134,14 +168,16 @@ def interactive_mode(ctx: click.Context):
         history=FileHistory(str(history_file)),
         auto_suggest=AutoSuggestFromHistory(),
         completer=NotionCompleter(),
-        style=Style.from_dict({
-            'prompt': '#00aa00 bold',
-        })
+        style=_SESSION_STYLE
     )
     
     # Initialize client once
     try:
-        client = NotionClient(config.api_key)
+        client = NotionClient(
+            config.api_key,
+            verify=True,
+            rate_limiter=ctx.obj.setdefault("rate_limiter", TokenBucket(RATE_LIMIT))
+        )
     except Exception as e:
         console.print(f"[red]Failed to initialize Notion client: {e}[/red]")
         return
@@ -153,14 +189,17 @@ def interactive_mode(ctx: click.Context):
     while True:
         try:
             # Get input
-            command_line = session.prompt("notion> ", style=Style.from_dict({'': '#00aa00'}))
+            command_line = session.prompt("notion> ", style=_PROMPT_STYLE)
             
             if not command_line.strip():
                 continue
             
-            # Parse command
+            # Parse command; only quoted or escaped input needs shlex
             try:
-                args = shlex.split(command_line)
+                if _NEEDS_SHLEX.search(command_line):
+                    args = shlex.split(command_line)
+                else:
+                    args = command_line.split()
             except ValueError as e:
                 console.print(f"[red]Invalid command: {e}[/red]")
                 continue
@@ -188,6 +227,11 @@ def interactive_mode(ctx: click.Context):
             except SystemExit:
                 # Catch system exit from Click
                 pass
+            except click.ClickException as e:
+                # Usage errors are reported and the session carries on
+                e.show()
+            except click.Abort:
+                console.print("Aborted!")
             except Exception as e:
                 handle_error(e, config.get("debug", False))
             
@@ -0,0 +1,39 @@
+"""JSON encoding and decoding that uses orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document.
+    
+    Args:
+        data: UTF-8 encoded bytes or a string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> str:
+    """Encode data as a JSON string.
+    
+    Values JSON cannot represent are converted with ``str``; non-ASCII
+    text is written as-is rather than escaped.
+    
+    Args:
+        data: Data to encode
+        indent: Pretty-print with two-space indentation
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option).decode()
+    return json.dumps(data, indent=2 if indent else None, default=str, ensure_ascii=False)
@@ -0,0 +1,94 @@
+"""Client-side rate limiting and retry helpers for the Notion API."""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+import httpx
+from notion_client.errors import APIResponseError
+
+# Longest Retry-After honoured, matching the SDK's own retry cap
+MAX_RETRY_AFTER = 60.0
+
+
+class TokenBucket:
+    """Token bucket shared by the sync and async request paths.
+    
+    Each request takes one token; tokens refill continuously at ``rate``
+    per second up to ``capacity``. Callers that find the bucket empty sleep
+    until their token is due instead of hitting the API and getting a 429.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size. Defaults to ``rate``.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def aacquire(self) -> None:
+        """Async variant of :meth:`acquire`."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def is_retryable(error: Exception, idempotent: bool = True) -> bool:
+    """Whether a failed request is worth retrying.
+    
+    Rate limited requests and failed connections never reached Notion, so
+    they are always retried. Server errors are only retried for idempotent
+    requests; a create may have gone through before the error came back.
+    """
+    if isinstance(error, httpx.ConnectError):
+        return True
+    return isinstance(error, APIResponseError) and (
+        error.status == 429 or (idempotent and error.status >= 500)
+    )
+
+
+def retry_delay(error: Exception, attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Seconds to wait before retrying a failed request.
+    
+    Uses the server's Retry-After header when present, up to
+    ``MAX_RETRY_AFTER``, otherwise exponential backoff with full jitter.
+    
+    Args:
+        error: Exception raised by the failed attempt
+        attempt: Number of attempts made so far, starting at 1
+        base: Backoff for the first retry
+        cap: Upper bound on the backoff
+    """
+    headers = getattr(error, "headers", None) or {}
+    retry_after = headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
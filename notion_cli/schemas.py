@@ -0,0 +1,83 @@
+"""Typed shapes of the Notion API objects used by the CLI.
+
+These are ``TypedDict`` definitions: responses are still plain dicts at
+runtime, so they cost nothing to use, but annotating with them lets type
+checkers catch misspelled keys in Notion-facing code. Only the fields the
+CLI reads are listed.
+"""
+
+from typing import Any, Dict, List, Optional, TypedDict
+
+
+class RichText(TypedDict, total=False):
+    """A rich text fragment."""
+    type: str
+    plain_text: str
+    href: Optional[str]
+    annotations: Dict[str, Any]
+    text: Dict[str, Any]
+
+
+class Parent(TypedDict, total=False):
+    """Parent reference of a page, database or block."""
+    type: str
+    page_id: str
+    database_id: str
+    block_id: str
+    workspace: bool
+
+
+class Page(TypedDict, total=False):
+    """A page object."""
+    object: str
+    id: str
+    created_time: str
+    last_edited_time: str
+    archived: bool
+    url: str
+    parent: Parent
+    properties: Dict[str, Dict[str, Any]]
+    icon: Optional[Dict[str, Any]]
+    cover: Optional[Dict[str, Any]]
+
+
+class Database(TypedDict, total=False):
+    """A database object."""
+    object: str
+    id: str
+    created_time: str
+    last_edited_time: str
+    archived: bool
+    url: str
+    parent: Parent
+    title: List[RichText]
+    description: List[RichText]
+    properties: Dict[str, Dict[str, Any]]
+    is_inline: bool
+
+
+class Block(TypedDict, total=False):
+    """A block object. Type-specific content lives under the key named by ``type``."""
+    object: str
+    id: str
+    type: str
+    has_children: bool
+    archived: bool
+    parent: Parent
+
+
+class User(TypedDict, total=False):
+    """A user object."""
+    object: str
+    id: str
+    type: str
+    name: Optional[str]
+    avatar_url: Optional[str]
+
+
+class ListResponse(TypedDict):
+    """One page of results from a paginated endpoint."""
+    object: str
+    results: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+    has_more: bool
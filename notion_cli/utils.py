@@ -1,28 +1,91 @@
 """Utility functions for Notion CLI."""
 
+import os
+import stat
 import sys
-from typing import Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+import tempfile
+import traceback
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterator, Mapping, Tuple
 
-from .formatters import get_formatter, NotionDataFormatter
+import click
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from .client import NotionClient
+    from .formatters import NotionDataFormatter, OutputFormatter
+
+
+def cache_dir() -> Path:
+    """Directory for the CLI's caches, under ``$XDG_CACHE_HOME`` if set."""
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "notion-cli"
+
+
+@contextmanager
+def atomic_write(path: str, **open_kwargs: Any) -> Iterator[IO[str]]:
+    """Open a file that replaces ``path`` only once writing succeeds.
+    
+    Output goes to a temporary file in the same directory, which is renamed
+    over ``path`` at the end, so an error partway through leaves any
+    existing file untouched. Keyword arguments are passed to :func:`open`.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".notion-cli-", suffix=".tmp"
+    )
+    try:
+        with open(fd, "w", **open_kwargs) as f:
+            yield f
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Rich console shared by the CLI, created on first use."""
+    from rich.console import Console
+    return Console()
+
+
+# NotionDataFormatter method for each single Notion object type
+_OBJECT_FORMATTERS = {
+    "page": "format_page",
+    "database": "format_database",
+}
+
+
+@lru_cache(maxsize=16)
+def _get_formatters(format_type: str, color: bool) -> "Tuple[OutputFormatter, NotionDataFormatter]":
+    """Base and Notion-aware formatters for an output format, built once each."""
+    from .formatters import get_formatter, NotionDataFormatter
+    
+    formatter = get_formatter(format_type, color)
+    return formatter, NotionDataFormatter(formatter)
 
 
 def print_output(data: Any, format_type: str, color: bool = True) -> None:
     """Print data in the specified format."""
-    formatter = get_formatter(format_type, color)
-    notion_formatter = NotionDataFormatter(formatter)
+    formatter, notion_formatter = _get_formatters(format_type, color)
     
     # Determine the type of data and format appropriately
     if isinstance(data, dict):
-        if data.get("object") == "page":
-            output = notion_formatter.format_page(data)
-        elif data.get("object") == "database":
-            output = notion_formatter.format_database(data)
-        elif data.get("object") == "list":
+        kind = data.get("object")
+        method = _OBJECT_FORMATTERS.get(kind)
+        if method is not None:
+            output = getattr(notion_formatter, method)(data)
+        elif kind == "list":
             # Handle paginated results
             results = data.get("results", [])
             if results and results[0].get("object") == "block":
@@ -40,21 +103,71 @@ def print_output(data: Any, format_type: str, color: bool = True) -> None:
     else:
         output = formatter.format(data)
     
-    if hasattr(output, "__rich__"):
-        console.print(output)
-    else:
+    if isinstance(output, str):
         print(output)
+    else:
+        # Rich renderables (Syntax, Table, Panel, ...)
+        get_console().print(output)
+
+
+def get_client(ctx: click.Context) -> "NotionClient":
+    """Return the NotionClient shared by every command run with this context.
+    
+    The client is created on first use and kept in ``ctx.obj``, so commands
+    dispatched from interactive mode reuse one connection pool. It is
+    closed and replaced if the configured API key changes; the replacement
+    keeps drawing on the same rate limiter, ``ctx.obj["rate_limiter"]``.
+    """
+    from .client import NotionClient, RATE_LIMIT
+    from .ratelimit import TokenBucket
+    
+    api_key = ctx.obj["config"].api_key
+    client = ctx.obj.get("client")
+    if client is None or (api_key and client.auth != api_key):
+        if client is not None:
+            client.close()
+        rate_limiter = ctx.obj.setdefault("rate_limiter", TokenBucket(RATE_LIMIT))
+        client = ctx.obj["client"] = NotionClient(api_key, rate_limiter=rate_limiter)
+    return client
+
+
+def page_title(page: Mapping[str, Any], default: str = "Untitled") -> str:
+    """Return the plain text of a page's title property.
+    
+    Only the first rich text fragment is used, matching what Notion shows
+    in compact listings.
+    """
+    for prop in page.get("properties", {}).values():
+        if prop.get("type") == "title":
+            title_arr = prop.get("title")
+            if title_arr:
+                return title_arr[0].get("plain_text", default)
+            return default
+    return default
 
 
 def handle_error(e: Exception, debug: bool = False) -> None:
     """Handle and display errors."""
+    # Usage errors, aborted prompts and ctx.exit() are click's own control
+    # flow; let click report them and set the exit code
+    if isinstance(e, (click.ClickException, click.Abort, click.exceptions.Exit)):
+        raise e
+    
     if debug:
-        console.print_exception()
+        # Rich's highlighted traceback is only worth rendering for a person
+        # at a terminal; logs and pipes get the standard one
+        if sys.stderr.isatty():
+            get_console().print_exception()
+        else:
+            traceback.print_exc()
     else:
+        from rich.panel import Panel
+        from rich.text import Text
+        
         error_panel = Panel(
             Text(str(e), style="red"),
             title="Error",
             border_style="red"
         )
-        console.print(error_panel)
+        get_console().print(error_panel)
     sys.exit(1)
\ No newline at end of file
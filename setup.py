@@ -7,7 +7,7 @@ with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+    requirements = [line for line in map(str.strip, fh) if line and not line.startswith("#")]
 
 setup(
     name="notion-cli",
@@ -35,6 +35,18 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "http2": [
+            "h2>=4.0.0",
+        ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
+        "arrow": [
+            "pyarrow>=14.0.0",
+        ],
+        "excel": [
+            "xlsxwriter>=3.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
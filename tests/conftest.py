@@ -6,6 +6,13 @@ from notion_cli.client import NotionClient
 from notion_cli.config import Config
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the CLI's caches out of the real home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "notion-cli"
+
+
 @pytest.fixture
 def mock_notion_client():
     """Mock Notion client for testing."""
@@ -47,9 +54,9 @@ def mock_config():
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_page_data():
-    """Sample page data for testing."""
+    """Sample page data for testing, shared by tests that only read it."""
     return {
         "object": "page",
         "id": "550dc4b7-6cdb-4a73-8a90-b86b3a8c9b06",
@@ -80,9 +87,9 @@ def test_page_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_database_data():
-    """Sample database data for testing."""
+    """Sample database data for testing, shared by tests that only read it."""
     return {
         "object": "database",
         "id": "897e5a76-ae52-4b48-9fdf-e71f5945d1af",
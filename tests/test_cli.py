@@ -0,0 +1,973 @@
+"""Tests for the top-level CLI group."""
+
+import asyncio
+import click
+import csv
+import httpx
+import json
+import pytest
+import os
+import subprocess
+import sys
+from unittest.mock import AsyncMock, patch
+from click.testing import CliRunner
+from notion_client.errors import APIResponseError
+from notion_cli.cli import cli, LazyGroup, LAZY_SUBCOMMANDS, _get_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Do not share memoized configs (and their env overrides) between tests."""
+    _get_config.cache_clear()
+    yield
+    _get_config.cache_clear()
+
+
+class TestLazyGroup:
+    """Test lazily loaded subcommands."""
+    
+    def test_list_commands(self):
+        """Test that lazy and eagerly registered commands are listed."""
+        ctx = click.Context(cli)
+        commands = cli.list_commands(ctx)
+        
+        assert "bulk" in commands
+        for name in LAZY_SUBCOMMANDS:
+            assert name in commands
+    
+    def test_get_command(self):
+        """Test resolving a lazy subcommand."""
+        ctx = click.Context(cli)
+        command = cli.get_command(ctx, "page")
+        
+        assert isinstance(command, click.Group)
+        assert command.name == "page"
+        assert cli.get_command(ctx, "missing") is None
+    
+    def test_help_lists_subcommands(self):
+        """Test that --help shows lazily loaded subcommands."""
+        result = CliRunner().invoke(cli, ["--help"])
+        
+        assert result.exit_code == 0
+        assert "database" in result.output
+        assert "interactive-mode" in result.output
+    
+    def test_help_skips_unresolvable_lazy_command(self):
+        """Test --help leaves out a lazy subcommand that resolves to None."""
+        group = LazyGroup(
+            name="notion",
+            lazy_subcommands={**LAZY_SUBCOMMANDS, "broken": "notion_cli.cli:__doc__"},
+        )
+        
+        with patch("notion_cli.cli.__doc__", None):
+            result = CliRunner().invoke(group, ["--help"])
+        
+        assert result.exit_code == 0, result.output
+        assert "database" in result.output
+        assert "broken" not in result.output
+    
+    def test_help_cache_is_reused_until_a_module_changes(self, isolated_cache_dir):
+        """Test a second --help is served from the cache until a command module changes."""
+        import notion_cli.commands.database as database_module
+        
+        def invoke_help():
+            with patch.object(cli, "get_command", wraps=cli.get_command) as get_command:
+                result = CliRunner().invoke(cli, ["--help"])
+            assert result.exit_code == 0
+            assert "Manage Notion databases." in result.output
+            # Lazy subcommands whose modules had to be looked up
+            return sum(c.args[1] in LAZY_SUBCOMMANDS for c in get_command.call_args_list)
+        
+        assert invoke_help() > 0
+        assert (isolated_cache_dir / "commands.json").exists()
+        assert invoke_help() == 0
+        
+        path = database_module.__file__
+        stat = os.stat(path)
+        try:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert invoke_help() > 0
+        finally:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    
+    def test_help_uses_cached_command_list(self, tmp_path):
+        """Test --help lists subcommands from the cache without importing them."""
+        code = (
+            "import sys; from notion_cli.cli import cli\n"
+            "try:\n    cli(['--help'], obj={})\n"
+            "except SystemExit:\n    pass\n"
+            "print('notion_cli.commands.database' in sys.modules)"
+        )
+        env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path)}
+        outputs = [
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+            ).stdout
+            for _ in range(2)
+        ]
+        
+        assert outputs[0].endswith("True\n")
+        assert outputs[1] == outputs[0].replace("True\n", "False\n")
+        assert "Manage Notion databases." in outputs[1]
+        assert (tmp_path / "notion-cli" / "commands.json").exists()
+    
+    def test_import_does_not_load_client(self):
+        """Test importing the CLI and command modules skips httpx, rich, tabulate and yaml."""
+        code = (
+            "import sys, notion_cli.cli, notion_cli.commands.block, notion_cli.commands.page; "
+            "print(any(m in sys.modules "
+            "for m in ('httpx', 'rich', 'yaml', 'tabulate', 'notion_cli.client')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        
+        assert result.stdout.strip() == "False"
+
+
+class TestConfigLoading:
+    """Test config loading for the top-level group."""
+    
+    def test_config_is_loaded_once_per_path(self, tmp_path):
+        """Test repeated invocations reuse the config loaded for a path."""
+        config_path = str(tmp_path / "config.yaml")
+        objs = [{}, {}]
+        
+        with patch("notion_cli.cli.Config") as mock_config:
+            for obj in objs:
+                CliRunner().invoke(cli, ["--config", config_path], obj=obj)
+        
+        mock_config.assert_called_once()
+        assert objs[0]["config"] is objs[1]["config"]
+
+
+class TestBulk:
+    """Test the bulk command."""
+    
+    def test_dry_run_lists_matching_pages(self):
+        """Test --dry-run reports matches without updating anything."""
+        pages = [
+            {
+                "id": f"page-{i}",
+                "properties": {"Name": {"type": "title", "title": [{"plain_text": f"Page {i}"}]}}
+            }
+            for i in range(7)
+        ]
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.search.return_value = {"results": pages, "has_more": False}
+            
+            result = CliRunner().invoke(
+                cli,
+                ["bulk", "-f", "Name=x", "-s", "Status=Done", "--dry-run"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 0
+        assert result.output.startswith("Would update 7 pages:\n  - Page 0 (page-0)\n")
+        assert "  ... and 2 more" in result.output
+        assert "Updates to apply: {'Status': 'Done'}" in result.output
+        mock_instance.pages.update.assert_not_called()
+    
+    def test_updates_start_while_search_streams(self):
+        """Test matches are updated before the search has returned every page."""
+        updated = []
+        updated_before_second_page = []
+        
+        async def search(**params):
+            if "start_cursor" not in params:
+                return {
+                    "results": [{"id": "page-0", "properties": {"Name": {}}}],
+                    "has_more": True,
+                    "next_cursor": "c1"
+                }
+            for _ in range(5):
+                await asyncio.sleep(0)
+            updated_before_second_page.extend(updated)
+            return {
+                "results": [
+                    {"id": "page-1", "properties": {}},
+                    {"id": "page-2", "properties": {"Name": {}}}
+                ],
+                "has_more": False
+            }
+        
+        async def update(page_id, **params):
+            updated.append(page_id)
+            return {"id": page_id}
+        
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.search = AsyncMock(side_effect=search)
+            mock_async.pages.update = AsyncMock(side_effect=update)
+            mock_async.aclose = AsyncMock()
+            
+            result = CliRunner().invoke(
+                cli,
+                ["bulk", "-f", "Name=x", "-s", "Status=Done"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 0
+        assert "Successfully updated 2 pages" in result.output
+        assert updated_before_second_page == ["page-0"]
+        assert updated == ["page-0", "page-2"]
+
+
+class TestBlockChildren:
+    """Test the block children command."""
+    
+    def test_children_of_several_blocks(self):
+        """Test children of several IDs are fetched and listed in argument order."""
+        children = {
+            "a": [{"object": "block", "id": "a1", "type": "divider"}],
+            "b": [{"object": "block", "id": "b1", "type": "divider"}],
+        }
+        
+        async def list_children(block_id, **params):
+            return {"results": children[block_id], "has_more": False}
+        
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.blocks.children.list = AsyncMock(side_effect=list_children)
+            mock_async.aclose = AsyncMock()
+            
+            result = CliRunner().invoke(
+                cli,
+                ["block", "children", "a", "b", "-o", "json"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key", "NOTION_COLOR_OUTPUT": "false"}
+            )
+        
+        assert result.exit_code == 0
+        assert result.output.index('"a1"') < result.output.index('"b1"')
+        assert mock_async.blocks.children.list.await_count == 2
+    
+    def test_children_of_one_block_uses_sync_client(self):
+        """Test a single ID is listed without starting an async client."""
+        with patch("notion_cli.client.Client") as mock_client, \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_client.return_value.blocks.children.list.return_value = {
+                "results": [{"object": "block", "id": "a1", "type": "divider"}],
+                "has_more": False,
+            }
+            
+            result = CliRunner().invoke(
+                cli,
+                ["block", "children", "a", "-o", "json"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key", "NOTION_COLOR_OUTPUT": "false"}
+            )
+        
+        assert result.exit_code == 0
+        assert '"a1"' in result.output
+        mock_async_client.assert_not_called()
+
+
+class TestBlockAppend:
+    """Test the block append command."""
+    
+    def invoke(self, args, **kwargs):
+        """Invoke block append with a mocked API, returning (result, sent children)."""
+        sent = []
+        
+        def append(block_id, children):
+            sent.extend(children)
+            return {"object": "list", "results": children}
+        
+        with patch("notion_cli.client.Client") as mock_client, \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_client.return_value.blocks.children.append.side_effect = append
+            
+            result = CliRunner().invoke(
+                cli,
+                ["block", "append", "page-123", *args],
+                obj={},
+                env={"NOTION_API_KEY": "test-key", "NOTION_COLOR_OUTPUT": "false"},
+                **kwargs
+            )
+        
+        # A single append goes through the pooled sync client
+        mock_async_client.assert_not_called()
+        return result, sent
+    
+    def test_append_builds_blocks_in_order(self):
+        """Test option-built blocks are sent in a fixed order."""
+        result, sent = self.invoke([
+            "--text", "Intro", "--heading", "2:Section", "--bullet", "One",
+            "--todo", "[x] Done", "--todo", "Open", "--code", "python:print(1)"
+        ])
+        
+        assert result.exit_code == 0
+        assert [block["type"] for block in sent] == [
+            "paragraph", "heading_2", "bulleted_list_item", "to_do", "to_do", "code"
+        ]
+        assert sent[1]["heading_2"]["rich_text"][0]["text"]["content"] == "Section"
+        assert sent[3]["to_do"] == {
+            "rich_text": [{"type": "text", "text": {"content": "Done"}}],
+            "checked": True
+        }
+        assert sent[4]["to_do"]["checked"] is False
+        assert sent[5]["code"]["language"] == "python"
+    
+    def test_append_block_specs(self):
+        """Test --block dispatches on the type and keeps the given order."""
+        result, sent = self.invoke([
+            "-B", "todo:[x] Ship", "-B", "heading:3:Later", "-B", "divider:"
+        ])
+        
+        assert result.exit_code == 0
+        assert [block["type"] for block in sent] == ["to_do", "heading_3", "divider"]
+        assert sent[0]["to_do"]["checked"] is True
+    
+    def test_append_unknown_block_type(self):
+        """Test an unknown --block type is a usage error."""
+        result, sent = self.invoke(["-B", "callout:Hi"])
+        
+        assert result.exit_code == 2
+        assert "Unknown block type 'callout'" in result.output
+    
+    def test_append_invalid_heading_is_usage_error(self):
+        """Test validation failures exit with click's usage error status."""
+        result, sent = self.invoke(["--heading", "4:Too deep"])
+        
+        assert result.exit_code == 2
+        assert "Heading level must be 1, 2, or 3" in result.output
+        assert "Traceback" not in result.output
+        assert sent == []
+    
+    def test_append_heading_level_is_parsed_as_integer(self):
+        """Test padded and zero-prefixed heading levels are accepted."""
+        result, sent = self.invoke(["-B", "heading: 1:Spaced", "-B", "heading:02:Padded"])
+        
+        assert result.exit_code == 0
+        assert [block["type"] for block in sent] == ["heading_1", "heading_2"]
+    
+    def test_append_stdin_json(self):
+        """Test pre-built blocks from stdin are appended after option blocks."""
+        result, sent = self.invoke(
+            ["--text", "Intro", "--stdin-json"],
+            input='[{"object": "block", "type": "divider", "divider": {}}]'
+        )
+        
+        assert result.exit_code == 0
+        assert [block["type"] for block in sent] == ["paragraph", "divider"]
+    
+    def test_append_stdin_json_requires_array_of_objects(self):
+        """Test --stdin-json rejects anything but a JSON array of objects."""
+        for payload in ('{"type": "divider", "divider": {}}', '["divider"]', '"text"'):
+            result, sent = self.invoke(["--stdin-json"], input=payload)
+            
+            assert result.exit_code == 2
+            assert "expects a JSON array of block objects" in result.output
+            assert sent == []
+    
+    def test_append_many_groups_by_parent(self):
+        """Test append-many keeps per-parent order and honours parent_id."""
+        sent = {}
+        
+        async def append(block_id, children):
+            sent.setdefault(block_id, []).extend(children)
+            return {"object": "list", "results": children}
+        
+        ndjson = "\n".join([
+            '{"type": "paragraph", "id": "1"}',
+            '{"type": "paragraph", "id": "2", "parent_id": "other"}',
+            "",
+            '{"type": "paragraph", "id": "3"}',
+        ])
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.blocks.children.append = AsyncMock(side_effect=append)
+            mock_async.aclose = AsyncMock()
+            
+            result = CliRunner().invoke(
+                cli,
+                ["block", "append-many", "page-123"],
+                obj={},
+                input=ndjson,
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 0
+        assert "Appended 3 blocks to 2 parents" in result.output
+        assert [b["id"] for b in sent["page-123"]] == ["1", "3"]
+        assert sent["other"] == [{"type": "paragraph", "id": "2"}]
+    
+    def test_append_many_rejects_non_object_lines(self):
+        """Test a JSON line that is neither an object nor a string is a usage error."""
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            result = CliRunner().invoke(
+                cli,
+                ["block", "append-many", "page-123"],
+                obj={},
+                input='{"type": "divider", "divider": {}}\n[1, 2]\n',
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 2
+        assert "Line 2: expected a block object" in result.output
+        mock_async_client.assert_not_called()
+
+
+class TestPageUpdate:
+    """Test the page update command."""
+    
+    def test_property_types_are_inferred(self):
+        """Test --property values become checkbox, number or rich text properties."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_update = mock_client.return_value.pages.update
+            mock_update.return_value = {"object": "page", "id": "page-1"}
+            
+            result = CliRunner().invoke(
+                cli,
+                ["page", "update", "page-1", "--title", "Plan",
+                 "--property", "Done=True", "--property", "Points=3",
+                 "--property", "Notes=a=b"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key", "NOTION_COLOR_OUTPUT": "false"}
+            )
+        
+        assert result.exit_code == 0
+        assert mock_update.call_args.kwargs["properties"] == {
+            "title": {"title": [{"type": "text", "text": {"content": "Plan"}}]},
+            "Done": {"checkbox": True},
+            "Points": {"number": 3},
+            "Notes": {"rich_text": [{"type": "text", "text": {"content": "a=b"}}]},
+        }
+    
+    def test_icon_emoji_or_url(self):
+        """Test multi-codepoint emoji stay emoji and URLs become external icons."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_update = mock_client.return_value.pages.update
+            mock_update.return_value = {"object": "page", "id": "page-1"}
+            
+            result = CliRunner().invoke(
+                cli,
+                ["page", "update", "page-1", "--icon", "👨‍💻"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key", "NOTION_COLOR_OUTPUT": "false"}
+            )
+        
+        assert result.exit_code == 0
+        assert mock_update.call_args.kwargs["icon"] == {"type": "emoji", "emoji": "👨‍💻"}
+        
+        from notion_cli.commands.page import _build_icon
+        assert _build_icon("https://example.com/a.png") == {
+            "type": "external", "external": {"url": "https://example.com/a.png"}
+        }
+
+
+class TestPageExport:
+    """Test rendering pages for page export."""
+    
+    def test_export_to_markdown(self):
+        """Test each supported block type is rendered, and others are named."""
+        from notion_cli.commands.page import export_to_markdown
+        
+        def block(block_type, text="", **data):
+            return {"type": block_type, block_type: {"rich_text": [{"plain_text": text}], **data}}
+        
+        page = {"properties": {"Name": {"type": "title", "title": [{"plain_text": "Plan"}]}}}
+        blocks = [
+            block("heading_2", "Goals"),
+            block("to_do", "Ship", checked=True),
+            block("code", "print()", language="python"),
+            block("divider"),
+            block("image"),
+        ]
+        
+        assert export_to_markdown(page, blocks).split("*URL: Unknown*\n\n")[1] == (
+            "## Goals\n\n- [x] Ship\n```python\nprint()\n```\n\n---\n\n[image block]\n\n"
+        )
+
+
+class TestPageExportCommand:
+    """Test the page export command."""
+    
+    def test_export_streams_blocks_to_file(self, tmp_path):
+        """Test child blocks from every API page are written to the output file."""
+        output_file = tmp_path / "page.md"
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.pages.retrieve.return_value = {"id": "page-1", "properties": {}}
+            mock_instance.blocks.children.list.side_effect = [
+                {
+                    "results": [{"type": "divider", "divider": {}}],
+                    "has_more": True,
+                    "next_cursor": "c1"
+                },
+                {"results": [{"type": "image", "image": {}}], "has_more": False},
+            ]
+            
+            result = CliRunner().invoke(
+                cli,
+                ["page", "export", "page-1", "--include-children", "-o", str(output_file)],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 0
+        assert output_file.read_text().endswith("*URL: Unknown*\n\n---\n\n[image block]\n\n")
+    
+    def test_export_failure_keeps_existing_file(self, tmp_path):
+        """Test an error partway through the blocks leaves the old export in place."""
+        output_file = tmp_path / "page.md"
+        output_file.write_text("old export")
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.pages.retrieve.return_value = {"id": "page-1", "properties": {}}
+            mock_instance.blocks.children.list.side_effect = [
+                {"results": [{"type": "divider", "divider": {}}], "has_more": True,
+                 "next_cursor": "c1"},
+                ValueError("connection lost"),
+            ]
+            
+            result = CliRunner().invoke(
+                cli,
+                ["page", "export", "page-1", "--include-children", "-o", str(output_file)],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 1
+        assert output_file.read_text() == "old export"
+        assert list(tmp_path.iterdir()) == [output_file]
+
+
+class TestPageCreateMany:
+    """Test the page create-many command."""
+    
+    def test_create_many(self):
+        """Test every NDJSON line becomes a page and failures are reported by line."""
+        async def create(parent, properties, **params):
+            if properties["title"]["title"][0]["text"]["content"] == "bad":
+                raise ValueError("boom")
+            return {"object": "page", "id": "new", "parent": parent, **params}
+        
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.pages.create = AsyncMock(side_effect=create)
+            mock_async.aclose = AsyncMock()
+            
+            result = CliRunner().invoke(
+                cli,
+                ["page", "create-many", "parent-1", "--parent-type", "page"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"},
+                input=(
+                    '"Plain"\n\n{"title": "bad"}\n'
+                    '{"title": "Done", "properties": {"Points": 3}, "icon": "📌"}\n'
+                )
+            )
+        
+        assert result.exit_code == 1
+        assert "Failed to create page 2: boom" in result.output
+        assert "Created 2 of 3 pages" in result.output
+        last = mock_async.pages.create.await_args_list[-1].kwargs
+        assert last["parent"] == {"page_id": "parent-1"}
+        assert last["properties"]["Points"] == {"number": 3}
+        assert last["icon"] == {"type": "emoji", "emoji": "📌"}
+    
+    def test_create_many_rejects_malformed_lines(self):
+        """Test non-object records and non-object properties name their line."""
+        for line, message in (
+            ("[1]", "Line 2: expected a page object or a title"),
+            ('{"title": "A", "properties": []}', 'Line 2: "properties" must be an object'),
+        ):
+            with patch("notion_cli.client.Client"), \
+                    patch("notion_cli.client.AsyncClient") as mock_async_client:
+                result = CliRunner().invoke(
+                    cli,
+                    ["page", "create-many", "parent-1"],
+                    obj={},
+                    env={"NOTION_API_KEY": "test-key"},
+                    input=f'"Plain"\n{line}\n'
+                )
+            
+            assert result.exit_code == 2
+            assert message in result.output
+            mock_async_client.assert_not_called()
+
+
+class TestPageDelete:
+    """Test the page delete command."""
+    
+    def test_delete_several_pages(self):
+        """Test each page is archived once and outcomes are reported per page."""
+        async def update(page_id, **params):
+            if page_id == "bad":
+                raise ValueError("boom")
+            if page_id == "old":
+                raise APIResponseError(
+                    code="validation_error",
+                    status=400,
+                    message="Can't edit block that is archived. "
+                            "You must unarchive the block before editing.",
+                    headers=httpx.Headers(),
+                    raw_body_text=""
+                )
+            return {"object": "page", "id": page_id, **params}
+        
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.pages.update = AsyncMock(side_effect=update)
+            mock_async.aclose = AsyncMock()
+            
+            result = CliRunner().invoke(
+                cli,
+                ["page", "delete", "a", "bad", "a", "old", "b", "--confirm"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 1
+        assert "Page a archived successfully" in result.output
+        assert "Failed to archive page bad: boom" in result.output
+        assert "Page b archived successfully" in result.output
+        assert "Page old is already archived" in result.output
+        assert "Archived 2, skipped 1, failed 1" in result.output
+        assert mock_async.pages.update.await_count == 4
+        assert all(
+            call.kwargs["archived"] is True
+            for call in mock_async.pages.update.await_args_list
+        )
+    
+    def test_archived_ancestor_is_a_failure(self):
+        """Test a page under an archived ancestor fails instead of being skipped."""
+        body = {
+            "object": "error",
+            "status": 400,
+            "code": "validation_error",
+            "message": "Can't edit page on block with an archived ancestor. "
+                       "You must unarchive the ancestor before editing page.",
+        }
+        
+        def handler(request):
+            return httpx.Response(400, json=body)
+        
+        from notion_cli.client import AsyncClient
+        
+        def async_client(**kwargs):
+            transport = httpx.MockTransport(handler)
+            return AsyncClient(**{**kwargs, "client": httpx.AsyncClient(transport=transport)})
+        
+        with patch("notion_cli.client.AsyncClient", side_effect=async_client):
+            result = CliRunner().invoke(
+                cli,
+                ["page", "delete", "child", "--confirm"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 1
+        assert "Failed to archive page child: Can't edit page on block" in result.output
+        assert "already archived" not in result.output
+
+
+class TestDatabaseImport:
+    """Test the database import command."""
+    
+    SCHEMA = {
+        "object": "database",
+        "id": "db-1",
+        "properties": {
+            "Name": {"type": "title"},
+            "Points": {"type": "number"},
+            "Tags": {"type": "multi_select"},
+        },
+    }
+    
+    def invoke(self, args, input):
+        """Invoke database import with a mocked API, returning (result, created properties)."""
+        created = []
+        
+        async def create(parent, properties):
+            assert parent == {"database_id": "db-1"}
+            created.append(properties)
+            return {"object": "page", "id": f"page-{len(created)}"}
+        
+        with patch("notion_cli.client.Client") as mock_client, \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_client.return_value.databases.retrieve.return_value = self.SCHEMA
+            mock_async = mock_async_client.return_value
+            mock_async.pages.create = AsyncMock(side_effect=create)
+            mock_async.aclose = AsyncMock()
+            
+            result = CliRunner().invoke(
+                cli,
+                ["database", "import", "db-1", *args],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"},
+                input=input
+            )
+        return result, created
+    
+    def test_import_csv(self):
+        """Test CSV rows become pages and bad rows fail on their own."""
+        result, created = self.invoke(
+            [], "Name,Points,Tags,Extra\nA,3,\"x, y\",1\nB,lots,,\nC,,,\n"
+        )
+        
+        assert result.exit_code == 0
+        assert result.output.count("Property 'Extra' not found") == 1
+        assert "Failed to import record 2" in result.output
+        assert "Imported 2 of 3 records" in result.output
+        assert created[0] == {
+            "Name": {"title": [{"type": "text", "text": {"content": "A"}}]},
+            "Points": {"number": 3.0},
+            "Tags": {"multi_select": [{"name": "x"}, {"name": "y"}]},
+        }
+        assert created[1] == {"Name": {"title": [{"type": "text", "text": {"content": "C"}}]}}
+    
+    def test_import_ndjson(self):
+        """Test NDJSON records are read line by line."""
+        result, created = self.invoke(
+            ["--format", "ndjson"],
+            '{"Name": "A", "Points": 1}\n\n{"Name": "B", "Tags": {"multi_select": []}}\n'
+        )
+        
+        assert result.exit_code == 0
+        assert "Imported 2 of 2 records" in result.output
+        assert created[0]["Points"] == {"number": 1.0}
+        assert created[1]["Tags"] == {"multi_select": []}
+    
+    def test_import_ndjson_non_object_fails_on_its_own(self):
+        """Test a record that is not a JSON object fails without stopping the import."""
+        result, created = self.invoke(
+            ["--format", "ndjson"],
+            '{"Name": "A"}\n[1, 2]\n{"Name": "B"}\n'
+        )
+        
+        assert result.exit_code == 0
+        assert "Failed to import record 2: expected a JSON object, got list" in result.output
+        assert "Imported 2 of 3 records" in result.output
+        assert len(created) == 2
+    
+    def test_arrow_csv_rows_match_csv_module(self, tmp_path):
+        """Test pyarrow parses CSV cells as the same strings as csv.DictReader."""
+        pytest.importorskip("pyarrow")
+        from notion_cli.commands.database import _iter_csv_arrow
+        
+        path = tmp_path / "records.csv"
+        path.write_text(
+            'Zip,Done,When,Note\n02134,true,2024-01-01,""\n00501,,2024-01-02T10:00:00,"a, b"\n',
+            encoding="utf-8"
+        )
+        
+        with open(path, newline="", encoding="utf-8") as f:
+            expected = list(csv.DictReader(f))
+        
+        assert list(_iter_csv_arrow(str(path), 1 << 20)) == expected
+        assert expected[0]["Zip"] == "02134"
+
+
+class TestDatabaseExport:
+    """Test the database export command."""
+    
+    PAGES = [
+        {
+            "id": f"page-{i}",
+            "url": f"https://notion.so/page-{i}",
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": f"Task {i}"}]},
+            },
+        }
+        for i in range(3)
+    ]
+    
+    def invoke(self, args):
+        """Invoke database export against two API pages of results."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.databases.retrieve.return_value = {
+                "object": "database", "id": "db-1", "properties": {"Name": {"type": "title"}}
+            }
+            mock_instance.databases.query.side_effect = [
+                {"results": self.PAGES[:2], "has_more": True, "next_cursor": "c1"},
+                {"results": self.PAGES[2:], "has_more": False},
+            ]
+            
+            return CliRunner().invoke(
+                cli,
+                ["database", "export", "db-1", *args],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+    
+    def test_export_csv(self):
+        """Test every queried page becomes a CSV row."""
+        result = self.invoke([])
+        
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0] == "Page ID,Name,Created Time,Last Edited Time,URL"
+        assert lines[3] == "page-2,Task 2,,,https://notion.so/page-2"
+    
+    def test_export_json_to_file(self, tmp_path):
+        """Test streamed JSON matches dumping the whole list at once."""
+        output_file = tmp_path / "export.json"
+        result = self.invoke(["--format", "json", "-o", str(output_file)])
+        
+        assert result.exit_code == 0
+        assert "Exported 3 records" in result.output
+        assert output_file.read_text() == json.dumps(self.PAGES, indent=2) + "\n"
+    
+    def test_export_failure_keeps_existing_file(self, tmp_path):
+        """Test a query error after some rows were written keeps the old export."""
+        output_file = tmp_path / "export.csv"
+        output_file.write_text("old export")
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.databases.retrieve.return_value = {"properties": {}}
+            mock_instance.databases.query.side_effect = [
+                {"results": self.PAGES[:2], "has_more": True, "next_cursor": "c1"},
+                ValueError("connection lost"),
+            ]
+            
+            result = CliRunner().invoke(
+                cli,
+                ["database", "export", "db-1", "-o", str(output_file)],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 1
+        assert output_file.read_text() == "old export"
+        assert list(tmp_path.iterdir()) == [output_file]
+    
+    def test_export_empty_leaves_file_alone(self, tmp_path):
+        """Test an empty export neither creates nor overwrites the output file."""
+        output_file = tmp_path / "export.csv"
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.databases.retrieve.return_value = {"properties": {}}
+            mock_instance.databases.query.return_value = {"results": [], "has_more": False}
+            
+            result = CliRunner().invoke(
+                cli,
+                ["database", "export", "db-1", "-o", str(output_file)],
+                obj={},
+                env={"NOTION_API_KEY": "test-key"}
+            )
+        
+        assert result.exit_code == 0
+        assert "No records to export" in result.output
+        assert not output_file.exists()
+    
+    def test_export_excel_requires_output_file(self):
+        """Test Excel export to stdout is rejected before querying."""
+        result = self.invoke(["--format", "excel"])
+        
+        assert result.exit_code == 2
+        assert "Excel export requires --output-file" in result.output
+
+
+class TestDatabaseQuery:
+    """Test the database query command."""
+    
+    def invoke(self, args):
+        """Invoke database query, returning the CLI result and the API mock."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.databases.query.return_value = {"results": [], "has_more": False}
+            
+            result = CliRunner().invoke(
+                cli,
+                ["database", "query", "db-1", *args],
+                obj={},
+                env={"NOTION_API_KEY": "test-key", "NOTION_COLOR_OUTPUT": "false"}
+            )
+            return result, mock_instance.databases.query
+    
+    def test_filters_and_sorts(self):
+        """Test filter and sort options are turned into API parameters."""
+        result, query = self.invoke(
+            ["-f", "Done=True", "-f", "Status=Open", "-s", "Due:descending"]
+        )
+        
+        assert result.exit_code == 0
+        kwargs = query.call_args.kwargs
+        assert kwargs["filter"] == {"and": [
+            {"property": "Done", "checkbox": {"equals": True}},
+            {"property": "Status", "select": {"equals": "Open"}},
+        ]}
+        assert kwargs["sorts"] == [{"property": "Due", "direction": "descending"}]
+    
+    def test_limit_stops_pagination(self):
+        """Test --limit stops requesting pages once enough results are fetched."""
+        with patch("notion_cli.client.Client") as mock_client:
+            query = mock_client.return_value.databases.query
+            query.side_effect = lambda **params: {
+                "results": [{"id": str(i)} for i in range(params["page_size"])],
+                "has_more": True,
+                "next_cursor": "next"
+            }
+            
+            result = CliRunner().invoke(
+                cli,
+                ["database", "query", "db-1", "--limit", "150", "-o", "json"],
+                obj={},
+                env={"NOTION_API_KEY": "test-key", "NOTION_COLOR_OUTPUT": "false"}
+            )
+        
+        assert result.exit_code == 0
+        assert len(json.loads(result.output)) == 150
+        assert [c.kwargs["page_size"] for c in query.call_args_list] == [100, 100]
+    
+    def test_invalid_sort_direction(self):
+        """Test an unknown sort direction is rejected before querying."""
+        result, query = self.invoke(["-s", "Due:up"])
+        
+        assert result.exit_code == 2
+        assert "Invalid sort direction: up" in result.output
+        query.assert_not_called()
+
+
+class TestConfigSetMany:
+    """Test the config set-many command."""
+    
+    def test_set_many_saves_once(self, tmp_path):
+        """Test values are converted, applied together and saved in one write."""
+        config_path = tmp_path / "config.yaml"
+        runner = CliRunner()
+        
+        with patch("notion_cli.config.Config.save", autospec=True) as mock_save:
+            result = runner.invoke(
+                cli,
+                ["--config", str(config_path), "config", "set-many",
+                 "page_size=50", "color_output=no", "output_format=table"],
+                obj={}
+            )
+        
+        assert result.exit_code == 0
+        assert mock_save.call_count == 1
+        config = mock_save.call_args.args[0]
+        assert config.page_size == 50
+        assert config.color_output is False
+        assert config.output_format == "table"
+    
+    def test_set_many_rejects_bad_values_before_saving(self, tmp_path):
+        """Test one invalid assignment leaves the configuration untouched."""
+        config_path = tmp_path / "config.yaml"
+        
+        result = CliRunner().invoke(
+            cli,
+            [
+                "--config", str(config_path),
+                "config", "set-many", "output_format=table", "page_size=lots"
+            ],
+            obj={}
+        )
+        
+        assert result.exit_code == 2
+        assert "page_size must be a number" in result.output
+        assert not config_path.exists()
@@ -1,8 +1,12 @@
 """Tests for Notion client."""
 
+import asyncio
+import httpx
 import pytest
-from unittest.mock import Mock, patch
-from notion_cli.client import NotionClient
+import time
+from unittest.mock import AsyncMock, patch
+from notion_client.errors import APIResponseError
+from notion_cli.client import CACHE_TTL, MAX_ATTEMPTS, NotionClient, _list_cursor
 
 
 class TestNotionClient:
@@ -13,7 +17,9 @@ class TestNotionClient:
         with patch("notion_cli.client.Client") as mock_client:
             client = NotionClient(auth="test-key")
             assert client.auth == "test-key"
-            mock_client.assert_called_once_with(auth="test-key")
+            mock_client.assert_called_once_with(
+                auth="test-key", client=client._http, retry=False
+            )
     
     def test_init_from_env(self):
         """Test client initialization from environment variable."""
@@ -21,7 +27,9 @@ class TestNotionClient:
             with patch.dict("os.environ", {"NOTION_API_KEY": "env-key"}):
                 client = NotionClient()
                 assert client.auth == "env-key"
-                mock_client.assert_called_once_with(auth="env-key")
+                mock_client.assert_called_once_with(
+                    auth="env-key", client=client._http, retry=False
+                )
     
     def test_init_no_auth_raises(self):
         """Test client initialization without auth raises error."""
@@ -29,6 +37,25 @@ class TestNotionClient:
             with pytest.raises(ValueError, match="No API key provided"):
                 NotionClient()
     
+    def test_init_does_not_probe_api(self):
+        """Test construction makes no request unless verify is requested."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            
+            NotionClient(auth="test-key")
+            mock_instance.search.assert_not_called()
+            
+            NotionClient(auth="test-key", verify=True)
+            mock_instance.search.assert_called_once_with(query="", page_size=1)
+    
+    def test_close_releases_connection_pool(self):
+        """Test the client closes its shared HTTP pool on exit."""
+        with patch("notion_cli.client.Client"):
+            with NotionClient(auth="test-key") as client:
+                assert not client._http.is_closed
+            
+            assert client._http.is_closed
+    
     def test_search(self):
         """Test search method."""
         with patch("notion_cli.client.Client") as mock_client:
@@ -51,12 +78,8 @@ class TestNotionClient:
         """Test search with pagination."""
         with patch("notion_cli.client.Client") as mock_client:
             mock_instance = mock_client.return_value
-            
-            # Mock _test_connection search call first
             mock_instance.search.side_effect = [
-                # First call is from _test_connection
-                {"results": [], "has_more": False},
-                # Then the actual search calls with pagination
+                # First page
                 {
                     "results": [{"id": "1"}, {"id": "2"}],
                     "has_more": True,
@@ -76,6 +99,41 @@ class TestNotionClient:
             assert results[0]["id"] == "1"
             assert results[2]["id"] == "3"
     
+    def test_isearch_is_lazy(self):
+        """Test isearch only requests the next page when it is needed."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.search.side_effect = [
+                {"results": [{"id": "1"}], "has_more": True, "next_cursor": "cursor1"},
+                {"results": [{"id": "2"}], "has_more": False}
+            ]
+            
+            client = NotionClient(auth="test-key")
+            results = client.isearch(query="test")
+            assert mock_instance.search.call_count == 0
+            
+            assert next(results)["id"] == "1"
+            assert mock_instance.search.call_count == 1
+            
+            assert [r["id"] for r in results] == ["2"]
+            mock_instance.search.assert_called_with(
+                query="test",
+                page_size=100,
+                start_cursor="cursor1"
+            )
+    
+    def test_search_max_items(self):
+        """Test search stops requesting pages once max_items results are in."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.search.return_value = {
+                "results": [{"id": "1"}, {"id": "2"}], "has_more": True, "next_cursor": "cursor1"
+            }
+            
+            client = NotionClient(auth="test-key")
+            assert [r["id"] for r in client.search(query="test", max_items=2)] == ["1", "2"]
+            mock_instance.search.assert_called_once_with(query="test", page_size=2)
+    
     def test_get_page(self):
         """Test get_page method."""
         with patch("notion_cli.client.Client") as mock_client:
@@ -88,6 +146,48 @@ class TestNotionClient:
             assert page["id"] == "page-123"
             mock_instance.pages.retrieve.assert_called_with(page_id="page-123")
     
+    def test_get_page_is_cached_until_updated(self):
+        """Test get_page reuses cached pages until the page is modified."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.pages.retrieve.return_value = {
+                "id": "page-123",
+                "last_edited_time": "2024-01-01T00:00:00.000Z"
+            }
+            
+            client = NotionClient(auth="test-key")
+            client.get_page("page-123")
+            client.get_page("page-123", last_edited_time="2024-01-01T00:00:00.000Z")
+            assert mock_instance.pages.retrieve.call_count == 1
+            
+            # A newer edit time on the caller's side forces a refetch
+            client.get_page("page-123", last_edited_time="2024-02-01T00:00:00.000Z")
+            assert mock_instance.pages.retrieve.call_count == 2
+            
+            client.update_page("page-123", archived=True)
+            client.get_page("page-123")
+            assert mock_instance.pages.retrieve.call_count == 3
+    
+    def test_database_cache_seeded_by_list_and_expires(self):
+        """Test listed databases are served from cache until CACHE_TTL passes."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.search.return_value = {
+                "results": [{"object": "database", "id": "db-1", "properties": {}}],
+                "has_more": False
+            }
+            mock_instance.databases.retrieve.return_value = {"object": "database", "id": "db-1"}
+            
+            client = NotionClient(auth="test-key")
+            client.list_databases()
+            assert client.get_database("db-1")["properties"] == {}
+            mock_instance.databases.retrieve.assert_not_called()
+            
+            expired = time.monotonic() + CACHE_TTL
+            with patch("notion_cli.client.time.monotonic", return_value=expired):
+                client.get_database("db-1")
+            assert mock_instance.databases.retrieve.call_count == 1
+    
     def test_create_page_with_string_parent(self):
         """Test create_page with string parent ID."""
         with patch("notion_cli.client.Client") as mock_client:
@@ -106,6 +206,18 @@ class TestNotionClient:
                 parent={"database_id": "897e5a76ae524b489fdfe71f5945d1af"},
                 properties={"title": {"title": [{"text": {"content": "Test"}}]}}
             )
+            
+            # Dashed UUIDs are treated as pages unless told otherwise
+            page_id = "897e5a76-ae52-4b48-9fdf-e71f5945d1af"
+            client.create_page(parent=page_id, properties={})
+            mock_instance.pages.create.assert_called_with(
+                parent={"page_id": page_id}, properties={}
+            )
+            
+            client.create_page(parent=page_id, properties={}, parent_type="database")
+            mock_instance.pages.create.assert_called_with(
+                parent={"database_id": page_id}, properties={}
+            )
     
     def test_query_database(self):
         """Test query_database method."""
@@ -127,4 +239,324 @@ class TestNotionClient:
                 database_id="db-123",
                 page_size=100,
                 filter={"property": "Status", "select": {"equals": "Done"}}
-            )
\ No newline at end of file
+            )
+    
+    def test_query_database_disk_cache(self, tmp_path, monkeypatch):
+        """Test cached query responses are reused across clients within the TTL."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.databases.query.return_value = {
+                "results": [{"id": "1"}],
+                "has_more": False
+            }
+            
+            for _ in range(2):
+                with NotionClient(auth="test-key") as client:
+                    assert client.query_database("db-123", cache_ttl=60) == [{"id": "1"}]
+            assert mock_instance.databases.query.call_count == 1
+            
+            with NotionClient(auth="test-key") as client:
+                client.query_database("db-123")
+                client.query_database("db-123", filter={"property": "Done"}, cache_ttl=60)
+            assert mock_instance.databases.query.call_count == 3
+        
+        assert (tmp_path / "notion-cli" / "responses.sqlite").exists()
+    
+    def test_get_database_disk_cache(self, tmp_path, monkeypatch):
+        """Test a database schema is shared across clients through the disk cache."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.databases.retrieve.return_value = {"id": "db-123", "properties": {}}
+            
+            for _ in range(2):
+                with NotionClient(auth="test-key") as client:
+                    assert client.get_database("db-123", cache_ttl=60)["id"] == "db-123"
+            assert mock_instance.databases.retrieve.call_count == 1
+            
+            with NotionClient(auth="test-key") as client:
+                client.get_database("db-123")
+            assert mock_instance.databases.retrieve.call_count == 2
+    
+    def test_iquery_database_prefetch(self, tmp_path, monkeypatch):
+        """Test prefetched pagination yields every result in order, through the disk cache too."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.databases.query.side_effect = lambda **params: {
+                "results": [{"id": params.get("start_cursor", "0")}],
+                "has_more": params.get("start_cursor") != "2",
+                "next_cursor": str(int(params.get("start_cursor", "0")) + 1)
+            }
+            
+            with NotionClient(auth="test-key") as client:
+                for cache_ttl in (0, 60):
+                    results = client.iquery_database("db-123", cache_ttl=cache_ttl, prefetch=True)
+                    assert [page["id"] for page in results] == ["0", "1", "2"]
+    
+    def test_aupdate_page(self):
+        """Test aupdate_page goes through the async client."""
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.pages.update = AsyncMock(return_value={"id": "page-123"})
+            mock_async.aclose = AsyncMock()
+            
+            client = NotionClient(auth="test-key")
+            
+            async def run():
+                try:
+                    return await client.aupdate_page("page-123", archived=True)
+                finally:
+                    await client.aclose()
+            
+            page = asyncio.run(run())
+            
+            assert page["id"] == "page-123"
+            mock_async_client.assert_called_once()
+            assert mock_async_client.call_args.kwargs["auth"] == "test-key"
+            mock_async.pages.update.assert_awaited_once_with(
+                page_id="page-123",
+                archived=True
+            )
+            mock_async.aclose.assert_awaited_once()
+    
+    def test_asearch_with_pagination(self):
+        """Test asearch follows cursors like search."""
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.search = AsyncMock(side_effect=[
+                {"results": [{"id": "1"}], "has_more": True, "next_cursor": "cursor1"},
+                {"results": [{"id": "2"}], "has_more": False}
+            ])
+            
+            client = NotionClient(auth="test-key")
+            results = asyncio.run(client.asearch(query="test"))
+            
+            assert [r["id"] for r in results] == ["1", "2"]
+            assert mock_async.search.await_count == 2
+    
+    def test_aupdate_pages_retries_rate_limited(self):
+        """Test aupdate_pages waits for Retry-After and keeps per-page results."""
+        rate_limited = APIResponseError(
+            code="rate_limited",
+            status=429,
+            message="Rate limited",
+            headers=httpx.Headers({"Retry-After": "0"}),
+            raw_body_text=""
+        )
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.pages.update = AsyncMock(side_effect=[
+                rate_limited,
+                {"id": "1"},
+                ValueError("boom")
+            ])
+            
+            client = NotionClient(auth="test-key")
+            results = asyncio.run(client.aupdate_pages(
+                [("1", {"Name": {}}), ("2", {"Name": {}})],
+                concurrency=1
+            ))
+            
+            assert results[0] == {"id": "1"}
+            assert isinstance(results[1], ValueError)
+            assert mock_async.pages.update.await_count == 3
+    
+    def test_create_page_is_not_retried_on_server_error(self):
+        """Test a create that fails with a 5xx is not repeated, but an update is."""
+        server_error = APIResponseError(
+            code="internal_server_error",
+            status=500,
+            message="Internal error",
+            headers=httpx.Headers({"Retry-After": "0"}),
+            raw_body_text=""
+        )
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.pages.create.side_effect = server_error
+            mock_instance.pages.update.side_effect = [server_error, {"id": "page-123"}]
+            
+            client = NotionClient(auth="test-key")
+            with pytest.raises(APIResponseError):
+                client.create_page("db-123", {"Name": {}})
+            assert mock_instance.pages.create.call_count == 1
+            
+            assert client.update_page("page-123", archived=True) == {"id": "page-123"}
+            assert mock_instance.pages.update.call_count == 2
+    
+    def test_rate_limited_request_is_retried_once_per_attempt(self):
+        """Test a 429 is retried only by NotionClient, over a real transport."""
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                429,
+                headers={"Retry-After": "0"},
+                json={"object": "error", "status": 429, "code": "rate_limited", "message": "Slow"}
+            )
+        
+        client = NotionClient(auth="test-key")
+        client.client.client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch.object(client._bucket, "acquire") as acquire:
+            with pytest.raises(APIResponseError):
+                client.update_page("page-123", archived=True)
+        
+        assert len(requests) == MAX_ATTEMPTS
+        assert {request.method for request in requests} == {"PATCH"}
+        assert acquire.call_count == MAX_ATTEMPTS
+    
+    def test_sdk_client_decodes_responses(self):
+        """Test the wrapped SDK client decodes success bodies and raises on errors."""
+        client = NotionClient(auth="test-key")
+        request = httpx.Request("GET", "https://api.notion.com/v1/pages/1")
+        
+        ok = httpx.Response(200, content=b'{"id": "1"}', request=request)
+        assert client.client._parse_response(ok) == {"id": "1"}
+        
+        not_found = httpx.Response(
+            404,
+            json={"object": "error", "code": "object_not_found", "message": "Not found"},
+            request=request
+        )
+        with pytest.raises(APIResponseError):
+            client.client._parse_response(not_found)
+    
+    def test_run_async_block_children(self):
+        """Test run_async drives an async call and closes the async pool."""
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            mock_async.blocks.children.list = AsyncMock(side_effect=[
+                {"results": [{"id": "b1"}], "has_more": True, "next_cursor": "cursor1"},
+                {"results": [{"id": "b2"}], "has_more": False}
+            ])
+            mock_async.aclose = AsyncMock()
+            
+            client = NotionClient(auth="test-key")
+            blocks = client.run_async(lambda: client.aget_block_children("page-123"))
+            
+            assert [b["id"] for b in blocks] == ["b1", "b2"]
+            mock_async.blocks.children.list.assert_awaited_with(
+                block_id="page-123",
+                page_size=100,
+                start_cursor="cursor1"
+            )
+            mock_async.aclose.assert_awaited_once()
+    
+    def test_aappend_blocks_splits_large_batches(self):
+        """Test more than 100 children are appended in ordered batches."""
+        with patch("notion_cli.client.Client"), \
+                patch("notion_cli.client.AsyncClient") as mock_async_client:
+            mock_async = mock_async_client.return_value
+            
+            async def append(block_id, children):
+                return {"object": "list", "results": children}
+            
+            mock_async.blocks.children.append = AsyncMock(side_effect=append)
+            
+            client = NotionClient(auth="test-key")
+            children = [{"id": str(i)} for i in range(150)]
+            result = asyncio.run(client.aappend_blocks("page-123", children))
+            
+            assert result["results"] == children
+            calls = mock_async.blocks.children.append.await_args_list
+            assert [len(c.kwargs["children"]) for c in calls] == [100, 50]
+    
+    def test_append_blocks_splits_large_batches(self):
+        """Test the sync client also appends more than 100 children in ordered batches."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_append = mock_client.return_value.blocks.children.append
+            mock_append.side_effect = lambda block_id, children: {
+                "object": "list", "results": children
+            }
+            
+            client = NotionClient(auth="test-key")
+            children = [{"id": str(i)} for i in range(150)]
+            result = client.append_blocks("page-123", children)
+            
+            assert result["results"] == children
+            assert [len(c.kwargs["children"]) for c in mock_append.call_args_list] == [100, 50]
+    
+    def test_get_block_children_max_items(self):
+        """Test max_items shrinks page_size and stops paginating early."""
+        with patch("notion_cli.client.Client") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.blocks.children.list.side_effect = [
+                {"results": [{"id": "1"}, {"id": "2"}], "has_more": True, "next_cursor": "c1"},
+                {"results": [{"id": "3"}, {"id": "4"}], "has_more": True, "next_cursor": "c2"},
+            ]
+            
+            client = NotionClient(auth="test-key")
+            blocks = client.get_block_children("page-123", max_items=3)
+            
+            assert [b["id"] for b in blocks] == ["1", "2", "3"]
+            assert mock_instance.blocks.children.list.call_count == 2
+            mock_instance.blocks.children.list.assert_called_with(
+                block_id="page-123",
+                page_size=3,
+                start_cursor="c1"
+            )
+    
+    def test_iget_block_children_raw(self):
+        """Test raw children pages are passed through byte for byte."""
+        pages = [
+            b'{"object":"list","results":[{"id":"1"}],"has_more":true,"next_cursor":"c1"}',
+            b'{"object":"list","results":[{"id":"2"}],"has_more":false,"next_cursor":null}',
+        ]
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=pages[len(requests) - 1])
+        
+        client = NotionClient(auth="test-key")
+        client._http = httpx.Client(
+            transport=httpx.MockTransport(handler),
+            base_url="https://api.notion.com/v1/"
+        )
+        
+        assert list(client.iget_block_children_raw("page-123")) == pages
+        assert requests[0].url.path == "/v1/blocks/page-123/children"
+        assert requests[1].url.params["start_cursor"] == "c1"
+    
+    def test_iget_block_children_raw_retries_rate_limits(self):
+        """Test a rate limited raw children request is retried like other reads."""
+        page = b'{"object":"list","results":[],"next_cursor":null,"has_more":false}'
+        responses = [
+            httpx.Response(
+                429,
+                headers={"Retry-After": "0"},
+                json={"object": "error", "status": 429, "code": "rate_limited", "message": "Slow"}
+            ),
+            httpx.Response(200, content=page),
+        ]
+        
+        client = NotionClient(auth="test-key")
+        client._http = httpx.Client(
+            transport=httpx.MockTransport(lambda request: responses.pop(0)),
+            base_url="https://api.notion.com/v1/"
+        )
+        
+        assert list(client.iget_block_children_raw("page-123")) == [page]
+        assert responses == []
+    
+    def test_list_cursor_decodes_only_the_tail(self):
+        """Test the pagination cursor is read without decoding the results."""
+        body = (
+            b'{"object":"list","results":[{"id":"1"}, not json],'
+            b'"next_cursor":"c1","has_more":true,"type":"block","block":{}}'
+        )
+        assert _list_cursor(body) == {
+            "next_cursor": "c1", "has_more": True, "type": "block", "block": {}
+        }
+        
+        # "next_cursor" keys inside results do not confuse the lookup
+        body = b'{"results":[{"next_cursor":"x"}],"has_more":false,"next_cursor":null}'
+        assert _list_cursor(body) == {
+            "results": [{"next_cursor": "x"}], "has_more": False, "next_cursor": None
+        }
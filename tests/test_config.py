@@ -74,4 +74,17 @@ class TestConfig:
             config = Config(config_path)
             
             assert config.get("nonexistent") is None
-            assert config.get("nonexistent", "default") == "default"
\ No newline at end of file
+            assert config.get("nonexistent", "default") == "default"
+    
+    def test_loads_lazily(self):
+        """Test the config file is not read until a value is needed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            
+            with patch.object(Config, "_load_config", return_value={"page_size": 10}) as load:
+                config = Config(config_path)
+                load.assert_not_called()
+                
+                assert config.page_size == 10
+                assert config.get("output_format") is None
+                load.assert_called_once()
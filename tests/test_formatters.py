@@ -2,10 +2,12 @@
 
 import pytest
 import json
+import subprocess
+import sys
 import yaml
 from notion_cli.formatters import (
     JSONFormatter, YAMLFormatter, TableFormatter,
-    TextFormatter, get_formatter
+    TextFormatter, NotionDataFormatter, get_formatter, MAX_TABLE_ROWS
 )
 
 
@@ -27,6 +29,14 @@ class TestJSONFormatter:
         result = formatter.format(data)
         
         assert json.loads(result) == data
+    
+    def test_format_non_json_values(self):
+        """Test non-ASCII text is kept and unknown types are stringified."""
+        formatter = JSONFormatter(color=False)
+        result = formatter.format({"title": "Café", "value": frozenset()})
+        
+        assert "Café" in result
+        assert json.loads(result) == {"title": "Café", "value": "frozenset()"}
 
 
 class TestYAMLFormatter:
@@ -76,6 +86,16 @@ class TestTableFormatter:
         assert "Item 1" in result
         assert "Done" in result
     
+    def test_format_long_list_of_dicts(self):
+        """Test listings over MAX_TABLE_ROWS are written as plain rows."""
+        formatter = TableFormatter(color=True)
+        data = [{"id": str(i), "done": False} for i in range(MAX_TABLE_ROWS + 1)]
+        
+        result = formatter.format(data)
+        
+        assert isinstance(result, str)
+        assert result.splitlines()[:2] == ["id\tdone", "0\t✗"]
+    
     def test_format_empty_list(self):
         """Test formatting an empty list."""
         formatter = TableFormatter(color=False)
@@ -107,6 +127,92 @@ class TestTextFormatter:
         assert "2. item2" in result
 
 
+class TestNotionDataFormatter:
+    """Test NotionDataFormatter."""
+    
+    def test_search_result_titles_across_schemas(self):
+        """Test titles are found when the title property's name changes between pages."""
+        def page(name, title):
+            return {
+                "object": "page",
+                "id": title,
+                "properties": {
+                    "Status": {"type": "select", "select": None},
+                    name: {"type": "title", "title": [{"plain_text": title}]},
+                },
+            }
+        
+        formatter = NotionDataFormatter(TextFormatter(color=False))
+        results = [
+            page("Name", "A"),
+            page("Name", "B"),
+            page("Task", "C"),
+            {"object": "page", "id": "D", "properties": {}},
+        ]
+        
+        output = formatter.format_search_results(results)
+        
+        titles = [
+            line.split(": ", 1)[1] for line in output.splitlines() if line.startswith("title:")
+        ]
+        assert titles == ["A", "B", "C", "Untitled"]
+    
+    def test_simplify_properties(self):
+        """Test page properties are reduced to readable values by type."""
+        formatter = NotionDataFormatter(JSONFormatter(color=False))
+        properties = {
+            "Name": {"type": "title", "title": [{"plain_text": "Task"}]},
+            "Status": {"type": "select", "select": None},
+            "Tags": {"type": "multi_select", "multi_select": [{"name": "a"}, {"name": "b"}]},
+            "Due": {"type": "date", "date": {"start": "2024-01-01"}},
+            "Owner": {"type": "people", "people": [{"id": "u1"}]},
+            "Formula": {"type": "formula", "formula": {"number": 1}},
+        }
+        
+        assert formatter._simplify_properties(properties) == {
+            "Name": "Task",
+            "Status": None,
+            "Tags": ["a", "b"],
+            "Due": "2024-01-01",
+            "Owner": ["u1"],
+            "Formula": properties["Formula"],
+        }
+    
+    def test_block_content(self):
+        """Test block content comes from text, captions or file URLs by type."""
+        formatter = NotionDataFormatter(JSONFormatter(color=False))
+        blocks = [
+            {"type": "paragraph", "paragraph": {"rich_text": [{"plain_text": "Hi"}]}},
+            {
+                "type": "image",
+                "image": {"type": "external", "external": {"url": "https://x/a.png"}}
+            },
+            {"type": "code", "code": {"language": "python"}},
+            {"type": "divider", "divider": {}},
+        ]
+        
+        assert [formatter._extract_block_content(b) for b in blocks] == [
+            "Hi", "https://x/a.png", "[python] ", "[divider block]"
+        ]
+    
+    def test_simplify_database_properties(self):
+        """Test schema properties keep select options and relation targets."""
+        formatter = NotionDataFormatter(JSONFormatter(color=False))
+        properties = {
+            "Tags": {
+                "id": "t", "type": "multi_select", "multi_select": {"options": [{"name": "a"}]}
+            },
+            "Link": {"id": "l", "type": "relation", "relation": {"database_id": "db"}},
+            "Done": {"id": "d", "type": "checkbox", "checkbox": {}},
+        }
+        
+        assert formatter._simplify_database_properties(properties) == {
+            "Tags": {"type": "multi_select", "id": "t", "options": ["a"]},
+            "Link": {"type": "relation", "id": "l", "database_id": "db"},
+            "Done": {"type": "checkbox", "id": "d"},
+        }
+
+
 def test_get_formatter():
     """Test get_formatter function."""
     json_formatter = get_formatter("json", color=False)
@@ -123,4 +229,23 @@ def test_get_formatter():
     
     # Test default
     default_formatter = get_formatter("unknown", color=False)
-    assert isinstance(default_formatter, JSONFormatter)
\ No newline at end of file
+    assert isinstance(default_formatter, JSONFormatter)
+    
+    # Instances are shared per type and color setting
+    assert get_formatter("json", color=False) is json_formatter
+    assert get_formatter("json", color=True) is not json_formatter
+
+
+def test_plain_output_does_not_load_rich():
+    """Test formatting without color never imports rich."""
+    code = (
+        "import sys; from notion_cli.formatters import get_formatter; "
+        "[get_formatter(f, color=False).format([{'a': 1}]) "
+        "for f in ('json', 'yaml', 'table', 'text')]; "
+        "print('rich' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,53 @@
+"""Tests for interactive mode."""
+
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from prompt_toolkit.document import Document
+from notion_cli.interactive import NotionCompleter, interactive_mode
+
+
+def complete(text):
+    """Completion texts offered for the given input."""
+    return [c.text for c in NotionCompleter().get_completions(Document(text), None)]
+
+
+class TestNotionCompleter:
+    """Test NotionCompleter."""
+    
+    def test_completes_command_prefix(self):
+        """Test commands and subcommands are matched by prefix."""
+        assert complete("c") == ["clear", "config"]
+        assert complete("database c") == ["create", "create-page"]
+        assert complete("block x") == []
+    
+    def test_completes_unused_options(self):
+        """Test options already given are not offered again."""
+        assert complete("page get -") == ["--output"]
+        assert complete("search --limit 5 ") == ["--type", "--sort", "--output"]
+
+
+class TestInteractiveMode:
+    """Test the interactive command loop."""
+    
+    def test_usage_errors_do_not_end_session(self, tmp_path):
+        """Test a command's usage error is shown and the next command still runs."""
+        config = Mock(api_key="test-key")
+        config.get.return_value = False
+        session = Mock()
+        session.prompt.side_effect = [
+            "block append page-1",
+            "database query db-1 -f bad",
+            "exit",
+        ]
+        
+        with patch("notion_cli.interactive.PromptSession", return_value=session), \
+                patch("notion_cli.interactive.NotionClient") as mock_client, \
+                patch("notion_cli.interactive.Path.home", return_value=tmp_path):
+            mock_client.return_value.auth = "test-key"
+            result = CliRunner().invoke(interactive_mode, [], obj={"config": config})
+        
+        assert result.exit_code == 0
+        assert "No content specified" in result.output
+        assert "Invalid filter format: bad" in result.output
+        assert "Goodbye" in result.output
+        assert session.prompt.call_count == 3
@@ -0,0 +1,64 @@
+"""Tests for rate limiting and retry helpers."""
+
+import httpx
+from unittest.mock import patch
+from notion_client.errors import APIResponseError
+from notion_cli.ratelimit import MAX_RETRY_AFTER, TokenBucket, is_retryable, retry_delay
+
+
+def make_error(status, headers=None):
+    """Build an APIResponseError with the given status."""
+    return APIResponseError(
+        code="rate_limited" if status == 429 else "internal_server_error",
+        status=status,
+        message="error",
+        headers=httpx.Headers(headers or {}),
+        raw_body_text=""
+    )
+
+
+class TestTokenBucket:
+    """Test TokenBucket class."""
+    
+    def test_burst_then_throttle(self):
+        """Test the bucket allows a burst of capacity, then waits."""
+        bucket = TokenBucket(rate=3)
+        with patch("notion_cli.ratelimit.time.sleep") as mock_sleep:
+            for _ in range(3):
+                bucket.acquire()
+            mock_sleep.assert_not_called()
+            
+            bucket.acquire()
+            mock_sleep.assert_called_once()
+            assert 0 < mock_sleep.call_args[0][0] <= 1 / 3
+
+
+class TestRetry:
+    """Test retry helpers."""
+    
+    def test_is_retryable(self):
+        """Test only rate limits and server errors are retried."""
+        assert is_retryable(make_error(429))
+        assert is_retryable(make_error(502))
+        assert not is_retryable(make_error(400))
+        assert not is_retryable(ValueError("boom"))
+    
+    def test_non_idempotent_requests_skip_server_errors(self):
+        """Test creates are retried on 429 and failed connections but not 5xx."""
+        assert is_retryable(make_error(429), idempotent=False)
+        assert is_retryable(httpx.ConnectError("refused"), idempotent=False)
+        assert not is_retryable(make_error(502), idempotent=False)
+    
+    def test_retry_delay_prefers_retry_after(self):
+        """Test Retry-After overrides the backoff."""
+        assert retry_delay(make_error(429, {"Retry-After": "2"}), attempt=1) == 2.0
+    
+    def test_retry_delay_caps_retry_after(self):
+        """Test a very long Retry-After is capped."""
+        assert retry_delay(make_error(429, {"Retry-After": "3600"}), attempt=1) == MAX_RETRY_AFTER
+    
+    def test_retry_delay_backoff_is_capped(self):
+        """Test the jittered backoff grows with attempts and respects the cap."""
+        for attempt in range(1, 10):
+            delay = retry_delay(make_error(503), attempt, base=1.0, cap=30.0)
+            assert 0 <= delay <= min(30.0, 2 ** (attempt - 1))
@@ -0,0 +1,123 @@
+"""Tests for utility functions."""
+
+import click
+import os
+import pytest
+from unittest.mock import Mock, patch
+from notion_cli.utils import atomic_write, get_client, handle_error, page_title
+
+
+class TestPageTitle:
+    """Test page_title helper."""
+    
+    def test_page_title(self, test_page_data):
+        """Test extracting the title of a page."""
+        assert page_title(test_page_data) == "Test Page"
+    
+    def test_page_title_untitled(self):
+        """Test pages without a title fall back to the default."""
+        assert page_title({"properties": {}}) == "Untitled"
+        assert page_title({"properties": {"Name": {"type": "title", "title": []}}}) == "Untitled"
+        assert page_title({}, default="") == ""
+
+
+class TestAtomicWrite:
+    """Test atomic_write helper."""
+    
+    def test_replaces_file_and_keeps_mode(self, tmp_path):
+        """Test the new content replaces the file with its permissions unchanged."""
+        path = tmp_path / "out.txt"
+        path.write_text("old")
+        os.chmod(path, 0o640)
+        
+        with atomic_write(str(path)) as f:
+            f.write("new")
+        
+        assert path.read_text() == "new"
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert list(tmp_path.iterdir()) == [path]
+    
+    def test_error_leaves_file_untouched(self, tmp_path):
+        """Test a failed write removes the temporary file and keeps the old one."""
+        path = tmp_path / "out.txt"
+        path.write_text("old")
+        
+        with pytest.raises(ValueError):
+            with atomic_write(str(path)) as f:
+                f.write("partial")
+                raise ValueError("boom")
+        
+        assert path.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestGetClient:
+    """Test get_client helper."""
+    
+    def test_client_is_shared_through_context(self):
+        """Test one client is reused until the API key changes."""
+        config = Mock(api_key="key-1")
+        ctx = click.Context(click.Command("test"), obj={"config": config})
+        
+        with patch("notion_cli.client.Client"):
+            client = get_client(ctx)
+            assert get_client(ctx) is client
+            assert ctx.obj["client"] is client
+            
+            config.api_key = "key-2"
+            assert get_client(ctx) is not client
+            assert get_client(ctx).auth == "key-2"
+    
+    def test_rate_limiter_outlives_client(self):
+        """Test a replacement client keeps pacing with the same token bucket."""
+        config = Mock(api_key="key-1")
+        ctx = click.Context(click.Command("test"), obj={"config": config})
+        
+        with patch("notion_cli.client.Client"):
+            client = get_client(ctx)
+            config.api_key = "key-2"
+            replacement = get_client(ctx)
+        
+        assert replacement is not client
+        assert replacement._bucket is client._bucket is ctx.obj["rate_limiter"]
+    
+    def test_replaced_client_is_closed(self):
+        """Test the old client's connection pool is closed when the key changes."""
+        config = Mock(api_key="key-1")
+        ctx = click.Context(click.Command("test"), obj={"config": config})
+        
+        with patch("notion_cli.client.Client"):
+            client = get_client(ctx)
+            config.api_key = "key-2"
+            replacement = get_client(ctx)
+        
+        assert client._http.is_closed
+        assert not replacement._http.is_closed
+        replacement.close()
+
+
+class TestHandleError:
+    """Test handle_error helper."""
+    
+    def test_click_exceptions_are_reraised(self):
+        """Test click's control-flow exceptions are not reported as errors."""
+        for error in (click.UsageError("bad"), click.Abort(), click.exceptions.Exit(1)):
+            with pytest.raises(type(error)):
+                handle_error(error)
+    
+    def test_other_exceptions_exit(self):
+        """Test other errors are reported and exit with status 1."""
+        with pytest.raises(SystemExit) as exc_info:
+            handle_error(ValueError("boom"))
+        
+        assert exc_info.value.code == 1
+    
+    def test_debug_traceback_without_terminal(self, capsys):
+        """Test debug mode prints a plain traceback when stderr is not a terminal."""
+        try:
+            raise ValueError("boom")
+        except ValueError as error:
+            with pytest.raises(SystemExit):
+                handle_error(error, debug=True)
+        
+        assert "Traceback" in capsys.readouterr().err